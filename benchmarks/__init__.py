@@ -0,0 +1,4 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for proplot run with airspeed velocity (asv).
+"""
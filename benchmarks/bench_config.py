@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for importing proplot and registering and constructing colors.
+"""
+import proplot as pplt
+
+
+def timeraw_import():
+    # NOTE: The 'timeraw' benchmarks are run in a fresh interpreter.
+    return 'import proplot'
+
+
+def timeraw_import_skip_docstrings():
+    # NOTE: Compare with timeraw_import to get the docstring processing overhead.
+    return "import os; os.environ['PROPLOT_SKIP_DOCSTRINGS'] = '1'; import proplot"
+
+
+def timeraw_import_pyplot():
+    # NOTE: Compare with timeraw_import to get the proplot overhead.
+    return 'import matplotlib.pyplot'
+
+
+class Register:
+    """
+    Registering the default colormaps, cycles, colors, and fonts.
+    """
+    def time_register_cmaps(self):
+        pplt.register_cmaps(default=True)
+
+    def time_register_cycles(self):
+        pplt.register_cycles(default=True)
+
+    def time_register_colors(self):
+        pplt.register_colors(default=True)
+
+    def time_register_fonts(self):
+        pplt.register_fonts(default=True)
+
+
+class Constructor:
+    """
+    Constructing colormaps and color cycles.
+    """
+    # NOTE: Lists are interpreted as colors and tuples as colormaps to be merged.
+    params = ['Fire', ['blue', 'red'], ('Blues', 'Reds')]
+    param_names = ['cmap']
+
+    def setup(self, cmap):
+        self.args = cmap if isinstance(cmap, tuple) else (cmap,)
+
+    def time_colormap(self, cmap):
+        pplt.Colormap(*self.args)
+
+    def time_colormap_levels(self, cmap):
+        pplt.Colormap(*self.args, samples=10, left=0.1, right=0.9)
+
+    def time_cycle(self, cmap):
+        pplt.Cycle(*self.args, 10)
+
+    def time_get_colors(self, cmap):
+        pplt.get_colors(pplt.Cycle(*self.args, 10))
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for creating, formatting, laying out, and saving figures.
+"""
+import io
+
+import matplotlib
+import numpy as np
+
+import proplot as pplt
+
+matplotlib.use('agg')
+
+
+class Subplots:
+    """
+    Creating figures with many subplots.
+    """
+    params = [1, 16, 400]
+    param_names = ['naxes']
+
+    def teardown(self, naxes):
+        pplt.close('all')
+
+    def time_subplots(self, naxes):
+        pplt.subplots(ncols=int(np.sqrt(naxes)), nrows=int(np.sqrt(naxes)))
+
+    def peakmem_subplots(self, naxes):
+        pplt.subplots(ncols=int(np.sqrt(naxes)), nrows=int(np.sqrt(naxes)))
+
+
+class Format:
+    """
+    Formatting figures with many subplots.
+    """
+    params = [1, 16, 400]
+    param_names = ['naxes']
+
+    def setup(self, naxes):
+        self.n = n = int(np.sqrt(naxes))
+        self.fig, self.axs = pplt.subplots(ncols=n, nrows=n)
+
+    def teardown(self, naxes):
+        pplt.close('all')
+
+    def time_format_axes(self, naxes):
+        self.axs.format(xlim=(0, 1), ylim=(0, 1), xlabel='x', ylabel='y', abc=True)
+
+    def time_format_figure(self, naxes):
+        labels = ['label'] * self.n
+        self.fig.format(suptitle='title', leftlabels=labels, toplabels=labels)
+
+    def time_format_roundtrip(self, naxes):
+        self.axs.format(xlabel='x', title='title')
+        self.axs.format(xlabel='y', title='other')
+
+
+class Layout:
+    """
+    Auto layout and drawing for complex layouts with panels and colorbars.
+    """
+    params = [1, 16]
+    param_names = ['naxes']
+
+    def setup(self, naxes):
+        n = int(np.sqrt(naxes))
+        state = np.random.RandomState(51423)
+        self.fig, self.axs = pplt.subplots(ncols=n, nrows=n, share=False)
+        for ax in self.axs:
+            m = ax.pcolormesh(state.rand(20, 20), colorbar='r')
+            ax.panel('b').plot(state.rand(20))
+            ax.plot(state.rand(20, 3), legend='b')
+            ax.format(title='title', xlabel='x', ylabel='y')
+        self.fig.colorbar(m, loc='b', label='label')
+        self.fig.canvas.draw()
+
+    def teardown(self, naxes):
+        pplt.close('all')
+
+    def time_auto_layout(self, naxes):
+        self.fig.auto_layout()
+
+    def time_draw(self, naxes):
+        self.fig.canvas.draw()
+
+
+class Save:
+    """
+    Saving figures with different formats.
+    """
+    params = ['png', 'pdf', 'svg', 'eps']
+    param_names = ['format']
+
+    def setup(self, format):
+        state = np.random.RandomState(51423)
+        self.fig, self.axs = pplt.subplots(ncols=2, nrows=2)
+        self.axs[0].pcolormesh(state.rand(100, 100), colorbar='r')
+        self.axs[1].plot(state.rand(100, 5), legend='b')
+        self.axs[2].contourf(state.rand(100, 100), colorbar='b')
+        self.axs[3].scatter(*state.rand(2, 100))
+        self.fig.canvas.draw()
+
+    def teardown(self, format):
+        pplt.close('all')
+
+    def time_savefig(self, format):
+        self.fig.savefig(io.BytesIO(), format=format)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for parsing and drawing plots with large datasets.
+"""
+import matplotlib
+import numpy as np
+
+import proplot as pplt
+
+matplotlib.use('agg')
+
+
+class Plot1D:
+    """
+    One-dimensional plotting commands.
+    """
+    # NOTE: Sizes are capped at 10^6 elements so that the suite runs in a few
+    # minutes and fits in memory on typical machines.
+    params = [10 ** 4, 10 ** 5, 10 ** 6]
+    param_names = ['size']
+
+    def setup(self, size):
+        state = np.random.RandomState(51423)
+        self.x = np.arange(size)
+        self.y = state.rand(size)
+        self.fig, self.ax = pplt.subplot()
+
+    def teardown(self, size):
+        pplt.close('all')
+
+    def time_plot(self, size):
+        self.ax.plot(self.x, self.y)
+
+    def time_scatter(self, size):
+        self.ax.scatter(self.x, self.y)
+
+    def peakmem_plot(self, size):
+        self.ax.plot(self.x, self.y)
+
+
+class Plot2D:
+    """
+    Two-dimensional plotting commands.
+    """
+    params = [10 ** 4, 10 ** 5, 10 ** 6]
+    param_names = ['size']
+
+    def setup(self, size):
+        state = np.random.RandomState(51423)
+        n = int(np.sqrt(size))
+        self.z = state.rand(n, n)
+        self.fig, self.ax = pplt.subplot()
+
+    def teardown(self, size):
+        pplt.close('all')
+
+    def time_pcolormesh(self, size):
+        self.ax.pcolormesh(self.z)
+
+    def time_pcolormesh_discrete(self, size):
+        self.ax.pcolormesh(self.z, levels=20, colorbar='r')
+
+    def time_contourf(self, size):
+        self.ax.contourf(self.z)
+
+    def peakmem_pcolormesh(self, size):
+        self.ax.pcolormesh(self.z)
+
+
+class PlotGeo:
+    """
+    Geographic plotting commands and features.
+    """
+    params = ['cartopy', 'basemap']
+    param_names = ['backend']
+
+    def setup(self, backend):
+        # NOTE: Pass the backend to Proj() rather than subplot() since the latter
+        # currently translates backend='cartopy' into the deprecated basemap=True.
+        try:
+            proj = pplt.Proj('robin', backend=backend)
+        except ImportError:
+            raise NotImplementedError  # skip this benchmark
+        self.fig, self.ax = pplt.subplot(proj=proj)
+        state = np.random.RandomState(51423)
+        self.lon = np.linspace(-180, 180, 361)
+        self.lat = np.linspace(-90, 90, 181)
+        self.z = state.rand(181, 361)
+
+    def teardown(self, backend):
+        pplt.close('all')
+
+    def time_pcolormesh(self, backend):
+        self.ax.pcolormesh(self.lon, self.lat, self.z)
+
+    def time_features(self, backend):
+        self.ax.format(land=True, ocean=True, coast=True, borders=True)
+        self.fig.canvas.draw()
+
+    def time_gridlines(self, backend):
+        self.ax.format(lonlines=30, latlines=30, labels=True)
+        self.fig.canvas.draw()
@@ -10,26 +10,13 @@ try:
 except pkg.DistributionNotFound:
     version = __version__ = 'unknown'
 
-# Import optional dependencies now to isolate import times
-from .internals.benchmarks import _benchmark
-with _benchmark('pyplot'):
-    from matplotlib import pyplot  # noqa: F401
-with _benchmark('cartopy'):
-    try:
-        import cartopy  # noqa: F401
-    except ImportError:
-        pass
-with _benchmark('basemap'):
-    try:
-        from mpl_toolkits import basemap  # noqa: F401
-    except ImportError:
-        pass
-
 # Import everything to top level
+# NOTE: Pyplot, cartopy, and basemap are imported on first use (e.g. when creating
+# figures or requesting geographic projections). Cartopy classes are then added
+# to the top-level namespace by __getattr__ below.
+from .internals.benchmarks import _benchmark
 with _benchmark('config'):
     from .config import *  # noqa: F401 F403
-with _benchmark('proj'):
-    from .proj import *  # noqa: F401 F403
 with _benchmark('utils'):
     from .utils import *  # noqa: F401 F403
 with _benchmark('colors'):
@@ -52,16 +39,56 @@ with _benchmark('demos'):
     from .demos import *  # noqa: F401 F403
 
 # Dynamically add registered classes to top-level namespace
-from . import proj as crs  # backwards compatibility  # noqa: F401
-from .constructor import NORMS, LOCATORS, FORMATTERS, SCALES, PROJS
+from .constructor import NORMS, LOCATORS, FORMATTERS, SCALES
 _globals = globals()
-for _src in (NORMS, LOCATORS, FORMATTERS, SCALES, PROJS):
+for _src in (NORMS, LOCATORS, FORMATTERS, SCALES):
     for _key, _cls in _src.items():
         if isinstance(_cls, type):  # i.e. not a scale preset
             _globals[_cls.__name__] = _cls  # may overwrite proplot names
 
+
+# Add cartopy projection classes to top-level namespace on first access
+# NOTE: This imports cartopy when e.g. pplt.crs or pplt.PlateCarree is requested.
+# Module-level __getattr__ is unavailable in python < 3.7 so load cartopy now.
+def _add_cartopy():
+    from . import constructor, proj
+    constructor._load_cartopy()
+    _globals['crs'] = proj  # backwards compatibility
+    for name in proj.__all__:
+        _globals[name] = getattr(proj, name)
+    for cls in constructor.PROJS.values():
+        _globals[cls.__name__] = cls
+
+
+def __getattr__(attr):
+    # NOTE: Only known projection names trigger the import so that introspection
+    # tools probing for missing attributes do not import cartopy. The proplot
+    # projection names are also listed in proj.__all__ (importing it loads cartopy).
+    # Available projections are moved from PROJS_MISSING to PROJS when loaded.
+    import importlib.util
+    from .constructor import PROJS, PROJS_MISSING, PROJS_PROPLOT
+    names = {
+        'crs', *PROJS_PROPLOT.values(), *PROJS_MISSING.values(),
+        *(cls.__name__ for cls in PROJS.values()),
+    }
+    if attr in names:
+        if 'crs' not in _globals and importlib.util.find_spec('cartopy'):
+            _add_cartopy()
+        if attr in _globals:
+            return _globals[attr]
+    raise AttributeError(f'module {__name__!r} has no attribute {attr!r}')
+
+
+import sys as _sys
+if _sys.version_info < (3, 7):
+    try:
+        _add_cartopy()
+    except ImportError:
+        pass
+
 # Register objects
 from .config import register_cmaps, register_cycles, register_colors, register_fonts
+from .config import _skip_fonts
 with _benchmark('cmaps'):
     register_cmaps(default=True)
 with _benchmark('cycles'):
@@ -69,14 +96,18 @@ with _benchmark('cycles'):
 with _benchmark('colors'):
     register_colors(default=True)
 with _benchmark('fonts'):
-    register_fonts(default=True)
+    if not _skip_fonts:  # see PROPLOT_SKIP_FONTS
+        register_fonts(default=True)
 
 # Validate colormap names and propagate 'cycle' to 'axes.prop_cycle'
 # NOTE: cmap.sequential also updates siblings 'cmap' and 'image.cmap'
+# NOTE: Validation is skipped if the settings were restored from a snapshot saved
+# after validating the settings in a previous session (see Configurator._init).
 from .config import rc
 from .internals import rcsetup, warnings
 rcsetup.VALIDATE_REGISTERED_CMAPS = True
-for _key in ('cycle', 'cmap.sequential', 'cmap.diverging', 'cmap.cyclic', 'cmap.qualitative'):  # noqa: E501
+_keys = ('cycle', 'cmap.sequential', 'cmap.diverging', 'cmap.cyclic', 'cmap.qualitative')  # noqa: E501
+for _key in () if rc._snapshot else _keys:
     try:
         rc[_key] = rc[_key]
     except ValueError as err:
@@ -87,7 +118,7 @@ for _key in ('cycle', 'cmap.sequential', 'cmap.diverging', 'cmap.cyclic', 'cmap.
 # NOTE: This updates all settings with 'color' in name (harmless if it's not a color)
 from .config import rc_proplot, rc_matplotlib
 rcsetup.VALIDATE_REGISTERED_COLORS = True
-for _src in (rc_proplot, rc_matplotlib):
+for _src in () if rc._snapshot else (rc_proplot, rc_matplotlib):
     for _key in _src:  # loop through unsynced properties
         if 'color' not in _key:
             continue
@@ -96,3 +127,7 @@ for _src in (rc_proplot, rc_matplotlib):
         except ValueError as err:
             warnings._warn_proplot(f'Invalid user rc file setting: {err}')
             _src[_key] = 'black'  # fill value
+
+# Save the validated settings for the next session
+if not rc._snapshot:
+    rc._save_snapshot()
@@ -7,11 +7,13 @@ import copy
 import inspect
 import itertools
 import re
+import time
 from numbers import Integral
 
 import matplotlib.axes as maxes
 import matplotlib.axis as maxis
 import matplotlib.cm as mcm
+import matplotlib.collections as mcollections
 import matplotlib.colors as mcolors
 import matplotlib.container as mcontainer
 import matplotlib.contour as mcontour
@@ -47,11 +49,6 @@ from ..internals import (
 )
 from ..utils import _fontsize_to_pt, edges, units
 
-try:
-    from cartopy.crs import CRS, PlateCarree
-except Exception:
-    CRS = PlateCarree = object
-
 __all__ = ['Axes']
 
 
@@ -89,6 +86,13 @@ ALIGN_OPTS = {
     },
 }
 
+# Best legend and inset colorbar location settings
+# NOTE: Matplotlib tests each candidate box against every vertex of every artist.
+# Here we instead rasterize artists onto a coarse grid with a time budget.
+BEST_GRID = 50  # number of occupancy grid cells along each axes dimension
+BEST_MAXPTS = 20000  # maximum number of vertices sampled from each artist
+BEST_TIMEOUT = 0.1  # maximum time in seconds spent rasterizing artists
+
 
 # Projection docstring
 _proj_docstring = """
@@ -607,6 +611,9 @@ center : bool, optional
 alphabetize : bool, default: False
     Whether to alphabetize the legend entries according to
     the legend labels.
+unique : bool, default: False
+    Whether to drop legend entries with duplicate labels. This is useful for
+    figure-wide or panel-wide legends of subplots that plot the same variables.
 title, label : str, optional
     The legend title. The `label` keyword is also accepted, for consistency
     with `~matplotlib.figure.Figure.colorbar`.
@@ -764,6 +771,7 @@ class Axes(maxes.Axes):
 
         # Varous scalar properties
         self._active_cycle = rc['axes.prop_cycle']
+        self._cycle_cache = None  # see PlotAxes._parse_cycle()
         self._auto_format = None  # manipulated by wrapper functions
         self._abc_border_kwargs = {}
         self._abc_loc = None
@@ -795,6 +803,7 @@ class Axes(maxes.Axes):
         # NOTE: Critical to use self.text() so they are patched with _update_label
         self._legend_dict = {}
         self._colorbar_dict = {}
+        self._best_cache = None  # see _get_best_index()
         d = self._panel_dict = {}
         d['left'] = []  # NOTE: panels will be sorted inside-to-outside
         d['right'] = []
@@ -959,6 +968,7 @@ class Axes(maxes.Axes):
         ax.patch.set_facecolor('none')
         ax._panel_hidden = True
         ax._panel_align[align] = bbox
+        self.figure._range_cache.clear()  # see Figure._get_subplot_ranges()
         return ax
 
     @warnings._rename_kwargs('0.10', rasterize='rasterized')
@@ -983,8 +993,7 @@ class Axes(maxes.Axes):
         The driver function for adding axes colorbars.
         """
         # Parse input arguments and apply defaults
-        # TODO: Get the 'best' inset colorbar location using the legend algorithm
-        # and implement inset colorbars the same as inset legends.
+        # TODO: Implement inset colorbars the same as inset legends.
         grid = _not_none(grid=grid, edges=edges, drawedges=drawedges, default=rc['colorbar.grid'])  # noqa: E501
         length = _not_none(length=length, shrink=shrink)
         label = _not_none(title=title, label=label)
@@ -1053,6 +1062,17 @@ class Axes(maxes.Axes):
         # Parse the colorbar mappable
         # NOTE: Account for special case where auto colorbar is generated from 1D
         # methods that construct an 'artist list' (i.e. colormap scatter object)
+        # NOTE: Line collections drawn with plot(..., collection=True) are scalar
+        # mappables but store proxy handles for each column. Use these instead.
+        if getattr(mappable, '_legend_handles', None):
+            mappable = mappable._legend_handles
+        elif np.iterable(mappable) and not isinstance(mappable, str) and any(
+            getattr(obj, '_legend_handles', None) for obj in mappable
+        ):
+            mappable = [
+                handle for obj in mappable
+                for handle in getattr(obj, '_legend_handles', None) or (obj,)
+            ]
         if np.iterable(mappable) and len(mappable) == 1 and isinstance(mappable[0], mcm.ScalarMappable):  # noqa: E501
             mappable = mappable[0]
         if isinstance(mappable, mcm.ScalarMappable):
@@ -1187,7 +1207,8 @@ class Axes(maxes.Axes):
         self, handles=None, labels=None, *,
         loc=None, align=None, width=None, pad=None, space=None,
         frame=None, frameon=None, ncol=None, ncols=None,
-        alphabetize=False, center=None, order=None, label=None, title=None,
+        alphabetize=False, unique=False, center=None, order=None,
+        label=None, title=None,
         fontsize=None, fontweight=None, fontcolor=None,
         titlefontsize=None, titlefontweight=None, titlefontcolor=None,
         handle_kw=None, handler_map=None, **kwargs
@@ -1263,7 +1284,7 @@ class Axes(maxes.Axes):
         # TODO: Update this when we no longer use "filled panels" for outer legends
         pairs, multi = lax._parse_legend_handles(
             handles, labels, ncol=ncol, order=order, center=center,
-            alphabetize=alphabetize, handler_map=handler_map
+            alphabetize=alphabetize, unique=unique, handler_map=handler_map
         )
         title = _not_none(label=label, title=title)
         kwargs.update(
@@ -1291,6 +1312,12 @@ class Axes(maxes.Axes):
             else:
                 lax.add_artist(obj)
 
+        # Use the fast approximate 'best' location algorithm
+        # NOTE: The matplotlib method is called with the legend size when drawing.
+        for obj in objs:
+            if isinstance(obj, mlegend.Legend) and getattr(obj, '_loc', None) == 0:
+                obj._find_best_position = self._get_legend_best_position(obj)
+
         # Update legend patch and elements
         # WARNING: legendHandles only contains the *first* artist per legend because
         # HandlerBase.legend_artist() called in Legend._init_legend_box() only
@@ -1315,6 +1342,147 @@ class Axes(maxes.Axes):
 
         return obj
 
+    def _get_best_occupancy(self):
+        """
+        Return a coarse grid of vertex counts in display coordinates for the data
+        artists in the axes. The grid is cached until the axes position, axes view
+        limits, or artist data are changed.
+        """
+        # Return the cached grid
+        # NOTE: Line2D and Collection setters assign new path and offset arrays
+        # rather than modifying them in-place, so their ids are cheap cache keys.
+        # NOTE: Skip QuadMesh objects because these cover the entire data region
+        # and generating their paths is extremely slow for large arrays.
+        artists = [
+            artist for artist in (*self.lines, *self.collections)
+            if artist.get_visible() and not isinstance(artist, mcollections.QuadMesh)
+        ]
+        key = (
+            tuple(self.bbox.bounds),
+            tuple(self.viewLim.bounds),
+            tuple(
+                (
+                    id(artist),
+                    id(getattr(artist, '_path', None)),
+                    id(getattr(artist, '_paths', None)),
+                    id(getattr(artist, '_offsets', None)),
+                )
+                for artist in artists
+            )
+        )
+        if self._best_cache is not None and self._best_cache[0] == key:
+            return self._best_cache[1]
+
+        # Helper function to add vertices to the grid
+        # NOTE: Vertices are interpolated along each segment so that long
+        # lines crossing several cells still occupy each cell.
+        x0, y0, width, height = self.bbox.bounds
+        scale = (max(width, 1) / BEST_GRID, max(height, 1) / BEST_GRID)
+        grid = np.zeros((BEST_GRID, BEST_GRID))
+        def _add_vertices(xy, connect=True):  # noqa: E306
+            xy = (np.asarray(xy, dtype=float) - (x0, y0)) / scale
+            if connect and xy.shape[0] > 1:
+                delta = np.diff(xy, axis=0)
+                valid = np.all(np.isfinite(delta), axis=1)
+                xy0, delta = xy[:-1][valid], delta[valid]
+                num = np.ceil(np.abs(delta).max(axis=1, initial=0))
+                num = np.clip(num, 1, BEST_GRID).astype(int)
+                idx = np.repeat(np.arange(num.size), num)
+                frac = np.arange(idx.size) - np.repeat(np.cumsum(num) - num, num)
+                frac = frac / num[idx]
+                xy = np.concatenate((xy0[idx] + delta[idx] * frac[:, None], xy[-1:]))
+            xy = xy[np.all(np.isfinite(xy), axis=1)]
+            ij = np.floor(xy).astype(int)
+            mask = np.all((ij >= 0) & (ij < BEST_GRID), axis=1)
+            ij = ij[mask]
+            np.add.at(grid, (ij[:, 1], ij[:, 0]), 1)
+
+        # Rasterize the artist vertices with a time budget
+        # NOTE: Vertices are decimated by a constant stride for very large datasets.
+        t0 = time.perf_counter()
+        for artist in artists:
+            if time.perf_counter() - t0 > BEST_TIMEOUT:
+                break
+            if isinstance(artist, mcollections.Collection):
+                trans = getattr(artist, 'get_offset_transform', None)
+                trans = trans or getattr(artist, 'get_transOffset')  # matplotlib < 3.6
+                offsets = np.asarray(artist.get_offsets())
+                if offsets.size and np.any(offsets):  # scatter-style collection
+                    step = max(1, offsets.shape[0] // BEST_MAXPTS)
+                    _add_vertices(trans().transform(offsets[::step]), connect=False)
+                    continue
+                trans = artist.get_transform()
+                paths = artist.get_paths()
+            else:
+                trans = artist.get_transform()
+                paths = (artist.get_path(),)
+            count = sum(len(path.vertices) for path in paths)
+            step = max(1, count // BEST_MAXPTS)
+            for path in paths:
+                if len(path.vertices):
+                    _add_vertices(trans.transform(path.vertices[::step]))
+
+        self._best_cache = (key, grid)
+        return grid
+
+    def _get_best_index(self, boxes, renderer=None):
+        """
+        Return the index of the least-occupied candidate box. The boxes are
+        specified as ``(x0, y0, width, height)`` tuples in display coordinates.
+        Ties are resolved in favor of the box listed first.
+        """
+        # Get cumulative sums for fast sums within boxes
+        renderer = renderer or self.figure._get_renderer()
+        grid = self._get_best_occupancy()
+        grid = np.pad(grid.cumsum(axis=0).cumsum(axis=1), ((1, 0), (1, 0)))
+        x0, y0, width, height = self.bbox.bounds
+        scale = np.array((max(width, 1), max(height, 1))) / BEST_GRID
+
+        # Get bounding boxes of other artists
+        # NOTE: This mimics matplotlib's treatment of patches and text
+        bboxes = []
+        for artist in (*self.patches, *self.texts, *self.child_axes):
+            if not artist.get_visible():
+                continue
+            if isinstance(artist, mtext.Text) and not artist.get_text():
+                continue
+            if isinstance(artist, maxes.Axes):
+                bboxes.append(artist.bbox)
+            else:
+                bboxes.append(artist.get_window_extent(renderer))
+
+        # Find the least-occupied box
+        candidates = []
+        for idx, bounds in enumerate(boxes):
+            box = mtransforms.Bbox.from_bounds(*bounds)
+            i0, j0 = np.floor((box.x0 - x0, box.y0 - y0) / scale)
+            i1, j1 = np.ceil((box.x1 - x0, box.y1 - y0) / scale)
+            i0, i1 = np.clip((i0, i1), 0, BEST_GRID).astype(int)
+            j0, j1 = np.clip((j0, j1), 0, BEST_GRID).astype(int)
+            badness = grid[j1, i1] - grid[j0, i1] - grid[j1, i0] + grid[j0, i0]
+            badness += box.count_overlaps(bboxes)
+            if badness == 0:
+                return idx
+            candidates.append((badness, idx))
+        return min(candidates)[1]
+
+    def _get_legend_best_position(self, leg):
+        """
+        Return a replacement for the legend `_find_best_position` method that
+        uses the fast approximate algorithm in `_get_best_index`.
+        """
+        def _find_best_position(width, height, renderer, consider=None):
+            if consider is None:
+                bbox = mtransforms.Bbox.from_bounds(0, 0, width, height)
+                parent = leg.get_bbox_to_anchor()
+                consider = [
+                    leg._get_anchored_bbox(code, bbox, parent, renderer)
+                    for code in range(1, len(leg.codes))
+                ]
+            boxes = [(x, y, width, height) for x, y in consider]
+            return consider[self._get_best_index(boxes, renderer)]
+        return _find_best_position
+
     def _apply_title_above(self):
         """
         Change assignment of outer titles between main subplot and upper panels.
@@ -1433,19 +1601,74 @@ class Axes(maxes.Axes):
             axs = list(self._panel_parent._iter_axes(hidden=False, children=True))
         else:  # this is a figure-wide legend
             axs = list(self.figure._iter_axes(hidden=False, children=True))
+        # NOTE: Labels are checked here rather than stored in the index so that
+        # set_label() calls made after the index was built are respected.
+        # NOTE: Line collections drawn with plot(..., collection=True) store proxy
+        # handles for each column. These replace the collection in the legend.
         handles = []
         handler_map_full = mlegend.Legend.get_default_handler_map()
         handler_map_full = handler_map_full.copy()
         handler_map_full.update(handler_map or {})
         for ax in axs:
-            for attr in ('lines', 'patches', 'collections', 'containers'):
-                for handle in getattr(ax, attr, []):  # guard against API changes
+            for obj in ax._get_legend_index(handler_map_full, cache=not handler_map):
+                for handle in getattr(obj, '_legend_handles', None) or (obj,):
                     label = handle.get_label()
-                    handler = mlegend.Legend.get_legend_handler(handler_map_full, handle)  # noqa: E501
-                    if handler and label and label[0] != '_':
+                    if label and label[0] != '_':
                         handles.append(handle)
         return handles
 
+    def _get_legend_index(self, handler_map, cache=True):
+        """
+        Return the artists in this axes that have valid legend handlers. The result
+        is stored in a figure-wide index and reused until artists are added or removed.
+        """
+        # NOTE: Resolving legend handlers requires walking the method resolution
+        # order of each artist, which is slow for thousands of artists and was
+        # previously repeated for every axes each time a legend was drawn.
+        # NOTE: The index stores artist positions rather than artists so that it does
+        # not keep removed axes alive through references to their artists. Entries are
+        # removed when artists are added or removed (see _update_legend_index), and
+        # clearing the axes empties the artist lists so the lookup below fails.
+        artists = {
+            attr: getattr(self, attr, [])  # guard against API changes
+            for attr in ('lines', 'patches', 'collections', 'containers')
+        }
+        index = getattr(self.figure, '_legend_index', None)
+        if not cache:
+            index = None
+        if index is not None and self in index:
+            try:
+                return [artists[attr][i] for attr, i in index[self]]
+            except IndexError:
+                pass
+        positions = [
+            (attr, i) for attr, objs in artists.items()
+            for i, obj in enumerate(objs)
+            if mlegend.Legend.get_legend_handler(handler_map, obj)
+        ]
+        if index is not None:
+            index[self] = positions
+        return [artists[attr][i] for attr, i in positions]
+
+    def _update_legend_index(self, obj):
+        """
+        Remove the legend index entry for this axes when the artist is added
+        and when it is later removed.
+        """
+        index = getattr(self.figure, '_legend_index', None)
+        if index is not None:
+            index.pop(self, None)  # see _get_legend_index()
+        remove = getattr(obj, '_remove_method', None)
+        if remove is None:
+            return obj
+        def _remove_method(*args, **kwargs):  # noqa: E306
+            index = getattr(self.figure, '_legend_index', None)
+            if index is not None:
+                index.pop(self, None)
+            return remove(*args, **kwargs)
+        obj._remove_method = _remove_method
+        return obj
+
     def _get_share_axes(self, sx, panels=False):
         """
         Return the axes whose horizontal or vertical extent in the main gridspec
@@ -1458,8 +1681,10 @@ class Axes(maxes.Axes):
         sy = 'y' if sx == 'x' else 'x'
         argfunc = np.argmax if sx == 'x' else np.argmin
         irange = self._range_subplotspec(sx)
-        axs = self.figure._iter_axes(hidden=False, children=False, panels=panels)
-        axs = [ax for ax in axs if ax._range_subplotspec(sx) == irange]
+        axs, ranges = self.figure._get_subplot_ranges(panels=panels)
+        j = 2 if sx == 'x' else 0  # column or row range
+        mask = (ranges[:, j] == irange[0]) & (ranges[:, j + 1] == irange[1])
+        axs = [axs[idx] for idx in np.flatnonzero(mask)]
         axs = list({self, *axs})  # self may be missing during initialization
         pax = axs.pop(argfunc([ax._range_subplotspec(sy)[i] for ax in axs]))
         return [pax, *axs]  # return with leftmost or bottommost first
@@ -1476,8 +1701,9 @@ class Axes(maxes.Axes):
         x, y = 'xy' if side in ('left', 'right') else 'yx'
         idx = 0 if side in ('left', 'top') else 1  # which side to test
         coord = self._range_subplotspec(x)[idx]  # side for a particular axes
-        axs = self.figure._iter_axes(hidden=False, children=False, panels=panels)
-        axs = [ax for ax in axs if ax._range_subplotspec(x)[idx] == coord] or [self]
+        axs, ranges = self.figure._get_subplot_ranges(panels=panels)
+        j = (2 if x == 'x' else 0) + idx  # column or row range
+        axs = [axs[i] for i in np.flatnonzero(ranges[:, j] == coord)] or [self]
         out = []
         for ax in axs:
             other = getattr(ax, '_share' + y)
@@ -1514,10 +1740,11 @@ class Axes(maxes.Axes):
         transform = _not_none(transform, default)
         if isinstance(transform, mtransforms.Transform):
             return transform
-        elif CRS is not object and isinstance(transform, CRS):
+        elif constructor._is_cartopy(transform, 'CRS'):
             return transform
-        elif PlateCarree is not object and transform == 'map':
-            return PlateCarree()
+        elif self._name == 'cartopy' and transform == 'map':
+            import cartopy.crs as ccrs
+            return ccrs.PlateCarree()
         elif transform == 'data':
             return self.transData
         elif transform == 'axes':
@@ -1558,6 +1785,12 @@ class Axes(maxes.Axes):
             handles, labels = obj
             if not np.iterable(handles) or type(handles) is tuple:
                 handles = [handles]
+            # NOTE: Expand line collections drawn with plot(..., collection=True)
+            # into their per-column proxy handles before pairing with the labels.
+            handles = [
+                handle for obj in handles
+                for handle in getattr(obj, '_legend_handles', None) or (obj,)
+            ]
             if not np.iterable(labels) or isinstance(labels, str):
                 labels = [labels] * len(handles)
             length = min(len(handles), len(labels))  # mimics 'zip' behavior
@@ -1588,7 +1821,7 @@ class Axes(maxes.Axes):
             self.legend(objs, loc=legend, align=align, queue=queue, **legend_kw)
         if colorbar:
             align = colorbar_kw.pop('align', None)
-            queue = colorbar_kw.pop('queue', queue_colorbar)
+            queue = colorbar_kw.pop('queue', queue_colorbar or None)  # see colorbar()
             self.colorbar(objs, loc=colorbar, align=align, queue=queue, **colorbar_kw)
 
     @staticmethod
@@ -1812,20 +2045,38 @@ class Axes(maxes.Axes):
 
         # Location in axes-relative coordinates
         # Bounds are x0, y0, width, height in axes-relative coordinates
-        if loc == 'upper right':
-            bounds_inset = [1 - xpad - length, 1 - ypad - width]
-            bounds_frame = [1 - 2 * xpad - length, 1 - 2 * ypad - width - labspace]
-        elif loc == 'upper left':
-            bounds_inset = [xpad, 1 - ypad - width]
-            bounds_frame = [0, 1 - 2 * ypad - width - labspace]
-        elif loc == 'lower left':
-            bounds_inset = [xpad, ypad + labspace]
-            bounds_frame = [0, 0]
-        else:
-            bounds_inset = [1 - xpad - length, ypad + labspace]
-            bounds_frame = [1 - 2 * xpad - length, 0]
-        bounds_inset.extend((length, width))  # inset axes
-        bounds_frame.extend((2 * xpad + length, 2 * ypad + width + labspace))
+        # NOTE: The 'best' location is the least crowded corner when the colorbar
+        # is created, so artists plotted afterward are not considered. The 'lower
+        # right' corner is preferred in case of ties.
+        bounds = {
+            'lower right': (
+                [1 - xpad - length, ypad + labspace],
+                [1 - 2 * xpad - length, 0],
+            ),
+            'upper right': (
+                [1 - xpad - length, 1 - ypad - width],
+                [1 - 2 * xpad - length, 1 - 2 * ypad - width - labspace],
+            ),
+            'upper left': (
+                [xpad, 1 - ypad - width],
+                [0, 1 - 2 * ypad - width - labspace],
+            ),
+            'lower left': (
+                [xpad, ypad + labspace],
+                [0, 0],
+            ),
+        }
+        size_inset = (length, width)
+        size_frame = (2 * xpad + length, 2 * ypad + width + labspace)
+        if loc == 'best':
+            boxes = [
+                mtransforms.Bbox.from_bounds(*xy, *size_frame).transformed(self.transAxes).bounds  # noqa: E501
+                for _, xy in bounds.values()
+            ]
+            loc = tuple(bounds)[self._get_best_index(boxes)]
+        bounds_inset, bounds_frame = bounds.get(loc, bounds['lower right'])
+        bounds_inset = [*bounds_inset, *size_inset]  # inset axes
+        bounds_frame = [*bounds_frame, *size_frame]
 
         # Make axes and frame with zorder matching default legend zorder
         cls = mproj.get_projection_class('proplot_cartesian')
@@ -2067,7 +2318,9 @@ class Axes(maxes.Axes):
                     if hs:  # non-empty
                         obj = hs[len(hs) // 2]
                         obj.set_label(label)
-                if isinstance(obj, containers):  # extract labeled elements
+                if getattr(obj, '_legend_handles', None):  # e.g. collection=True
+                    handles.extend(obj._legend_handles)
+                elif isinstance(obj, containers):  # extract labeled elements
                     hs = (obj, *guides._iter_iterables(obj))
                     hs = tuple(filter(_legend_label, hs))
                     if hs:
@@ -2112,7 +2365,7 @@ class Axes(maxes.Axes):
 
     def _parse_legend_handles(
         self, handles, labels, ncol=None, order=None, center=None,
-        alphabetize=None, handler_map=None,
+        alphabetize=None, unique=None, handler_map=None,
     ):
         """
         Parse input handles and labels.
@@ -2167,6 +2420,9 @@ class Axes(maxes.Axes):
                 ihandles = self._get_legend_handles(handler_map)
             ihandles, ilabels = self._parse_legend_group(ihandles, ilabels)
             ipairs = list(zip(ihandles, ilabels))
+            if unique:
+                seen = set()  # keep the first entry for each label
+                ipairs = [p for p in ipairs if not (p[1] in seen or seen.add(p[1]))]
             if alphabetize:
                 ipairs = sorted(ipairs, key=lambda pair: pair[1])
             pairs.append(ipairs)
@@ -2681,6 +2937,26 @@ class Axes(maxes.Axes):
             return
         self.figure.format(rc_kw=rc_kw, rc_mode=rc_mode, skip_axes=True, **params)
 
+    def add_collection(self, collection, *args, **kwargs):
+        # Silent override. Reset the legend index (see _get_legend_index).
+        obj = super().add_collection(collection, *args, **kwargs)
+        return self._update_legend_index(obj)
+
+    def add_container(self, container, *args, **kwargs):
+        # Silent override. Reset the legend index (see _get_legend_index).
+        obj = super().add_container(container, *args, **kwargs)
+        return self._update_legend_index(obj)
+
+    def add_line(self, line, *args, **kwargs):
+        # Silent override. Reset the legend index (see _get_legend_index).
+        obj = super().add_line(line, *args, **kwargs)
+        return self._update_legend_index(obj)
+
+    def add_patch(self, patch, *args, **kwargs):
+        # Silent override. Reset the legend index (see _get_legend_index).
+        obj = super().add_patch(patch, *args, **kwargs)
+        return self._update_legend_index(obj)
+
     def draw(self, renderer=None, *args, **kwargs):
         # Perform extra post-processing steps
         # NOTE: In *principle* these steps go here but should already be complete
@@ -2730,6 +3006,14 @@ class Axes(maxes.Axes):
         cycle = self._active_cycle = constructor.Cycle(*args, **kwargs)
         return super().set_prop_cycle(cycle)  # set the property cycler after validation
 
+    def set_visible(self, b):
+        # Silent override. Reset the cached subplot ranges since invisible
+        # axes are excluded from axis sharing and spanning label groups.
+        cache = getattr(self.figure, '_range_cache', None)
+        if cache is not None:
+            cache.clear()  # see Figure._get_subplot_ranges()
+        super().set_visible(b)
+
     @docstring._snippet_manager
     def inset(self, *args, **kwargs):
         """
@@ -2864,7 +3148,16 @@ class Axes(maxes.Axes):
 
         # Either draw right now or queue up for later. The queue option lets us
         # successively append objects (e.g. lines) to a colorbar artist list.
-        queue = kwargs.pop('queue', False)
+        # NOTE: Outer colorbars are queued by default for figures with
+        # sharecolorbars=True so they can be merged with other subplot colorbars.
+        # NOTE: Here new shared colorbars replace the previous queued colorbar in
+        # the same location rather than appending to it, like non-queued colorbars.
+        queue = kwargs.pop('queue', None)
+        if queue is None:
+            share = getattr(self.figure, '_sharecolorbars', False)
+            queue = share and loc in ('left', 'right', 'top', 'bottom')
+            if queue and isinstance(self._colorbar_dict.get((loc, align)), tuple):
+                del self._colorbar_dict[(loc, align)]
         if queue:
             self._register_guide('colorbar', (mappable, values), (loc, align), **kwargs)
         else:
@@ -7,31 +7,26 @@ import inspect
 
 import matplotlib.axis as maxis
 import matplotlib.path as mpath
+import matplotlib.projections as mproj
 import matplotlib.text as mtext
 import matplotlib.ticker as mticker
 import numpy as np
 
 from .. import constructor
-from .. import proj as pproj
+from .. import ticker as pticker
 from ..config import rc
 from ..internals import ic  # noqa: F401
-from ..internals import _not_none, _pop_rc, _version_cartopy, docstring, warnings
+from ..internals import (
+    _not_none,
+    _pop_rc,
+    _version_cartopy,
+    context,
+    docstring,
+    warnings,
+)
 from . import plot
 
-try:
-    import cartopy.crs as ccrs
-    import cartopy.feature as cfeature
-    import cartopy.mpl.gridliner as cgridliner
-    from cartopy.crs import Projection
-    from cartopy.mpl.geoaxes import GeoAxes as _GeoAxes
-except ModuleNotFoundError:
-    ccrs = cfeature = cgridliner = None
-    _GeoAxes = Projection = object
-
-try:
-    from mpl_toolkits.basemap import Basemap
-except ModuleNotFoundError:
-    Basemap = object
+ccrs = cfeature = cgridliner = pproj = None  # see _load_cartopy()
 
 __all__ = ['GeoAxes']
 
@@ -190,12 +185,6 @@ class _GeoLabel(object):
             return False
 
 
-# Add monkey patch to gridliner module
-if cgridliner is not None and hasattr(cgridliner, 'Label'):  # only recent versions
-    _cls = type('Label', (_GeoLabel, cgridliner.Label), {})
-    cgridliner.Label = _cls
-
-
 class _GeoAxis(object):
     """
     Dummy axis used by longitude and latitude locators and for storing view limits on
@@ -752,26 +741,61 @@ class GeoAxes(plot.PlotAxes):
         self._map_projection = map_projection
 
 
-class _CartopyAxes(GeoAxes, _GeoAxes):
+def _load_cartopy():
     """
-    Axes subclass for plotting cartopy projections.
+    Import cartopy and register the cartopy axes subclass.
     """
-    _name = 'cartopy'
-    _name_aliases = ('geo', 'geographic')  # default 'geographic' axes
-    _proj_class = Projection
-    _proj_north = (
+    # NOTE: Cartopy is slow to import so it is imported when cartopy projections
+    # are first requested (see constructor._load_cartopy). Until then the axes class
+    # registered with matplotlib is defined without the cartopy base class and
+    # projection classes. Here a subclass with these is registered in its place.
+    global ccrs, cfeature, cgridliner, pproj
+    if ccrs is not None:
+        return
+    import cartopy.feature as cfeature
+    import cartopy.mpl.geoaxes as cgeoaxes
+    import cartopy.mpl.gridliner as cgridliner
+    from .. import proj as pproj
+    pticker._load_cartopy()
+    if hasattr(cgridliner, 'Label'):  # only recent versions
+        cgridliner.Label = type('Label', (_GeoLabel, cgridliner.Label), {})
+    north = (
         pproj.NorthPolarStereo,
         pproj.NorthPolarGnomonic,
         pproj.NorthPolarAzimuthalEquidistant,
         pproj.NorthPolarLambertAzimuthalEqualArea,
     )
-    _proj_south = (
+    south = (
         pproj.SouthPolarStereo,
         pproj.SouthPolarGnomonic,
         pproj.SouthPolarAzimuthalEquidistant,
         pproj.SouthPolarLambertAzimuthalEqualArea
     )
-    _proj_polar = _proj_north + _proj_south
+    cls = type(
+        _CartopyAxes.__name__,
+        (_CartopyAxes, cgeoaxes.GeoAxes),
+        {
+            '__module__': __name__,
+            '__doc__': _CartopyAxes.__doc__,
+            '_proj_north': north,
+            '_proj_south': south,
+            '_proj_polar': north + south,
+        }
+    )
+    for name in (cls._name, *cls._name_aliases):  # see axes/__init__.py
+        with context._state_context(cls, name='proplot_' + name):
+            mproj.register_projection(cls)
+    import cartopy.crs as ccrs
+
+
+class _CartopyAxes(GeoAxes):
+    """
+    Axes subclass for plotting cartopy projections.
+    """
+    # NOTE: The subclass with the cartopy GeoAxes base class and the polar
+    # projection classes is created when cartopy is imported (see _load_cartopy).
+    _name = 'cartopy'
+    _name_aliases = ('geo', 'geographic')  # default 'geographic' axes
 
     # NOTE: The rename argument wrapper belongs here instead of format() because
     # these arguments were previously only accepted during initialization.
@@ -787,7 +811,8 @@ class _CartopyAxes(GeoAxes, _GeoAxes):
         """
         # Initialize axes. Note that critical attributes like outline_patch
         # needed by _format_apply are added before it is called.
-        import cartopy  # noqa: F401 verify package is available
+        _load_cartopy()  # verify package is available
+        self._proj_class = ccrs.Projection
         self.projection = map_projection  # verify
         polar = isinstance(self.projection, self._proj_polar)
         latmax = 80 if polar else 90  # default latmax
@@ -846,7 +871,13 @@ class _CartopyAxes(GeoAxes, _GeoAxes):
             return x_range, y_range
         # Cartopy >= 0.18 monkey patch. Fixes issue where cartopy draws an overlapping
         # dateline gridline (e.g. polar maps). See the nx -= 1 line in _draw_gridliner
+        # Also skips regenerating the graticule lines and labels when the projection,
+        # extent, tick locations, and gridliner settings are unchanged since the last
+        # draw (e.g. when re-saving figures or calling get_tightbbox() then draw()).
         def _draw_gridliner(self, *args, **kwargs):  # noqa: E306
+            key = self.axes._get_gridliner_key(self)
+            if key is not None and key == getattr(self, '_proplot_key', None):
+                return
             result = type(self)._draw_gridliner(self, *args, **kwargs)
             if _version_cartopy >= '0.18':
                 lon_lim, _ = self._axes_domain()
@@ -855,15 +886,55 @@ class _CartopyAxes(GeoAxes, _GeoAxes):
                         if not getattr(collection, '_cartopy_fix', False):
                             collection.get_paths().pop(-1)
                             collection._cartopy_fix = True
+            self._proplot_key = key
             return result
         # Return the gridliner with monkey patch
+        # NOTE: Cartopy >= 0.20 skips updates after the first draw unless auto_update
+        # is enabled. Since proplot tracks changes itself we always enable updates.
         gl = self.gridlines(crs=ccrs.PlateCarree())
         gl._axes_domain = _axes_domain.__get__(gl)
         gl._draw_gridliner = _draw_gridliner.__get__(gl)
+        gl._auto_update = True
         gl.xlines = gl.ylines = False
         self._toggle_gridliner_labels(gl, False, False, False, False, False)
         return gl
 
+    def _get_gridliner_key(self, gl):
+        """
+        Return the comparison key used to determine whether gridliner artists
+        must be regenerated. Returns ``None`` if the artists cannot be reused.
+        """
+        # NOTE: Cartopy < 0.18 appends new artists on each draw and proplot clears
+        # the gridliners after get_tightbbox(), so caching is not possible there.
+        # NOTE: The display bounding box is included because it changes with the axes
+        # position, figure size, and dpi, which affect the overlapping label checks.
+        # NOTE: The projection and formatters are stored rather than their ids because
+        # ids can be reused after garbage collection. Storing them in the key keeps them
+        # alive, and tuple comparison checks identity before calling __eq__.
+        if _version_cartopy < '0.18':
+            return None
+        attrs = (
+            'n_steps', 'xlines', 'ylines', 'xpadding', 'ypadding',
+            'x_inline', 'y_inline', 'inline_labels', 'rotate_labels',
+            'left_labels', 'right_labels', 'bottom_labels', 'top_labels', 'geo_labels',
+        )
+        locs = tuple(
+            tuple(np.asarray(getattr(locator, 'locs', ())).tolist())
+            for locator in (gl.xlocator, gl.ylocator)
+        )
+        return (
+            self.projection,
+            tuple(self.viewLim.bounds),
+            tuple(np.round(self.bbox.bounds, 3).tolist()),  # ignore layout jitter
+            locs,
+            gl.xformatter,
+            gl.yformatter,
+            tuple(getattr(gl, attr, None) for attr in attrs),
+            dict(gl.collection_kwargs or {}),
+            dict(gl.xlabel_style or {}),
+            dict(gl.ylabel_style or {}),
+        )
+
     @staticmethod
     def _toggle_gridliner_labels(
         gl, left=None, right=None, bottom=None, top=None, geo=None
@@ -1188,7 +1259,10 @@ class _CartopyAxes(GeoAxes, _GeoAxes):
                 extent[:2] = [lon0 - 180, lon0 + 180]
         return extent
 
-    def get_tightbbox(self, renderer, *args, **kwargs):
+    def _draw_gridliners(self, renderer):
+        """
+        Adjust the axes location and aspect ratio then draw the gridliners.
+        """
         # Perform extra post-processing steps
         # For now this just draws the gridliners
         self._apply_axis_sharing()
@@ -1218,6 +1292,8 @@ class _CartopyAxes(GeoAxes, _GeoAxes):
         if _version_cartopy < '0.18':
             self._gridliners = []
 
+    def get_tightbbox(self, renderer, *args, **kwargs):
+        self._draw_gridliners(renderer)
         return super().get_tightbbox(renderer, *args, **kwargs)
 
     def set_extent(self, extent, crs=None):
@@ -1258,7 +1334,6 @@ class _BasemapAxes(GeoAxes):
     Axes subclass for plotting basemap projections.
     """
     _name = 'basemap'
-    _proj_class = Basemap
     _proj_north = ('npaeqd', 'nplaea', 'npstere')
     _proj_south = ('spaeqd', 'splaea', 'spstere')
     _proj_polar = _proj_north + _proj_south
@@ -1284,7 +1359,10 @@ class _BasemapAxes(GeoAxes):
         # WARNING: Investigated whether Basemap.__init__() could be called
         # twice with updated proj kwargs to modify map bounds after creation
         # and python immmediately crashes. Do not try again.
-        import mpl_toolkits.basemap  # noqa: F401 verify package is available
+        # NOTE: Basemap is imported here rather than at the top of the module
+        # because importing the package is slow and it is rarely used.
+        from mpl_toolkits.basemap import Basemap  # verify package is available
+        self._proj_class = Basemap
         self.projection = copy.copy(map_projection)  # verify
         lon0 = self._get_lon0()
         if self.projection.projection in self._proj_polar:
@@ -20,6 +20,7 @@ import matplotlib.contour as mcontour
 import matplotlib.image as mimage
 import matplotlib.lines as mlines
 import matplotlib.patches as mpatches
+import matplotlib.text as mtext
 import matplotlib.ticker as mticker
 import numpy as np
 import numpy.ma as ma
@@ -36,6 +37,8 @@ from ..internals import (
     _pop_kwargs,
     _pop_params,
     _pop_props,
+    _split_params,
+    _version_mpl,
     context,
     docstring,
     guides,
@@ -44,11 +47,6 @@ from ..internals import (
 )
 from . import base
 
-try:
-    from cartopy.crs import PlateCarree
-except ModuleNotFoundError:
-    PlateCarree = object
-
 __all__ = ['PlotAxes']
 
 
@@ -466,6 +464,13 @@ Parameters
 ----------
 %(plot.args_1d_{y})s
 %(plot.args_1d_shared)s
+collection : bool, default: False
+    Whether to draw the columns of 2D input as a single
+    `~matplotlib.collections.LineCollection` rather than one
+    `~matplotlib.lines.Line2D` per column. This is much faster for many columns.
+    Colors and line styles are still drawn from the property cycle and legends
+    and colorbars use one proxy handle per column. Ignored with markers or
+    format strings.
 
 Other parameters
 ----------------
@@ -1287,8 +1292,64 @@ class PlotAxes(base.Axes):
                 obj = getattr(self.projection, name)(*args, ax=self, **kwargs)
             else:
                 obj = getattr(super(), name)(*args, **kwargs)
+        self._auto_rasterize(obj, kwargs.get('rasterized', None))
         return obj
 
+    @staticmethod
+    def _auto_rasterize(obj, rasterized=None):
+        """
+        Rasterize the artist(s) if the number of elements exceeds the threshold
+        :rcraw:`rasterthreshold` and `rasterized` was not passed explicitly.
+        """
+        threshold = rc['rasterthreshold']
+        if threshold is None or rasterized is not None:
+            return
+
+        # Helper function to count elements
+        # NOTE: Matplotlib >= 3.8 contour sets are collections and store the levels
+        # in the array, so count vertices before checking mappable arrays.
+        def _count_elements(artist):
+            if isinstance(artist, mlines.Line2D):
+                return len(artist.get_xydata())
+            if isinstance(artist, mpatches.Patch):
+                return len(artist.get_path().vertices)
+            if isinstance(artist, mcontour.ContourSet):
+                return sum(len(path.vertices) for path in artist.get_paths())
+            if isinstance(artist, mcollections.Collection):
+                array = artist.get_array()
+                if array is not None:
+                    return np.size(array)
+                offsets = artist.get_offsets()
+                if len(offsets) > 1:
+                    return len(offsets)
+                return sum(len(path.vertices) for path in artist.get_paths())
+            return 0
+
+        # Get groups of artists. Groups are rasterized as a unit.
+        # NOTE: Matplotlib < 3.8 contour sets are not artists. Also treat lists
+        # and containers as groups since e.g. bar plots include many small patches.
+        # Images are already rasterized so they are skipped, and text is skipped
+        # so that e.g. pie() wedge labels are kept as vector graphics.
+        contour = isinstance(obj, mcontour.ContourSet)
+        if contour and not isinstance(obj, martist.Artist):
+            artists = list(obj.collections)
+            count = sum(len(path.vertices) for a in artists for path in a.get_paths())
+        elif isinstance(obj, martist.Artist):
+            artists = [obj]
+            count = _count_elements(obj)
+        elif np.iterable(obj):
+            artists = [
+                a for a in cbook.flatten(obj)
+                if isinstance(a, martist.Artist) and not isinstance(a, mtext.Text)
+            ]
+            count = sum(map(_count_elements, artists))
+        else:
+            return
+        if count > threshold:
+            for artist in artists:
+                if not isinstance(artist, mimage.AxesImage):
+                    artist.set_rasterized(True)
+
     def _plot_negpos(
         self, name, x, *ys, negcolor=None, poscolor=None, colorkey='facecolor',
         use_where=False, use_zero=False, **kwargs
@@ -1335,10 +1396,11 @@ class PlotAxes(base.Axes):
         with a default maximum precision of ``3`` decimal places.
         """
         # TODO: Add quiverkey to this!
+        # NOTE: Copy the keyword dictionaries so that update_data() can re-use them
         if not labels:
             return
-        labels_kw = labels_kw or {}
-        formatter_kw = formatter_kw or {}
+        labels_kw = (labels_kw or {}).copy()
+        formatter_kw = (formatter_kw or {}).copy()
         formatter = _not_none(
             fmt_labels_kw=labels_kw.pop('fmt', None),
             formatter_labels_kw=labels_kw.pop('formatter', None),
@@ -1953,7 +2015,7 @@ class PlotAxes(base.Axes):
         x, *ys, kwargs = self._parse_1d_format(x, *ys, zerox=zerox, **kwargs)
 
         # Geographic corrections
-        if self._name == 'cartopy' and isinstance(kwargs.get('transform'), PlateCarree):  # noqa: E501
+        if self._name == 'cartopy' and constructor._is_cartopy(kwargs.get('transform'), 'PlateCarree'):  # noqa: E501
             x, *ys = inputs._geo_cartopy_1d(x, *ys)
         elif self._name == 'basemap' and kwargs.get('latlon', None):
             xmin, xmax = self._lonaxis.get_view_interval()
@@ -2057,12 +2119,15 @@ class PlotAxes(base.Axes):
         # Geographic corrections
         if allow1d:
             pass
-        elif self._name == 'cartopy' and isinstance(kwargs.get('transform'), PlateCarree):  # noqa: E501
+        elif self._name == 'cartopy' and constructor._is_cartopy(kwargs.get('transform'), 'PlateCarree'):  # noqa: E501
             x, y, *zs = inputs._geo_cartopy_2d(x, y, *zs, globe=globe)
         elif self._name == 'basemap' and kwargs.get('latlon', None):
             xmin, xmax = self._lonaxis.get_view_interval()
             x, y, *zs = inputs._geo_basemap_2d(x, y, *zs, xmin=xmin, xmax=xmax, globe=globe)  # noqa: E501
-            x, y = np.meshgrid(x, y)  # WARNING: required always
+            # WARNING: Basemap latlon transforms require 2D coordinates. Here 2D input
+            # is already the right shape so only 1D coordinates need broadcasting.
+            if x.ndim == 1 and y.ndim == 1:
+                x, y = np.meshgrid(x, y, copy=False)  # broadcast views not copies
 
         return (x, y, *zs, kwargs)
 
@@ -2273,8 +2338,8 @@ class PlotAxes(base.Axes):
         return kwargs
 
     def _parse_cycle(
-        self, ncycle=None, *, cycle=None, cycle_kw=None,
-        cycle_manually=None, return_cycle=False, **kwargs
+        self, ncycle=None, *, icycle=None, cycle_samples=None, cycle=None,
+        cycle_kw=None, cycle_manually=None, return_cycle=False, **kwargs
     ):
         """
         Parse property cycle-related arguments.
@@ -2283,6 +2348,13 @@ class PlotAxes(base.Axes):
         ----------
         ncycle : int, optional
             The number of samples to draw for the cycle.
+        icycle : int, optional
+            The column index for column-by-column plotting commands.
+        cycle_samples : dict, optional
+            The cycle samples shared by the columns of a column-by-column plotting
+            command. If passed with `icycle`, `ncycle` cycle entries are sampled
+            into this dictionary by the first column that needs them and the
+            properties for other columns are read from these samples.
         cycle : cycle-spec, optional
             The property cycle specifier.
         cycle_kw : dict-like, optional
@@ -2297,6 +2369,10 @@ class PlotAxes(base.Axes):
         # Create the property cycler and update it if necessary
         # NOTE: Matplotlib Cycler() objects have built-in __eq__ operator
         # so really easy to check if the cycler has changed!
+        # NOTE: Column-by-column plotting commands call this once per column with
+        # the same cycle arguments. Cache the last cycle so that we do not rebuild
+        # the colormap and compare every cycle entry for each column. The key includes
+        # the colormap database generation so that re-registered names are reloaded.
         if cycle is not None or cycle_kw:
             cycle_kw = cycle_kw or {}
             if ncycle != 1:  # ignore for column-by-column plotting commands
@@ -2309,16 +2385,30 @@ class PlotAxes(base.Axes):
                 args = (rc['axes.prop_cycle'],)
             else:
                 args = (cycle,)
-            cycle = constructor.Cycle(*args, **cycle_kw)
+            try:
+                generation = pcolors._cmap_database._generation
+                key = (generation, args, tuple(sorted(cycle_kw.items())))
+                hash(key)
+            except TypeError:  # e.g. cycler or list input
+                key = None
+            cache = self._cycle_cache
+            if key is not None and cache is not None and cache[0] == key:
+                cycle = cache[1]
+            else:
+                cycle = constructor.Cycle(*args, **cycle_kw)
+                self._cycle_cache = (key, cycle) if key is not None else None
             with warnings.catch_warnings():  # hide 'elementwise-comparison failed'
                 warnings.simplefilter('ignore', FutureWarning)
-                if return_cycle:
+                if return_cycle or cycle is self._active_cycle:
                     pass
                 elif cycle != self._active_cycle:
                     self.set_prop_cycle(cycle)
 
         # Manually extract and apply settings to outgoing keyword arguments
         # if native matplotlib function does not include desired properties
+        # NOTE: For column-by-column plotting the cycler is advanced by the number
+        # of columns at once and scatter() colors are converted to hex all at once.
+        # This matches the default behavior of drawing one cycle entry per artist.
         cycle_manually = cycle_manually or {}
         parser = self._get_lines  # the _process_plot_var_args instance
         props = {}  # which keys to apply from property cycler
@@ -2326,12 +2416,18 @@ class PlotAxes(base.Axes):
             if kwargs.get(key, None) is None and prop in parser._prop_keys:
                 props[prop] = key
         if props:
-            dict_ = next(parser.prop_cycler)
+            if icycle is None or cycle_samples is None:
+                icycle, cycle_samples, ncycle = 0, {}, 1
+            if not cycle_samples:
+                dicts = list(itertools.islice(parser.prop_cycler, ncycle or 1))
+                for prop, key in cycle_manually.items():
+                    if prop in parser._prop_keys:
+                        values = [dict_[prop] for dict_ in dicts]
+                        if key == 'c':  # special case: scatter() color must be hex
+                            values = pcolors.to_hex(values).tolist()
+                        cycle_samples[prop, key] = values
             for prop, key in props.items():
-                value = dict_[prop]
-                if key == 'c':  # special case: scatter() color must be converted to hex
-                    value = pcolors.to_hex(value)
-                kwargs[key] = value
+                kwargs[key] = cycle_samples[prop, key][icycle]
 
         if return_cycle:
             return cycle, kwargs  # needed for stem() to apply in a context()
@@ -2721,32 +2817,104 @@ class PlotAxes(base.Axes):
 
         return vmin, vmax, kwargs
 
-    def _apply_plot(self, *pairs, vert=True, **kwargs):
+    def _add_line_collection(self, segments, kws):
+        """
+        Draw the line segments as a single collection using the column-by-column
+        line properties and store proxy handles for each column.
+        """
+        # NOTE: Proxy handles are stored on the collection and expanded when parsing
+        # legend and colorbar input. This preserves one legend entry per column.
+        defaults = {
+            'color': rc['lines.color'],
+            'linewidth': rc['lines.linewidth'],
+            'linestyle': rc['lines.linestyle'],
+        }
+        props = {
+            key: [_not_none(kw.pop(key, None), value) for kw in kws]
+            for key, value in defaults.items()
+        }
+        labels = [kw.pop('label', None) for kw in kws]
+        kw = kws[0].copy()  # remaining properties are identical across columns
+        kw.pop('distribution', None)  # remove stat distributions
+        for key in ('capstyle', 'joinstyle'):  # translate Line2D-only properties
+            value = _not_none(kw.pop('solid_' + key, None), kw.pop('dash_' + key, None))  # noqa: E501
+            if value is not None:
+                kw.setdefault(key, value)
+        obj = mcollections.LineCollection(
+            segments,
+            colors=props['color'],
+            linewidths=props['linewidth'],
+            linestyles=props['linestyle'],
+            label='_no_label',
+        )
+        obj.update(kw)
+        obj._legend_handles = [
+            mlines.Line2D(
+                [], [], color=color, linewidth=linewidth, linestyle=linestyle,
+                alpha=kw.get('alpha', None), label=label,
+            )
+            for color, linewidth, linestyle, label in zip(*props.values(), labels)
+        ]
+        self.add_collection(obj)
+        self.autoscale_view()
+        self._auto_rasterize(obj, kw.get('rasterized', None))
+        return obj
+
+    def _apply_plot(self, *pairs, vert=True, collection=False, **kwargs):
         """
         Plot standard lines.
         """
         # Plot the lines
+        # NOTE: With collection=True the columns are drawn as one LineCollection
+        # but the cycle properties and error indicators are still applied per column.
         objs, xsides = [], []
         kws = kwargs.copy()
         kws.update(_pop_props(kws, 'line'))
         kws, extents = self._inbounds_extent(**kws)
+        cycle_manually = {key: key for key in ('color', 'linewidth', 'linestyle')}
         for xs, ys, fmt in self._iter_arg_pairs(*pairs):
             xs, ys, kw = self._parse_1d_plot(xs, ys, vert=vert, **kws)
             ys, kw = inputs._dist_reduce(ys, **kw)
             guide_kw = _pop_params(kw, self._update_guide)  # after standardize
-            for _, n, x, y, kw in self._iter_arg_cols(xs, ys, **kw):
-                kw = self._parse_cycle(n, **kw)
+            batch = collection and fmt is None and not any(
+                'marker' in key or key in ('drawstyle', 'fillstyle', 'markevery')
+                for key in kw
+            ) and all(
+                np.issubdtype(np.asarray(a).dtype, np.number) for a in (xs, ys)
+            )
+            if collection and not batch:
+                warnings._warn_proplot(
+                    'Cannot draw markers, format strings, or non-numeric data with '
+                    'collection=True. Drawing lines column-by-column instead.'
+                )
+            segments, eobjs, bkws, bsides, samples = [], [], [], [], {}
+            for i, n, x, y, kw in self._iter_arg_cols(xs, ys, **kw):
+                if batch:
+                    kw = self._parse_cycle(n, icycle=i, cycle_samples=samples, cycle_manually=cycle_manually, **kw)  # noqa: E501
+                else:
+                    kw = self._parse_cycle(n, **kw)
                 *eb, kw = self._add_error_bars(x, y, vert=vert, default_barstds=True, **kw)  # noqa: E501
                 *es, kw = self._add_error_shading(x, y, vert=vert, **kw)
-                xsides.append(x)
+                (bsides if batch else xsides).append(x)
                 if not vert:
                     x, y = y, x
+                if batch:
+                    segments.append(np.column_stack(np.broadcast_arrays(x, y)))
+                    self._inbounds_xylim(extents, x, y)
+                    eobjs.extend((*eb, *es))
+                    bkws.append(kw)
+                    continue
                 a = [x, y]
                 if fmt is not None:  # x1, y1, fmt1, x2, y2, fm2... style input
                     a.append(fmt)
                 obj, = self._plot_native('plot', *a, **kw)
+                obj._plot_vert = vert  # see update_data()
                 self._inbounds_xylim(extents, x, y)
                 objs.append((*eb, *es, obj) if eb or es else obj)
+            if segments:
+                obj = self._add_line_collection(segments, bkws)
+                self._fix_sticky_edges(obj, 'x' if vert else 'y', *bsides)
+                objs.append((*eobjs, obj) if eobjs else obj)
 
         # Add sticky edges
         self._fix_sticky_edges(objs, 'x' if vert else 'y', *xsides, only=mlines.Line2D)
@@ -2812,6 +2980,7 @@ class PlotAxes(base.Axes):
                 if not vert:
                     x, y = y, x
                 obj, = self._plot_native('step', x, y, *a, **kw)
+                obj._plot_vert = vert  # see update_data()
                 self._inbounds_xylim(extents, x, y)
                 objs.append(obj)
 
@@ -3120,15 +3289,16 @@ class PlotAxes(base.Axes):
             xs, ys, cc, inbounds=inbounds, apply_cycle=False, infer_rgb=infer_rgb, **kw
         )
         guide_kw = _pop_params(kw, self._update_guide)
-        objs = []
-        for _, n, x, y, s, c, kw in self._iter_arg_cols(xs, ys, ss, cc, **kw):
+        objs, samples = [], {}
+        for i, n, x, y, s, c, kw in self._iter_arg_cols(xs, ys, ss, cc, **kw):
             kw['s'], kw['c'] = s, c  # make _parse_cycle() detect these
-            kw = self._parse_cycle(n, cycle_manually=cycle_manually, **kw)
+            kw = self._parse_cycle(n, icycle=i, cycle_samples=samples, cycle_manually=cycle_manually, **kw)  # noqa: E501
             *eb, kw = self._add_error_bars(x, y, vert=vert, default_barstds=True, **kw)
             *es, kw = self._add_error_shading(x, y, vert=vert, color_key='c', **kw)
             if not vert:
                 x, y = y, x
             obj = self._plot_native('scatter', x, y, **kw)
+            obj._plot_vert = vert  # see update_data()
             self._inbounds_xylim(extents, x, y)
             objs.append((*eb, *es, obj) if eb or es else obj)
 
@@ -3652,8 +3822,9 @@ class PlotAxes(base.Axes):
         kw['rwidth'] = _not_none(width=width, rwidth=rwidth)  # latter is native
         kw['histtype'] = histtype = _not_none(histtype, 'bar')
         kw.update(_pop_props(kw, 'patch'))
-        edgefix_kw = _pop_params(kw, self._fix_patch_edges)
-        guide_kw = _pop_params(kw, self._update_guide)
+        edgefix_kw, guide_kw = _split_params(
+            kw, self._fix_patch_edges, self._update_guide
+        )
         n = xs.shape[1] if xs.ndim > 1 else 1
         kw = self._parse_cycle(n, **kw)
         obj = self._plot_native('hist', xs, orientation=orientation, **kw)
@@ -3720,8 +3891,9 @@ class PlotAxes(base.Axes):
         norm = kw.get('norm', None)
         if norm is not None and not isinstance(norm, pcolors.DiscreteNorm):
             norm.vmin = norm.vmax = None  # remove nonsense values
-        labels_kw = _pop_params(kw, self._add_auto_labels)
-        guide_kw = _pop_params(kw, self._update_guide)
+        labels_kw, guide_kw = _split_params(
+            kw, self._add_auto_labels, self._update_guide
+        )
         m = self._plot_native('hexbin', x, y, weights, **kw)
         self._add_auto_labels(m, **labels_kw)
         self._update_guide(m, queue_colorbar=False, **guide_kw)
@@ -3734,16 +3906,20 @@ class PlotAxes(base.Axes):
         """
         %(plot.contour)s
         """
+        coords = (x, y) if z is not None else (None, None)  # see update_data()
         x, y, z, kw = self._parse_2d_plot(x, y, z, **kwargs)
         kw.update(_pop_props(kw, 'collection'))
         kw = self._parse_cmap(
             x, y, z, min_levels=1, plot_lines=True, plot_contours=True, **kw
         )
-        labels_kw = _pop_params(kw, self._add_auto_labels)
-        guide_kw = _pop_params(kw, self._update_guide)
+        labels_kw, guide_kw = _split_params(
+            kw, self._add_auto_labels, self._update_guide
+        )
         label = kw.pop('label', None)
         m = self._plot_native('contour', x, y, z, **kw)
         m._legend_label = label
+        m._plot_coords = coords
+        m._plot_kw = (kw.copy(), {}, {}, labels_kw)
         self._add_auto_labels(m, **labels_kw)
         self._update_guide(m, queue_colorbar=False, **guide_kw)
         return m
@@ -3755,19 +3931,22 @@ class PlotAxes(base.Axes):
         """
         %(plot.contourf)s
         """
+        coords = (x, y) if z is not None else (None, None)  # see update_data()
         x, y, z, kw = self._parse_2d_plot(x, y, z, **kwargs)
         kw.update(_pop_props(kw, 'collection'))
         kw = self._parse_cmap(x, y, z, plot_contours=True, **kw)
         contour_kw = _pop_kwargs(kw, 'edgecolors', 'linewidths', 'linestyles')
-        edgefix_kw = _pop_params(kw, self._fix_patch_edges)
-        labels_kw = _pop_params(kw, self._add_auto_labels)
-        guide_kw = _pop_params(kw, self._update_guide)
+        edgefix_kw, labels_kw, guide_kw = _split_params(
+            kw, self._fix_patch_edges, self._add_auto_labels, self._update_guide
+        )
         label = kw.pop('label', None)
         m = cm = self._plot_native('contourf', x, y, z, **kw)
         m._legend_label = label
+        m._plot_coords = coords
+        m._plot_kw = (kw.copy(), edgefix_kw, contour_kw, labels_kw)
         self._fix_patch_edges(m, **edgefix_kw, **contour_kw)  # no-op if not contour_kw
         if contour_kw or labels_kw:
-            cm = self._fix_contour_edges('contour', x, y, z, **kw, **contour_kw)
+            cm = m._plot_edges = self._fix_contour_edges('contour', x, y, z, **kw, **contour_kw)  # noqa: E501
         self._add_auto_labels(m, cm, **labels_kw)
         self._update_guide(m, queue_colorbar=False, **guide_kw)
         return m
@@ -3782,9 +3961,9 @@ class PlotAxes(base.Axes):
         x, y, z, kw = self._parse_2d_plot(x, y, z, edges=True, **kwargs)
         kw.update(_pop_props(kw, 'collection'))
         kw = self._parse_cmap(x, y, z, to_centers=True, **kw)
-        edgefix_kw = _pop_params(kw, self._fix_patch_edges)
-        labels_kw = _pop_params(kw, self._add_auto_labels)
-        guide_kw = _pop_params(kw, self._update_guide)
+        edgefix_kw, labels_kw, guide_kw = _split_params(
+            kw, self._fix_patch_edges, self._add_auto_labels, self._update_guide
+        )
         with self._keep_grid_bools():
             m = self._plot_native('pcolor', x, y, z, **kw)
         self._fix_patch_edges(m, **edgefix_kw, **kw)
@@ -3802,9 +3981,9 @@ class PlotAxes(base.Axes):
         x, y, z, kw = self._parse_2d_plot(x, y, z, edges=True, **kwargs)
         kw.update(_pop_props(kw, 'collection'))
         kw = self._parse_cmap(x, y, z, to_centers=True, **kw)
-        edgefix_kw = _pop_params(kw, self._fix_patch_edges)
-        labels_kw = _pop_params(kw, self._add_auto_labels)
-        guide_kw = _pop_params(kw, self._update_guide)
+        edgefix_kw, labels_kw, guide_kw = _split_params(
+            kw, self._fix_patch_edges, self._add_auto_labels, self._update_guide
+        )
         with self._keep_grid_bools():
             m = self._plot_native('pcolormesh', x, y, z, **kw)
         self._fix_patch_edges(m, **edgefix_kw, **kw)
@@ -3822,9 +4001,9 @@ class PlotAxes(base.Axes):
         x, y, z, kw = self._parse_2d_plot(x, y, z, edges=True, **kwargs)
         kw.update(_pop_props(kw, 'collection'))
         kw = self._parse_cmap(x, y, z, to_centers=True, **kw)
-        edgefix_kw = _pop_params(kw, self._fix_patch_edges)
-        labels_kw = _pop_params(kw, self._add_auto_labels)
-        guide_kw = _pop_params(kw, self._update_guide)
+        edgefix_kw, labels_kw, guide_kw = _split_params(
+            kw, self._fix_patch_edges, self._add_auto_labels, self._update_guide
+        )
         with self._keep_grid_bools():
             m = self._plot_native('pcolorfast', x, y, z, **kw)
         if not isinstance(m, mimage.AxesImage):  # NOTE: PcolorImage is derivative
@@ -3955,8 +4134,9 @@ class PlotAxes(base.Axes):
         kw = self._parse_cmap(
             x, y, z, min_levels=1, plot_lines=True, plot_contours=True, **kw
         )
-        labels_kw = _pop_params(kw, self._add_auto_labels)
-        guide_kw = _pop_params(kw, self._update_guide)
+        labels_kw, guide_kw = _split_params(
+            kw, self._add_auto_labels, self._update_guide
+        )
         label = kw.pop('label', None)
         m = self._plot_native('tricontour', x, y, z, **kw)
         m._legend_label = label
@@ -3977,9 +4157,9 @@ class PlotAxes(base.Axes):
         kw.update(_pop_props(kw, 'collection'))
         contour_kw = _pop_kwargs(kw, 'edgecolors', 'linewidths', 'linestyles')
         kw = self._parse_cmap(x, y, z, plot_contours=True, **kw)
-        edgefix_kw = _pop_params(kw, self._fix_patch_edges)
-        labels_kw = _pop_params(kw, self._add_auto_labels)
-        guide_kw = _pop_params(kw, self._update_guide)
+        edgefix_kw, labels_kw, guide_kw = _split_params(
+            kw, self._fix_patch_edges, self._add_auto_labels, self._update_guide
+        )
         label = kw.pop('label', None)
         m = cm = self._plot_native('tricontourf', x, y, z, **kw)
         m._legend_label = label
@@ -4002,9 +4182,9 @@ class PlotAxes(base.Axes):
             raise ValueError('Three input arguments are required.')
         kw.update(_pop_props(kw, 'collection'))
         kw = self._parse_cmap(x, y, z, **kw)
-        edgefix_kw = _pop_params(kw, self._fix_patch_edges)
-        labels_kw = _pop_params(kw, self._add_auto_labels)
-        guide_kw = _pop_params(kw, self._update_guide)
+        edgefix_kw, labels_kw, guide_kw = _split_params(
+            kw, self._fix_patch_edges, self._add_auto_labels, self._update_guide
+        )
         with self._keep_grid_bools():
             m = self._plot_native('tripcolor', x, y, z, **kw)
         self._fix_patch_edges(m, **edgefix_kw, **kw)
@@ -4055,6 +4235,189 @@ class PlotAxes(base.Axes):
         self._update_guide(m, queue_colorbar=False, **guide_kw)
         return m
 
+    def update_data(self, obj, *args, autoscale=True, **kwargs):
+        """
+        Update the data of an existing plotted artist in-place. This is much faster
+        than clearing and re-plotting because the input parsing steps, colormap and
+        normalizer construction, and legend and colorbar generation are skipped.
+        Useful for animations and figures that are regularly refreshed.
+
+        Parameters
+        ----------
+        obj : artist or list of artists
+            The artist(s) returned by a plotting command. Supported artists are
+            `~matplotlib.lines.Line2D` (e.g. from `~PlotAxes.plot`),
+            `~matplotlib.collections.PathCollection` (from `~PlotAxes.scatter`),
+            `~matplotlib.collections.QuadMesh` and
+            `~matplotlib.collections.PolyCollection`
+            (from `~PlotAxes.pcolormesh` and `~PlotAxes.pcolor`),
+            `~matplotlib.image.AxesImage` (from `~PlotAxes.imshow`), and
+            `~matplotlib.contour.ContourSet` (from `~PlotAxes.contour`
+            and `~PlotAxes.contourf`).
+        *args : array-like
+            The new data. For lines and scatter plots this is ``y`` or ``x, y`` (if
+            ``y`` is 2D, each column is applied to successive artists in `obj`). For
+            scatter plots an additional ``c`` array of colormap values can be passed.
+            For artists drawn with e.g. `~PlotAxes.plotx` this is ``x`` or ``y, x``.
+            For pseudocolor plots and images this is ``z``. For contours this is
+            ``z`` (in which case the original coordinates are used) or ``x, y, z``.
+        autoscale : bool, default: True
+            Whether to update the data limits and auto-scale the axes. Ignored
+            for pseudocolor plots, images, and contours, whose coordinates
+            are unchanged.
+        **kwargs
+            Passed to the native contour command when `obj` is a contour set.
+
+        Returns
+        -------
+        artist or list of artists
+            The updated artist(s). This is a new artist only for contour sets, which
+            matplotlib cannot update in-place. The existing levels, colormap, and
+            normalizer are re-used and existing colorbars are pointed to the new
+            contour set. Any contour labels and contour edges are re-drawn.
+
+        Note
+        ----
+        Colormap values are normalized with the original `norm`, so any new values
+        outside of the original range are colored according to `extend`. Also, data
+        passed to geographic pseudocolor plots with ``globe=True`` or to basemap
+        pseudocolor plots that required longitude rolling cannot be updated in-place.
+
+        See also
+        --------
+        PlotAxes.plot
+        PlotAxes.scatter
+        PlotAxes.pcolormesh
+        PlotAxes.contourf
+        PlotAxes.imshow
+        """
+        # Update contour sets by re-drawing them with the existing levels and norm
+        # NOTE: ContourSet is a Collection in matplotlib >= 3.8 and otherwise manages
+        # a list of collections. Must remove these individually.
+        if isinstance(obj, mcontour.ContourSet):
+            if len(args) == 1:
+                x, y = getattr(obj, '_plot_coords', (None, None))
+                z, = args
+            elif len(args) == 3:
+                x, y, z = args
+            else:
+                raise ValueError(f'Expected 1 or 3 positional arguments. Got {len(args)}.')  # noqa: E501
+            if self._name == 'basemap':
+                kwargs.setdefault('latlon', True)
+            if self._name == 'cartopy':
+                import cartopy.crs as ccrs
+                kwargs.setdefault('transform', ccrs.PlateCarree())
+            x, y, z, kw = self._parse_2d_plot(x, y, z, autoformat=False, **kwargs)
+            native_kw, edgefix_kw, contour_kw, labels_kw = getattr(
+                obj, '_plot_kw', ({}, {}, {}, {})
+            )
+            kw = {**native_kw, **kw}  # e.g. linewidths, linestyles, zorder
+            kw.update(levels=obj.levels, cmap=obj.cmap, norm=obj.norm)
+            kw.update(extend=obj.extend, alpha=obj.alpha)
+            edges = getattr(obj, '_plot_edges', None)
+            name = 'contourf' if obj.filled else 'contour'
+            m = cm = self._plot_native(name, x, y, z, **kw)
+            m._legend_label = getattr(obj, '_legend_label', None)
+            m._plot_coords = getattr(obj, '_plot_coords', (None, None))
+            m._plot_kw = (native_kw, edgefix_kw, contour_kw, labels_kw)
+            if obj.filled:
+                self._fix_patch_edges(m, **edgefix_kw, **contour_kw)
+            if edges is not None:
+                cm = m._plot_edges = self._fix_contour_edges('contour', x, y, z, **kw, **contour_kw)  # noqa: E501
+            self._add_auto_labels(m, cm, **labels_kw)
+            cb = getattr(obj, 'colorbar', None)
+            if cb is not None:  # point existing colorbar to the new contour set
+                callbacks = getattr(m, 'callbacks', None) or m.callbacksSM
+                cb.mappable, m.colorbar = m, cb
+                m.colorbar_cid = callbacks.connect('changed', cb.update_normal)
+            for o in (obj, edges):
+                if o is None:
+                    continue
+                if _version_mpl >= '3.8':  # also removes labels
+                    o.remove()
+                    continue
+                for collection in o.collections:
+                    collection.remove()
+                for text in getattr(o, 'labelTexts', ()):
+                    text.remove()
+            return m
+
+        # Update pseudocolor plots and images using the existing coordinates
+        # NOTE: Here reshape to the existing array shape because older matplotlib
+        # versions store QuadMesh arrays as flattened 1D arrays.
+        if isinstance(obj, (mcollections.QuadMesh, mcollections.PolyCollection, mimage.AxesImage)):  # noqa: E501
+            if len(args) != 1:
+                raise ValueError(f'Expected 1 positional argument. Got {len(args)}.')
+            z = inputs._to_numpy_array(args[0], strip_units=True)
+            if isinstance(obj, mimage.AxesImage):
+                obj.set_data(z)
+            else:
+                shape = np.shape(obj.get_array())
+                if np.size(z) != np.prod(shape):
+                    raise ValueError(
+                        f'Input shape {z.shape} does not match '
+                        f'the existing array shape {shape}.'
+                    )
+                obj.set_array(np.reshape(z, shape))
+            if not obj.get_animated():  # see Figure.draw_data()
+                self.stale = True
+            return obj
+
+        # Update lines and scatter plots column-by-column
+        # NOTE: Here lists returned by e.g. plot() are unfurled and errorbars or
+        # shading paired with each line are skipped.
+        objs = obj if isinstance(obj, (list, tuple)) else (obj,)
+        objs = [o[-1] if isinstance(o, tuple) else o for o in objs]
+        if any(not isinstance(o, (mlines.Line2D, mcollections.PathCollection)) for o in objs):  # noqa: E501
+            raise TypeError(f'Cannot update the data of artist(s) {obj!r}.')
+        if not 1 <= len(args) <= 3:
+            raise ValueError(f'Expected 1 to 3 positional arguments. Got {len(args)}.')
+        if len(args) == 1:
+            x, y, c = None, args[0], None
+        else:
+            x, y, c, *_ = *args, None
+        args = tuple(inputs._to_numpy_array(a) if a is not None else a for a in (x, y, c))  # noqa: E501
+        for i, n, x, y, c, _ in self._iter_arg_cols(*args):
+            if i >= len(objs):
+                raise ValueError(f'Got {n} data columns but only {len(objs)} artists.')
+            o = objs[i]
+            vert = getattr(o, '_plot_vert', True)  # e.g. plotx() or scatterx()
+            if isinstance(o, mlines.Line2D):
+                if x is None:
+                    x = o.get_xdata() if vert else o.get_ydata()
+                o.set_data(*((x, y) if vert else (y, x)))
+            else:
+                if x is None:
+                    x = o.get_offsets()[:, 0 if vert else 1]
+                xy = np.broadcast_arrays(*((x, y) if vert else (y, x)))
+                o.set_offsets(np.column_stack(xy))
+                if c is not None:
+                    o.set_array(np.ravel(c))
+
+        # Update the data limits
+        # NOTE: Axes.relim() ignores collections so here we add their data limits
+        # manually, similar to Axes.add_collection().
+        # NOTE: Setting the view limits marks the figure as stale even if they are
+        # unchanged. For animated artists this would force Figure.draw_data() to
+        # redraw the background, so here the stale state is restored.
+        animated = all(o.get_animated() for o in objs)
+        stale = self.figure.stale
+        bounds = tuple(self.viewLim.bounds)
+        if autoscale:
+            self.relim()
+            for o in self.collections:
+                if not o.get_visible():
+                    continue
+                points = o.get_datalim(self.transData).get_points()
+                if np.isfinite(points).all():
+                    self.update_datalim(points)
+            self.autoscale_view()
+        if not animated:
+            self.stale = True
+        elif not stale and tuple(self.viewLim.bounds) == bounds:
+            self.stale = self.figure.stale = False
+        return obj
+
     def _iter_arg_pairs(self, *args):
         """
         Iterate over ``[x1,] y1, [fmt1,] [x2,] y2, [fmt2,] ...`` input.
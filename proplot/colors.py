@@ -629,7 +629,6 @@ def _standardize_colors(input, space, margin):
     """
     output = {}
     colors = []
-    channels = []
 
     # Always add these colors and ignore other colors that are too close
     # We do this for colors with nice names or that proplot devs really like
@@ -640,7 +639,6 @@ def _standardize_colors(input, space, margin):
         if 'grey' in name:
             name = name.replace('grey', 'gray')
         colors.append((name, color))
-        channels.append(to_xyz(color, space=space))
         output[name] = color  # required in case "kept" colors are close to each other
 
     # Translate remaining colors and remove bad names
@@ -654,12 +652,12 @@ def _standardize_colors(input, space, margin):
         if name in output:
             continue  # prioritize names that come first
         colors.append((name, color))  # category name pair
-        channels.append(to_xyz(color, space=space))
 
     # Get locations of "perceptually distinct" colors
-    channels = np.asarray(channels)
-    if not channels.size:
+    # NOTE: Colors are translated to the colorspace all at once.
+    if not colors:
         return output
+    channels = to_xyz([color for _, color in colors], space=space)
     channels = channels / np.array([360, 100, 100])
     channels = np.round(channels / margin).astype(np.int64)
     _, idxs = np.unique(channels, return_index=True, axis=0)
@@ -2969,6 +2967,7 @@ class ColormapDatabase(MutableMapping, dict):
     """
     _regex_grays = re.compile(r'\A(grays)(_r|_s)*\Z', flags=re.IGNORECASE)
     _regex_suffix = re.compile(r'(_r|_s)*\Z', flags=re.IGNORECASE)
+    _generation = 0  # incremented when colormaps are added or removed
 
     def __iter__(self):
         yield from dict.__iter__(self)
@@ -2979,6 +2978,7 @@ class ColormapDatabase(MutableMapping, dict):
     def __delitem__(self, key):
         key = self._parse_key(key, mirror=True)
         dict.__delitem__(self, key)
+        self._generation += 1
 
     def __init__(self, kwargs):
         """
@@ -3107,6 +3107,7 @@ class ColormapDatabase(MutableMapping, dict):
         key = self._translate_key(key, mirror=False)
         value = _translate_cmap(value)
         dict.__setitem__(self, key, value)
+        self._generation += 1
 
 
 # Initialize databases
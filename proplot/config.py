@@ -10,10 +10,15 @@ See the :ref:`configuration guide <ug_config>` for details.
 # Because I think it makes sense to have all the code that "runs" (i.e. not
 # just definitions) in the same place, and I was having issues with circular
 # dependencies and where import order of __init__.py was affecting behavior.
+import enum
+import hashlib
+import json
 import logging
 import os
+import pathlib
 import re
 import sys
+import tempfile
 from collections import namedtuple
 from collections.abc import MutableMapping
 from numbers import Real
@@ -49,6 +54,12 @@ except ImportError:
 # when when substituting dummy unavailable glyph due to fallback disabled.
 logging.getLogger('matplotlib.mathtext').setLevel(logging.ERROR)
 
+# Whether to skip registering the proplot fonts on import. This can be used
+# in environments that never use the fonts packaged with proplot.
+_skip_fonts = os.environ.get('PROPLOT_SKIP_FONTS', '').lower() not in (
+    '', '0', 'false', 'no', 'off'
+)
+
 __all__ = [
     'Configurator',
     'rc',
@@ -214,6 +225,204 @@ def _iter_data_objects(folder, *args, **kwargs):
             raise FileNotFoundError(f'Invalid file path {path!r}.')
 
 
+def _get_font_cache():
+    """
+    Return the matplotlib font cache path and the proplot font fingerprint path.
+    """
+    # NOTE: Previously, cache filename was specified as _fmcache variable, but
+    # recently became inaccessible. Must reproduce mpl code instead.
+    version = getattr(mfonts.FontManager, '__version__', None)
+    cache = os.path.join(mpl.get_cachedir(), f'fontlist-v{version}.json')
+    fingerprint = os.path.join(mpl.get_cachedir(), 'proplot-fontlist.json')
+    return cache, fingerprint
+
+
+def _get_file_mtimes(*paths, walk=True):
+    """
+    Return the names and modification times of the files and the files inside
+    the folders. Missing files have modification time ``None``. If `walk` is
+    ``False`` the modification times of the folders and their subfolders are used.
+    """
+    # NOTE: Folder modification times only change when entries are added, removed,
+    # or renamed directly inside them. So subfolders are recorded separately.
+    files = []
+    for path in paths:
+        path = os.path.expanduser(path)
+        names = []
+        if not os.path.isdir(path):
+            names.append(path)
+        else:
+            for dirname, dirnames, filenames in os.walk(path):
+                dirnames.sort()  # walk subfolders in consistent order
+                if walk:
+                    names.extend(os.path.join(dirname, _) for _ in sorted(filenames))
+                else:
+                    names.append(dirname)
+        for name in names:
+            try:
+                mtime = os.path.getmtime(name)
+            except OSError:
+                mtime = None
+            files.append((name, mtime))
+    return files
+
+
+def _get_font_fingerprint(paths, *args):
+    """
+    Return a fingerprint of the font files and the matplotlib font cache.
+    """
+    # NOTE: This uses folder and subfolder modification times rather than the
+    # times of each font file since it runs on every import. Adding, removing, or
+    # renaming font files, updating matplotlib, or rebuilding the cache resets it.
+    # Editing an existing font file in-place does not.
+    cache, _ = _get_font_cache()
+    return {
+        'matplotlib': mpl.__version__,
+        'fontmanager': getattr(mfonts.FontManager, '__version__', None),
+        'cache': _get_file_mtimes(cache),
+        'files': _get_file_mtimes(*paths, *args, walk=False),
+    }
+
+
+def _filter_fonts():
+    """
+    Remove ttc files and 'Thin' fonts from the font manager.
+    """
+    # NOTE: 'Thin' filter is ugly kludge but without this matplotlib picks up on
+    # Roboto thin ttf files installed on the RTD server when compiling docs.
+    def _keep_font(font):
+        return os.path.splitext(font.fname)[1] != '.ttc' and (
+            _version_mpl >= '3.3'
+            or 'Thin' not in os.path.basename(font.fname)
+        )
+    ttflist = mfonts.fontManager.ttflist
+    if not all(map(_keep_font, ttflist)):  # avoid rebuilding the list
+        mfonts.fontManager.ttflist = list(filter(_keep_font, ttflist))
+
+
+def _load_cache(path, key):
+    """
+    Return the data stored in the JSON cache file by `_dump_cache` or ``None``
+    if the file is missing, invalid, or was saved with a different key.
+    """
+    # NOTE: The key is passed through JSON so that e.g. tuples compare equal
+    # to the lists read from the file.
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or 'data' not in cache:
+        return None
+    if cache.get('key', None) != json.loads(json.dumps(key)):
+        return None
+    return cache['data']
+
+
+def _dump_cache(path, key, data):
+    """
+    Save the data and the key identifying its sources to a JSON cache file.
+    Failing to write the file is ignored.
+    """
+    # NOTE: Write to a temporary file and then move it into place so that
+    # concurrent sessions never load a partially written file.
+    tmp = None
+    prefix, _ = os.path.splitext(os.path.basename(path))
+    try:
+        with tempfile.NamedTemporaryFile(
+            'w', dir=os.path.dirname(path), prefix=prefix, delete=False
+        ) as f:
+            tmp = f.name
+            json.dump({'key': key, 'data': data}, f)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):  # e.g. read-only cache
+        if tmp is not None and os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _encode_setting(value):
+    """
+    Convert the setting value to JSON-compatible types. Raise an error for
+    unsupported types.
+    """
+    # NOTE: Values other than plain strings, numbers, and lists are stored as
+    # single-key dictionaries tagged with their type. Dictionaries are not used
+    # as setting values so there is no ambiguity.
+    if isinstance(value, enum.Enum):  # e.g. matplotlib JoinStyle and CapStyle
+        return {'enum': [type(value).__name__, _encode_setting(value.value)]}
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, list):
+        return [_encode_setting(item) for item in value]
+    if isinstance(value, tuple):
+        return {'tuple': [_encode_setting(item) for item in value]}
+    if isinstance(value, cycler.Cycler):
+        return {'cycler': [
+            {key: _encode_setting(item) for key, item in props.items()}
+            for props in value
+        ]}
+    if isinstance(value, os.PathLike):
+        return {'path': os.fspath(value)}
+    raise TypeError(f'Cannot encode setting {value!r}.')
+
+
+def _decode_setting(value):
+    """
+    Convert the output of `_encode_setting` back to the setting value.
+    """
+    # NOTE: Enumerations are only looked up in the matplotlib module that
+    # defines them so that the file cannot be used to construct other objects.
+    if isinstance(value, list):
+        return [_decode_setting(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    (tag, value), = value.items()
+    if tag == 'tuple':
+        return tuple(map(_decode_setting, value))
+    if tag == 'cycler':
+        props = [{key: _decode_setting(item) for key, item in _.items()} for _ in value]
+        keys = props[0].keys() if props else ()
+        return cycler.cycler(**{key: [_[key] for _ in props] for key in keys})
+    if tag == 'path':
+        return pathlib.Path(value)
+    if tag == 'enum':
+        from matplotlib import _enums
+        name, value = value
+        cls = getattr(_enums, name, None)
+        if isinstance(cls, type) and issubclass(cls, enum.Enum):
+            return cls(value)
+    raise ValueError(f'Cannot decode setting {value!r}.')
+
+
+def _load_xkcd_colors(path, space, margin):
+    """
+    Load and standardize the XKCD colors. The result is cached for the input
+    colorspace and margin until the color file or matplotlib version changes.
+    """
+    # NOTE: Standardizing converts every color to the input colorspace and can
+    # be a large fraction of the import time. Failing to write the cache just
+    # means we standardize again next time. This file is included in the sources
+    # because it defines the COLORS_KEEP names.
+    from . import colors as pcolors
+    cache = os.path.join(mpl.get_cachedir(), 'proplot-colors.json')
+    key = {
+        'matplotlib': mpl.__version__,
+        'sources': _get_file_mtimes(path, __file__, pcolors.__file__),
+        'space': space,
+        'margin': margin,
+    }
+    loaded = _load_cache(cache, key)
+    if isinstance(loaded, dict):
+        return loaded
+    loaded = pcolors._load_colors(path, warn_on_failure=True)
+    for name in COLORS_KEEP:
+        loaded[name] = pcolors._color_database[name]  # keep the same
+    loaded = pcolors._standardize_colors(loaded, space, margin)
+    loaded = {name: mcolors.to_hex(color) for name, color in loaded.items()}
+    _dump_cache(cache, key, loaded)
+    return loaded
+
+
 def _filter_style_dict(rcdict, warn=True):
     """
     Filter out blacklisted style parameters.
@@ -582,16 +791,15 @@ def register_colors(
     for i, path in _iter_data_objects(
         'colors', *paths, user=user, local=local, default=default
     ):
-        loaded = pcolors._load_colors(path, warn_on_failure=True)
+        cat, _ = os.path.splitext(os.path.basename(path))
+        if i == 0 and cat == 'xkcd':
+            loaded = _load_xkcd_colors(path, space, margin)
+        else:
+            loaded = pcolors._load_colors(path, warn_on_failure=True)
         if i == 0:
-            cat, _ = os.path.splitext(os.path.basename(path))
             if cat not in srcs:
                 raise RuntimeError(f'Unknown proplot color database {path!r}.')
             src = srcs[cat]
-            if cat == 'xkcd':
-                for key in COLORS_KEEP:
-                    loaded[key] = pcolors._color_database[key]  # keep the same
-                loaded = pcolors._standardize_colors(loaded, space, margin)
             src.clear()
             src.update(loaded)  # needed for demos.show_colors()
         pcolors._color_database.update(loaded)
@@ -627,6 +835,22 @@ def register_fonts(*args, user=True, local=True, default=False):
     paths_proplot = _get_data_folders(
         'fonts', user=user, local=local, default=default, reverse=True
     )
+
+    # Skip searching and rebuilding if nothing changed since the last call
+    # NOTE: The fingerprint is only written after fonts were successfully added
+    # to the font manager and the cache was written.
+    _, path_fingerprint = _get_font_cache()
+    fingerprint = _get_font_fingerprint(paths_proplot, *args)
+    try:
+        with open(path_fingerprint) as f:
+            fingerprint_cached = json.load(f)
+    except (OSError, ValueError):
+        fingerprint_cached = None
+    if fingerprint_cached == json.loads(json.dumps(fingerprint)):
+        _filter_fonts()
+        return
+
+    # Search for fonts
     fnames_proplot = set(mfonts.findSystemFonts(paths_proplot))
     for path in args:
         path = os.path.expanduser(path)
@@ -658,16 +882,11 @@ def register_fonts(*args, user=True, local=True, default=False):
         if hasattr(mfonts.fontManager, 'addfont'):
             # Newer API lets us add font files manually and deprecates TTFPATH. However
             # to cache fonts added this way, we must call json_dump explicitly.
-            # NOTE: Previously, cache filename was specified as _fmcache variable, but
-            # recently became inaccessible. Must reproduce mpl code instead.
             # NOTE: Older mpl versions used fontList.json as the cache, but these
             # versions also did not have 'addfont', so makes no difference.
             for fname in fnames_proplot:
                 mfonts.fontManager.addfont(fname)
-            cache = os.path.join(
-                mpl.get_cachedir(),
-                f'fontlist-v{mfonts.FontManager.__version__}.json'
-            )
+            cache, _ = _get_font_cache()
             mfonts.json_dump(mfonts.fontManager, cache)
         else:
             # Older API requires us to modify TTFPATH
@@ -682,17 +901,16 @@ def register_fonts(*args, user=True, local=True, default=False):
                 os.environ['TTFPATH'] += ':' + paths
             mfonts._rebuild()
 
-    # Remove ttc files and 'Thin' fonts *after* rebuild
-    # NOTE: 'Thin' filter is ugly kludge but without this matplotlib picks up on
-    # Roboto thin ttf files installed on the RTD server when compiling docs.
-    mfonts.fontManager.ttflist = [
-        font
-        for font in mfonts.fontManager.ttflist
-        if os.path.splitext(font.fname)[1] != '.ttc' and (
-            _version_mpl >= '3.3'
-            or 'Thin' not in os.path.basename(font.fname)
-        )
-    ]
+    # Remove ttc files and 'Thin' fonts *after* rebuild and save the fingerprint
+    # NOTE: The cache modification time changes after rebuilding so we have to
+    # recompute the fingerprint. Failing to write it just disables the fast path.
+    _filter_fonts()
+    fingerprint = _get_font_fingerprint(paths_proplot, *args)
+    try:
+        with open(path_fingerprint, 'w') as f:
+            json.dump(fingerprint, f)
+    except OSError:
+        pass
 
 
 class Configurator(MutableMapping, dict):
@@ -789,15 +1007,27 @@ class Configurator(MutableMapping, dict):
         kwargs = context.kwargs
         rc_new = context.rc_new  # used for context-based _get_item_context
         rc_old = context.rc_old  # used to re-apply settings without copying whole dict
+        rc_dicts = context.rc_dicts  # used to skip validation in nested blocks
+        # NOTE: Reuse settings validated by the enclosing context block, e.g. when
+        # Figure.format() formats each axes inside its own block. Settings are only
+        # skipped if the live value is unchanged, since they may have been modified
+        # inside the enclosing block (e.g. with rc[key] = value).
+        parent = self._context[-2] if len(self._context) > 1 else None
         for key, value in kwargs.items():
-            kw_proplot, kw_matplotlib = self._get_item_dicts(key, value)
+            if parent and key in parent.rc_dicts and parent.kwargs[key] is value:
+                kw_proplot, kw_matplotlib = parent.rc_dicts[key]
+            else:
+                kw_proplot, kw_matplotlib = self._get_item_dicts(key, value)
+            rc_dicts[key] = (kw_proplot, kw_matplotlib)
             for rc_dict, kw_new in zip(
                 (rc_proplot, rc_matplotlib),
                 (kw_proplot, kw_matplotlib),
             ):
                 for key, value in kw_new.items():
                     rc_old[key] = rc_dict[key]
-                    rc_new[key] = rc_dict[key] = value
+                    rc_new[key] = value
+                    if rc_old[key] is not value:
+                        rc_dict[key] = value
 
     def __exit__(self, *args):  # noqa: U100
         """
@@ -821,6 +1051,16 @@ class Configurator(MutableMapping, dict):
         # Always remove context objects
         self._context.clear()
 
+        # Restore the initial settings saved by a previous session
+        # NOTE: The snapshot is only saved after proplot is imported and all
+        # settings were validated (see __init__.py). It is only used when
+        # restoring the complete initial state. Settings with side effects outside
+        # of the dictionaries are re-applied after restoring.
+        self._snapshot = default and user and local and self._load_snapshot()
+        if self._snapshot:
+            config_inline_backend(rc_proplot['inlinefmt'])
+            return
+
         # Update from default settings
         # NOTE: see _remove_blacklisted_style_params bugfix
         if default:
@@ -849,6 +1089,102 @@ class Configurator(MutableMapping, dict):
                     continue
                 self.load(path)
 
+    @staticmethod
+    def _get_snapshot_key(style=None):
+        """
+        Return a key identifying the initial settings. This depends on the proplot
+        and matplotlib versions, the matplotlibrc and proplotrc files, the
+        stylesheet file referenced by the `style` setting, and the user and local
+        data files used to validate colors and colormaps.
+        """
+        def _get_hash(path):
+            try:
+                with open(path, 'rb') as f:
+                    return hashlib.sha1(f.read()).hexdigest()
+            except OSError:
+                return None
+        from . import __version__
+        paths = [
+            mpl.matplotlib_fname(),
+            Configurator.user_file(),
+            *Configurator.local_files(),
+        ]
+        if style is not None:  # see _get_style_dict()
+            folders = (mstyle.BASE_LIBRARY_PATH, *mstyle.USER_LIBRARY_PATHS)
+            files = [os.path.join(folder, style + '.mplstyle') for folder in folders]
+            paths.extend(path for path in files + [style] if os.path.isfile(path))
+        folders = [
+            path for folder in ('cmaps', 'cycles', 'colors')
+            for path in _get_data_folders(folder, default=False)
+        ]
+        return {
+            'proplot': __version__,
+            'matplotlib': mpl.__version__,
+            'sources': _get_file_mtimes(__file__, rcsetup.__file__),
+            'files': [(path, _get_hash(path)) for path in paths],
+            'folders': _get_file_mtimes(*folders),
+        }
+
+    @staticmethod
+    def _get_snapshot_path():
+        """
+        Return the path to the initial settings snapshot.
+        """
+        return os.path.join(mpl.get_cachedir(), 'proplot-rc.json')
+
+    def _load_snapshot(self):
+        """
+        Load the initial settings saved by `_save_snapshot`. Return whether the
+        snapshot was found and matches the current settings sources.
+        """
+        # NOTE: Values were validated before saving the snapshot so we bypass
+        # validation by updating the underlying dictionaries directly. The style
+        # is read from the snapshot since it determines which files are checked.
+        path = self._get_snapshot_path()
+        try:
+            with open(path) as f:
+                style = json.load(f)['data']['proplot']['style']
+        except Exception:
+            return False
+        snapshot = _load_cache(path, self._get_snapshot_key(style))
+        if snapshot is None:
+            return False
+        try:
+            kw_matplotlib, kw_proplot = (
+                {key: _decode_setting(value) for key, value in snapshot[name].items()}
+                for name in ('matplotlib', 'proplot')
+            )
+        except Exception:
+            return False
+        dict.update(rc_matplotlib, kw_matplotlib)
+        dict.update(rc_proplot, kw_proplot)
+        return True
+
+    def _save_snapshot(self):
+        """
+        Save the initial settings so that later sessions can skip loading and
+        validating the default and user settings.
+        """
+        # NOTE: Omit the backend because matplotlib uses a sentinel object for the
+        # default backend that is resolved when pyplot is imported. Settings that
+        # cannot be converted to JSON disable the snapshot.
+        rc = {
+            'matplotlib': {
+                key: value for key, value in dict.items(rc_matplotlib)
+                if key != 'backend'
+            },
+            'proplot': dict(dict.items(rc_proplot)),
+        }
+        try:
+            snapshot = {
+                name: {key: _encode_setting(value) for key, value in settings.items()}
+                for name, settings in rc.items()
+            }
+        except TypeError:
+            return
+        key = self._get_snapshot_key(rc_proplot['style'])
+        _dump_cache(self._get_snapshot_path(), key, snapshot)
+
     @staticmethod
     def _validate_key(key, value=None):
         """
@@ -1425,8 +1761,9 @@ class Configurator(MutableMapping, dict):
         # Activate context object
         if mode not in range(3):
             raise ValueError(f'Invalid mode {mode!r}.')
-        cls = namedtuple('RcContext', ('mode', 'kwargs', 'rc_new', 'rc_old'))
-        context = cls(mode=mode, kwargs=kwargs, rc_new={}, rc_old={})
+        fields = ('mode', 'kwargs', 'rc_new', 'rc_old', 'rc_dicts')
+        cls = namedtuple('RcContext', fields)
+        context = cls(mode=mode, kwargs=kwargs, rc_new={}, rc_old={}, rc_dicts={})
         self._context.append(context)
         return self
 
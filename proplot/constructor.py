@@ -13,6 +13,7 @@ The constructor functions used to build class instances from simple shorthand ar
 import copy
 import os
 import re
+import sys
 from functools import partial
 from numbers import Number
 
@@ -25,7 +26,6 @@ import matplotlib.ticker as mticker
 import numpy as np
 
 from . import colors as pcolors
-from . import proj as pproj
 from . import scale as pscale
 from . import ticker as pticker
 from .config import rc
@@ -33,17 +33,6 @@ from .internals import ic  # noqa: F401
 from .internals import _not_none, _pop_props, _version_cartopy, _version_mpl, warnings
 from .utils import get_colors, to_hex, to_rgba
 
-try:
-    from mpl_toolkits.basemap import Basemap
-except ImportError:
-    Basemap = object
-try:
-    import cartopy.crs as ccrs
-    from cartopy.crs import Projection
-except ModuleNotFoundError:
-    ccrs = None
-    Projection = object
-
 __all__ = [
     'Proj',
     'Locator',
@@ -227,75 +216,59 @@ PROJ_DEFAULTS = {
         'lon_1': 0, 'lon_2': 0, 'width': 10000e3, 'height': 10000e3
     },
 }
-if ccrs is None:
-    PROJS = {}
-else:
-    PROJS = {
-        'aitoff': pproj.Aitoff,
-        'hammer': pproj.Hammer,
-        'kav7': pproj.KavrayskiyVII,
-        'wintri': pproj.WinkelTripel,
-        'npgnom': pproj.NorthPolarGnomonic,
-        'spgnom': pproj.SouthPolarGnomonic,
-        'npaeqd': pproj.NorthPolarAzimuthalEquidistant,
-        'spaeqd': pproj.SouthPolarAzimuthalEquidistant,
-        'nplaea': pproj.NorthPolarLambertAzimuthalEqualArea,
-        'splaea': pproj.SouthPolarLambertAzimuthalEqualArea,
-    }
-    PROJS_MISSING = {
-        'aea': 'AlbersEqualArea',
-        'aeqd': 'AzimuthalEquidistant',
-        'cyl': 'PlateCarree',  # only basemap name not matching PROJ
-        'eck1': 'EckertI',
-        'eck2': 'EckertII',
-        'eck3': 'EckertIII',
-        'eck4': 'EckertIV',
-        'eck5': 'EckertV',
-        'eck6': 'EckertVI',
-        'eqc': 'PlateCarree',  # actual PROJ name
-        'eqdc': 'EquidistantConic',
-        'eqearth': 'EqualEarth',  # better looking Robinson; not in basemap
-        'euro': 'EuroPP',  # Europe; not in basemap or PROJ
-        'geos': 'Geostationary',
-        'gnom': 'Gnomonic',
-        'igh': 'InterruptedGoodeHomolosine',  # not in basemap
-        'laea': 'LambertAzimuthalEqualArea',
-        'lcc': 'LambertConformal',
-        'lcyl': 'LambertCylindrical',  # not in basemap or PROJ
-        'merc': 'Mercator',
-        'mill': 'Miller',
-        'moll': 'Mollweide',
-        'npstere': 'NorthPolarStereo',  # np/sp stuff not in PROJ
-        'nsper': 'NearsidePerspective',
-        'ortho': 'Orthographic',
-        'osgb': 'OSGB',  # UK; not in basemap or PROJ
-        'osni': 'OSNI',  # Ireland; not in basemap or PROJ
-        'pcarree': 'PlateCarree',  # common alternate name
-        'robin': 'Robinson',
-        'rotpole': 'RotatedPole',
-        'sinu': 'Sinusoidal',
-        'spstere': 'SouthPolarStereo',
-        'stere': 'Stereographic',
-        'tmerc': 'TransverseMercator',
-        'utm': 'UTM',  # not in basemap
-    }
-    for _key, _cls in tuple(PROJS_MISSING.items()):
-        if hasattr(ccrs, _cls):
-            PROJS[_key] = getattr(ccrs, _cls)
-            del PROJS_MISSING[_key]
-    if PROJS_MISSING:
-        warnings._warn_proplot(
-            'The following cartopy projection(s) are unavailable: '
-            + ', '.join(map(repr, PROJS_MISSING))
-            + ' . Please consider updating cartopy.'
-        )
-    PROJS_TABLE = (
-        'The known cartopy projection classes are:\n'
-        + '\n'.join(
-            ' ' + key + ' ' * (max(map(len, PROJS)) - len(key) + 10) + cls.__name__
-            for key, cls in PROJS.items()
-        )
-    )
+# Cartopy projection registry
+# NOTE: Cartopy is slow to import so the registry is filled when cartopy
+# projections are first requested (see _load_cartopy).
+PROJS = {}
+PROJS_PROPLOT = {
+    'aitoff': 'Aitoff',
+    'hammer': 'Hammer',
+    'kav7': 'KavrayskiyVII',
+    'wintri': 'WinkelTripel',
+    'npgnom': 'NorthPolarGnomonic',
+    'spgnom': 'SouthPolarGnomonic',
+    'npaeqd': 'NorthPolarAzimuthalEquidistant',
+    'spaeqd': 'SouthPolarAzimuthalEquidistant',
+    'nplaea': 'NorthPolarLambertAzimuthalEqualArea',
+    'splaea': 'SouthPolarLambertAzimuthalEqualArea',
+}
+PROJS_MISSING = {
+    'aea': 'AlbersEqualArea',
+    'aeqd': 'AzimuthalEquidistant',
+    'cyl': 'PlateCarree',  # only basemap name not matching PROJ
+    'eck1': 'EckertI',
+    'eck2': 'EckertII',
+    'eck3': 'EckertIII',
+    'eck4': 'EckertIV',
+    'eck5': 'EckertV',
+    'eck6': 'EckertVI',
+    'eqc': 'PlateCarree',  # actual PROJ name
+    'eqdc': 'EquidistantConic',
+    'eqearth': 'EqualEarth',  # better looking Robinson; not in basemap
+    'euro': 'EuroPP',  # Europe; not in basemap or PROJ
+    'geos': 'Geostationary',
+    'gnom': 'Gnomonic',
+    'igh': 'InterruptedGoodeHomolosine',  # not in basemap
+    'laea': 'LambertAzimuthalEqualArea',
+    'lcc': 'LambertConformal',
+    'lcyl': 'LambertCylindrical',  # not in basemap or PROJ
+    'merc': 'Mercator',
+    'mill': 'Miller',
+    'moll': 'Mollweide',
+    'npstere': 'NorthPolarStereo',  # np/sp stuff not in PROJ
+    'nsper': 'NearsidePerspective',
+    'ortho': 'Orthographic',
+    'osgb': 'OSGB',  # UK; not in basemap or PROJ
+    'osni': 'OSNI',  # Ireland; not in basemap or PROJ
+    'pcarree': 'PlateCarree',  # common alternate name
+    'robin': 'Robinson',
+    'rotpole': 'RotatedPole',
+    'sinu': 'Sinusoidal',
+    'spstere': 'SouthPolarStereo',
+    'stere': 'Stereographic',
+    'tmerc': 'TransverseMercator',
+    'utm': 'UTM',  # not in basemap
+}
 
 # Geographic feature properties
 FEATURES_CARTOPY = {  # positional arguments passed to NaturalEarthFeature
@@ -333,6 +306,60 @@ RESOS_BASEMAP = {
 }
 
 
+def _is_cartopy(obj, name='Projection'):
+    """
+    Return whether the object is an instance of the cartopy coordinate reference
+    system class `name`. Cartopy is only imported when cartopy projections are
+    requested or by the user, so nothing else can be a cartopy instance.
+    """
+    module = sys.modules.get('cartopy.crs', None)
+    return module is not None and isinstance(obj, getattr(module, name))
+
+
+def _load_cartopy():
+    """
+    Import cartopy and register the cartopy projections, formatters, and axes.
+    """
+    # NOTE: Cartopy is slow to import so it is imported here when cartopy projections
+    # are first requested rather than when proplot is imported. The proplot formatter
+    # and axes subclasses with the corresponding cartopy base classes are then
+    # created and registered in place of the classes without cartopy base classes.
+    if PROJS:
+        return
+    import cartopy.crs as ccrs
+    from . import proj as pproj
+    from .axes import geo as pgeo  # avoid circular imports
+    pgeo._load_cartopy()
+    if _version_cartopy >= '0.18':
+        for key, cls in (
+            ('dms', pticker.DegreeFormatter),
+            ('dmslon', pticker.LongitudeFormatter),
+            ('dmslat', pticker.LatitudeFormatter),
+        ):
+            FORMATTERS[key] = partial(pticker._CARTOPY_FORMATTERS[cls], dms=True)
+    projs = {key: getattr(pproj, cls) for key, cls in PROJS_PROPLOT.items()}
+    for key, cls in tuple(PROJS_MISSING.items()):
+        if hasattr(ccrs, cls):
+            projs[key] = getattr(ccrs, cls)
+            del PROJS_MISSING[key]
+    if PROJS_MISSING:
+        warnings._warn_proplot(
+            'The following cartopy projection(s) are unavailable: '
+            + ', '.join(map(repr, PROJS_MISSING))
+            + ' . Please consider updating cartopy.'
+        )
+    PROJS.update(projs)
+
+
+def _is_basemap(obj):
+    """
+    Return whether the object is a basemap instance. Basemap is only imported when
+    basemap projections are requested, so nothing else can be a basemap instance.
+    """
+    module = sys.modules.get('mpl_toolkits.basemap', None)
+    return module is not None and isinstance(obj, module.Basemap)
+
+
 def _modify_colormap(cmap, *, cut, left, right, reverse, shift, alpha, samples):
     """
     Modify colormap using a variety of methods.
@@ -823,8 +850,13 @@ markeredgecolors, markerfacecolors
         kwargs['default_luminance'] = DEFAULT_CYCLE_LUMINANCE
         cmap = Colormap(*args, name=name, samples=samples, **kwargs)
         name = _not_none(name, cmap.name)
-        dict_ = {'color': [c if isinstance(c, str) else to_hex(c) for c in cmap.colors]}
-        dicts = (dict_,)
+        colors = list(cmap.colors)  # convert non-string colors all at once
+        idxs = [i for i, color in enumerate(colors) if not isinstance(color, str)]
+        if idxs:
+            hexs = to_hex([colors[i] for i in idxs]).tolist()
+            for i, color in zip(idxs, hexs):
+                colors[i] = color
+        dicts = ({'color': colors},)
 
     # Update the cyler property
     dicts = dicts + (props,)
@@ -1429,8 +1461,8 @@ def Proj(
     lat0 = _not_none(lat0=lat0, lat_0=lat_0)
     lonlim = _not_none(lonlim, default=(None, None))
     latlim = _not_none(latlim, default=(None, None))
-    is_crs = Projection is not object and isinstance(name, Projection)
-    is_basemap = Basemap is not object and isinstance(name, Basemap)
+    is_crs = _is_cartopy(name)
+    is_basemap = _is_basemap(name)
     include_axes = kwargs.pop('include_axes', False)  # for error message
     if backend is not None and backend not in ('cartopy', 'basemap'):
         raise ValueError(
@@ -1459,6 +1491,8 @@ def Proj(
 
     # Projection instances
     if is_crs or is_basemap:
+        if is_crs:
+            _load_cartopy()  # register the cartopy axes
         if backend is not None:
             kwargs['backend'] = backend
         if kwargs:
@@ -1470,7 +1504,7 @@ def Proj(
     # NOTE: Error message matches basemap invalid projection message
     elif backend == 'cartopy':
         # Parse keywoard arguments
-        import cartopy  # ensure present  # noqa: F401
+        _load_cartopy()  # ensure present
         for key in ('round', 'boundinglat'):
             value = kwargs.pop(key, None)
             if value is not None:
@@ -1509,7 +1543,7 @@ def Proj(
     # on initialization and controls *all* features.
     else:
         # Parse input arguments
-        from mpl_toolkits import basemap  # ensure present  # noqa: F401
+        from mpl_toolkits.basemap import Basemap  # ensure present
         if name in ('eqc', 'pcarree'):
             name = 'cyl'  # PROJ package aliases
         defaults = {'fix_aspect': True, **PROJ_DEFAULTS.get(name, {})}
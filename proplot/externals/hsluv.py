@@ -11,6 +11,9 @@ Utilities for converting between colorspaces. Includes the following:
 * `hpluv_to_rgb`
 * `rgb_to_hpluv`
 
+Vectorized versions of these functions that accept and return arrays of shape
+``(N, 3)`` are also included with the suffix ``_array`` (e.g. `hcl_to_rgb_array`).
+
 Note
 ----
 This file is adapted from `seaborn
@@ -28,6 +31,8 @@ and the `HSLuv system <http://www.hsluv.org/implementations/>`__.
 import math
 from colorsys import hls_to_rgb, rgb_to_hls
 
+import numpy as np
+
 # Coefficients or something
 m = [
     [3.2406, -1.5372, -0.4986],
@@ -336,3 +341,216 @@ def CIEluv_to_CIExyz(triple):
     X = 0.0 - (9.0 * Y * varU) / ((varU - 4.0) * varV - varU * varV)
     Z = (9.0 * Y - (15.0 * varV * Y) - (varV * X)) / (3.0 * varV)
     return [X, Y, Z]
+
+
+# Vectorized conversions. These operate on arrays of shape (N, 3) and give the
+# same results as the above scalar conversions (including black and white).
+def _channels(array):
+    array = np.asarray(array, dtype=float)
+    if array.ndim != 2 or array.shape[1] != 3:
+        raise ValueError(f'Invalid channel array with shape {array.shape}.')
+    return array[:, 0], array[:, 1], array[:, 2]
+
+
+def hsluv_to_rgb_array(array):
+    return lchuv_to_rgb_array(hsluv_to_lchuv_array(array))
+
+
+def rgb_to_hsluv_array(array):
+    return lchuv_to_hsluv_array(rgb_to_lchuv_array(array))
+
+
+def hpluv_to_rgb_array(array):
+    return lchuv_to_rgb_array(hpluv_to_lchuv_array(array))
+
+
+def rgb_to_hpluv_array(array):
+    return lchuv_to_hpluv_array(rgb_to_lchuv_array(array))
+
+
+def lchuv_to_rgb_array(array):
+    return CIExyz_to_rgb_array(CIEluv_to_CIExyz_array(lchuv_to_CIEluv_array(array)))
+
+
+def rgb_to_lchuv_array(array):
+    return CIEluv_to_lchuv_array(CIExyz_to_CIEluv_array(rgb_to_CIExyz_array(array)))
+
+
+def hcl_to_rgb_array(array):
+    return lchuv_to_rgb_array(np.asarray(array, dtype=float)[:, ::-1])
+
+
+def rgb_to_hcl_array(array):
+    return rgb_to_lchuv_array(array)[:, ::-1]
+
+
+def hsl_to_rgb_array(array):
+    h, s, l = _channels(array)  # noqa: E741
+    h, s, l = h / 360.0, s / 100.0, l / 100.0  # noqa: E741
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - l * s)
+    m1 = 2.0 * l - m2
+    def _value(hue):  # noqa: E306
+        hue = hue % 1.0
+        return np.select(
+            (hue < 1.0 / 6.0, hue < 0.5, hue < 2.0 / 3.0),
+            (m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (2.0 / 3.0 - hue) * 6.0),
+            m1,
+        )
+    rgb = np.column_stack((_value(h + 1.0 / 3.0), _value(h), _value(h - 1.0 / 3.0)))
+    gray = s == 0.0
+    rgb[gray] = l[gray, None]
+    return rgb
+
+
+def rgb_to_hsl_array(array):
+    r, g, b = _channels(array)
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0  # noqa: E741
+    gray = minc == maxc
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(l <= 0.5, rangec / sumc, rangec / (2.0 - sumc))
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = (h / 6.0) % 1.0
+    h[gray] = s[gray] = 0.0
+    return np.column_stack((h * 360.0, s * 100.0, l * 100.0))
+
+
+def max_chroma_array(L, H):
+    hrad = np.radians(H)
+    sinH = np.sin(hrad)
+    cosH = np.cos(hrad)
+    sub1 = (L + 16) ** 3.0 / 1560896.0
+    sub2 = np.where(sub1 > 0.008856, sub1, L / 903.3)
+    result = np.full(np.shape(L), np.inf)
+    for m1, m2, m3 in m:
+        top = (0.99915 * m1 + 1.05122 * m2 + 1.14460 * m3) * sub2
+        rbottom = 0.86330 * m3 - 0.17266 * m2
+        lbottom = 0.12949 * m3 - 0.38848 * m1
+        bottom = (rbottom * sinH + lbottom * cosH) * sub2
+        for t in (0.0, 1.0):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                C = L * (top - 1.05122 * t) / (bottom + 0.17266 * sinH * t)
+            mask = (C > 0.0) & (C < result)
+            result[mask] = C[mask]
+    return result
+
+
+def max_chroma_pastel_array(L):
+    lhs = (L ** 3.0 + 48.0 * L ** 2.0 + 768.0 * L + 4096.0) / 1560896.0
+    rhs = 1107.0 / 125000.0
+    sub = np.where(lhs > rhs, lhs, 10.0 * L / 9033.0)
+    chroma = np.full(np.shape(L), np.inf)
+    for m1, m2, m3 in m:
+        for limit in (0.0, 1.0):
+            top = -3015466475.0 * m3 * sub + 603093295.0 * m2 * sub \
+                - 603093295.0 * limit
+            bottom = 1356959916.0 * m1 * sub - 452319972.0 * m3 * sub
+            hrad = np.arctan2(top, bottom)
+            if limit == 0.0:
+                hrad += math.pi
+            test = max_chroma_array(L, np.degrees(hrad))
+            mask = test < chroma
+            chroma[mask] = test[mask]
+    return chroma
+
+
+def _hsluv_to_lchuv_array(array, pastel=False):
+    H, S, L = _channels(array)
+    mx = max_chroma_pastel_array(L) if pastel else max_chroma_array(L, H)
+    with np.errstate(invalid='ignore'):
+        C = mx * S / 100.0
+    white, black = L > 99.9999999, L < 0.00000001
+    L = np.where(white, 100.0, np.where(black, 0.0, L))
+    C = np.where(white | black, 0.0, C)
+    return np.column_stack((L, C, H))
+
+
+def _lchuv_to_hsluv_array(array, pastel=False):
+    L, C, H = _channels(array)
+    mx = max_chroma_pastel_array(L) if pastel else max_chroma_array(L, H)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        S = 100.0 * C / mx
+    white, black = L > 99.9999999, L < 0.00000001
+    L = np.where(white, 100.0, np.where(black, 0.0, L))
+    S = np.where(white | black, 0.0, S)
+    return np.column_stack((H, S, L))
+
+
+def hsluv_to_lchuv_array(array):
+    return _hsluv_to_lchuv_array(array)
+
+
+def lchuv_to_hsluv_array(array):
+    return _lchuv_to_hsluv_array(array)
+
+
+def hpluv_to_lchuv_array(array):
+    return _hsluv_to_lchuv_array(array, pastel=True)
+
+
+def lchuv_to_hpluv_array(array):
+    return _lchuv_to_hsluv_array(array, pastel=True)
+
+
+def CIExyz_to_rgb_array(array):
+    rgbl = np.asarray(array, dtype=float) @ np.array(m).T
+    nonlinear = 1.055 * np.power(np.maximum(rgbl, 0.0), 1.0 / 2.4) - 0.055
+    return np.where(rgbl <= 0.0031308, 12.92 * rgbl, nonlinear)
+
+
+def rgb_to_CIExyz_array(array):
+    rgb = np.asarray(array, dtype=float)
+    a = 0.055
+    linear = np.power((np.maximum(rgb, 0.0) + a) / (1.0 + a), 2.4)
+    rgbl = np.where(rgb > 0.04045, linear, rgb / 12.92)
+    return rgbl @ np.array(m_inv).T
+
+
+def CIEluv_to_lchuv_array(array):
+    L, U, V = _channels(array)
+    C = np.hypot(U, V)
+    H = np.degrees(np.arctan2(V, U))
+    H = np.where(H < 0.0, 360.0 + H, H)
+    return np.column_stack((L, C, H))
+
+
+def lchuv_to_CIEluv_array(array):
+    L, C, H = _channels(array)
+    Hrad = np.radians(H)
+    return np.column_stack((L, np.cos(Hrad) * C, np.sin(Hrad) * C))
+
+
+def CIExyz_to_CIEluv_array(array):
+    X, Y, Z = _channels(array)
+    t = Y / refY
+    with np.errstate(divide='ignore', invalid='ignore'):
+        denom = X + 15.0 * Y + 3.0 * Z
+        varU = 4.0 * X / denom
+        varV = 9.0 * Y / denom
+        L = 116.0 * np.where(t > lab_e, np.cbrt(t), 7.787 * t + 16.0 / 116.0) - 16.0
+    U = 13.0 * L * (varU - refU)
+    V = 13.0 * L * (varV - refV)
+    luv = np.column_stack((L, U, V))
+    luv[((X == 0.0) & (Y == 0.0) & (Z == 0.0)) | (L == 0.0)] = 0.0
+    return luv
+
+
+def CIEluv_to_CIExyz_array(array):
+    L, U, V = _channels(array)
+    t = (L + 16.0) / 116.0
+    varY = np.where(t ** 3.0 > lab_e, t ** gamma, (116.0 * t - 16.0) / lab_k)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        varU = U / (13.0 * L) + refU
+        varV = V / (13.0 * L) + refV
+        Y = varY * refY
+        X = 0.0 - (9.0 * Y * varU) / ((varU - 4.0) * varV - varU * varV)
+        Z = (9.0 * Y - (15.0 * varV * Y) - (varV * X)) / (3.0 * varV)
+    xyz = np.column_stack((X, Y, Z))
+    xyz[L == 0] = 0.0
+    return xyz
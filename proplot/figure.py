@@ -3,8 +3,10 @@
 The figure class used for all proplot figures.
 """
 import functools
+import importlib.util
 import inspect
 import os
+import weakref
 from numbers import Integral
 
 import matplotlib.axes as maxes
@@ -25,8 +27,10 @@ from .internals import (
     _pop_params,
     _pop_rc,
     _translate_loc,
+    _version_cartopy,
     context,
     docstring,
+    guides,
     labels,
     warnings,
 )
@@ -118,6 +122,15 @@ alignx, aligny, align : bool or {0, 1}, default: :rc:`subplots.align`
 <https://matplotlib.org/stable/gallery/subplots_axes_and_figures/align_labels_demo.html>`__
     for the *x* axis, *y* axis, or both axes. Aligned labels always appear in the same
     row or column. This is ignored if `spanx`, `spany`, or `span` are ``True``.
+sharecolorbars : bool, default: False
+    Whether to replace outer colorbars on the same side of different subplots with
+    a single figure colorbar spanning the subplot rows or columns when the colorbar
+    mappables have identical colormaps, normalizers, levels, and `extend` settings.
+    This applies to colorbars drawn by plotting commands (e.g. with
+    ``ax.pcolor(data, colorbar='r')``) and colorbars drawn with
+    `~proplot.axes.Axes.colorbar`, which are queued rather than drawn when this
+    is ``True``. Colorbars with different settings (e.g. `ticks` or `formatter`)
+    are not merged. The figure colorbar is registered with each subplot.
 %(gridspec.shared)s
 %(gridspec.scalar)s
 tight : bool, default: :rc`subplots.tight`
@@ -388,8 +401,16 @@ Save the figure.
 
 Parameters
 ----------
-path : path-like, optional
-    The file path. User paths are expanded with `os.path.expanduser`.
+path : path-like or sequence of path-like, optional
+    The file path. User paths are expanded with `os.path.expanduser`. If a
+    sequence is passed, the figure layout is adjusted only once and the figure
+    is saved to each path. This is faster than saving successively.
+formats : str or sequence of str, optional
+    The file format(s). If passed, the figure is saved once for each format
+    using `path` with the file extension replaced by the format name. For
+    example, ``fig.save('out', formats=('png', 'pdf'))`` saves ``out.png`` and
+    ``out.pdf`` with a single layout adjustment. Cannot be used with
+    file-like objects.
 **kwargs
     Passed to `~matplotlib.figure.Figure.savefig`
 
@@ -460,7 +481,8 @@ def _add_canvas_preprocessor(canvas, method, cache=False):
         ctx2 = fig._context_authorized()  # skip backend set_constrained_layout()
         ctx3 = rc.context(fig._render_context)  # draw with figure-specific setting
         with ctx1, ctx2, ctx3:
-            fig.auto_layout()
+            if not fig._is_frozen:  # see Figure.savefig()
+                fig.auto_layout()
             return func(self, *args, **kwargs)
 
     # Add preprocessor
@@ -520,7 +542,7 @@ class Figure(mfigure.Figure):
         figwidth=None, figheight=None, width=None, height=None, journal=None,
         sharex=None, sharey=None, share=None,  # used for default spaces
         spanx=None, spany=None, span=None,
-        alignx=None, aligny=None, align=None,
+        alignx=None, aligny=None, align=None, sharecolorbars=None,
         left=None, right=None, top=None, bottom=None,
         wspace=None, hspace=None, space=None,
         tight=None, outerpad=None, innerpad=None, panelpad=None,
@@ -694,6 +716,7 @@ class Figure(mfigure.Figure):
         aligny = _not_none(aligny, align, rc['subplots.align'])
         self._alignx = bool(alignx)
         self._aligny = bool(aligny)
+        self._sharecolorbars = bool(sharecolorbars)
 
         # Initialize the figure
         # NOTE: Super labels are stored inside {axes: text} dictionaries
@@ -703,8 +726,12 @@ class Figure(mfigure.Figure):
         self._subplot_counter = 0  # avoid add_subplot() returning an existing subplot
         self._is_adjusting = False
         self._is_authorized = False
+        self._is_frozen = False
         self._includepanels = None
         self._render_context = {}
+        self._blit_cache = None  # see draw_data()
+        self._legend_index = weakref.WeakKeyDictionary()  # see Axes._get_legend_index()
+        self._range_cache = {}  # see _get_subplot_ranges()
         rc_kw, rc_mode = _pop_rc(kwargs)
         kw_format = _pop_params(kwargs, self._format_signature)
         with self._context_authorized():
@@ -798,8 +825,8 @@ class Figure(mfigure.Figure):
             name is None
             and backend is None
             and isinstance(proj, str)
-            and constructor.Projection is object
-            and constructor.Basemap is object
+            and importlib.util.find_spec('cartopy') is None
+            and importlib.util.find_spec('mpl_toolkits.basemap') is None
         ):
             raise ValueError(
                 f'Invalid projection name {proj!r}. If you are trying to generate a '
@@ -814,6 +841,8 @@ class Figure(mfigure.Figure):
             name = proj._proj_backend
             kwargs['map_projection'] = proj
 
+        if name == 'cartopy':  # add the cartopy base class before instantiating
+            constructor._load_cartopy()
         kwargs['projection'] = 'proplot_' + name
         return kwargs
 
@@ -882,6 +911,25 @@ class Figure(mfigure.Figure):
             pad = pad / width if side in ('left', 'right') else pad / height
         return min(cs) - pad if side in ('left', 'bottom') else max(cs) + pad
 
+    def _get_subplot_ranges(self, panels=False):
+        """
+        Return the visible subplots and panels and an integer array of their
+        ``(row1, row2, col1, col2)`` gridspec ranges. Used to quickly find groups
+        of axes for axis sharing and spanning labels.
+        """
+        # NOTE: The cache is reset whenever subplots or panels are added (which
+        # may renumber every subplotspec), removed, hidden, or made invisible.
+        cache = self._range_cache.get(panels, None)
+        if cache is None:
+            axs = list(self._iter_axes(hidden=False, children=False, panels=panels))
+            ranges = [
+                (*ax._range_subplotspec('y'), *ax._range_subplotspec('x'))
+                for ax in axs
+            ]
+            ranges = np.array(ranges, dtype=int).reshape((-1, 4))
+            cache = self._range_cache[panels] = (axs, ranges)
+        return cache
+
     def _get_renderer(self):
         """
         Get a renderer at all costs. See matplotlib's tight_layout.py.
@@ -936,6 +984,7 @@ class Figure(mfigure.Figure):
         pax._panel_share = share
         pax._panel_parent = ax
         ax._panel_dict[side].append(pax)
+        self._range_cache.clear()  # see _get_subplot_ranges()
         ax._apply_auto_share()
         axis = pax.yaxis if side in ('left', 'right') else pax.xaxis
         getattr(axis, 'tick_' + side)()  # set tick and tick label position
@@ -971,11 +1020,73 @@ class Figure(mfigure.Figure):
         pax = self.add_subplot(ss, autoshare=False, number=False)
         plist = self._panel_dict[side]
         plist.append(pax)
+        self._range_cache.clear()  # see _get_subplot_ranges()
         pax._panel_side = side
         pax._panel_share = False
         pax._panel_parent = None
         return pax
 
+    def _add_shared_colorbars(self):
+        """
+        Replace queued outer subplot colorbars that have identical mappable
+        properties with figure colorbars spanning the subplot rows or columns.
+        """
+        # Group the queued colorbars
+        # NOTE: Here the span indices start at '1' and ignore panel slots. This
+        # is consistent with the 'span' argument passed to colorbar().
+        groups = {}
+        for ax in self._iter_axes(hidden=False, children=False, panels=False):
+            for (loc, align), colorbar in ax._colorbar_dict.items():
+                if loc not in ('left', 'right', 'top', 'bottom'):
+                    continue
+                if not isinstance(colorbar, tuple):
+                    continue
+                key = guides._get_colorbar_key(*colorbar)
+                if key is not None:
+                    groups.setdefault((loc, align, key), []).append(ax)
+
+        # Split the groups into contiguous runs of subplots
+        # NOTE: Here rows or columns occupied by subplots outside of the group break
+        # up the run. Otherwise e.g. a colorbar shared by the first and third rows
+        # would also sit next to the second row and its own different colorbar.
+        def _get_span(ax, loc):
+            ss = ax.get_subplotspec().get_topmost_subplotspec()
+            _, ncols, num1, num2 = ss._get_geometry()
+            if loc in ('left', 'right'):
+                return range(num1 // ncols + 1, num2 // ncols + 2)
+            else:
+                return range(num1 % ncols + 1, num2 % ncols + 2)
+        axes = list(self._iter_axes(hidden=False, children=False, panels=False))
+        runs = {}
+        for (loc, align, key), axs in groups.items():
+            if len(axs) < 2:
+                continue
+            slots = {}
+            for ax in axes:
+                for idx in _get_span(ax, loc):
+                    slots.setdefault(idx, set()).add(ax in axs)
+            for ax in axs:
+                span = _get_span(ax, loc)
+                if any(slots[idx] != {True} for idx in span):
+                    continue
+                start = span.start
+                while slots.get(start - 1) == {True}:
+                    start -= 1
+                runs.setdefault((loc, align, key, start), []).append(ax)
+
+        # Draw the figure colorbars
+        for (loc, align, *_), axs in runs.items():
+            if len(axs) < 2:
+                continue
+            spans = [_get_span(ax, loc) for ax in axs]
+            span = (min(_.start for _ in spans), max(_.stop for _ in spans) - 1)
+            mappable, values, kwargs = axs[0]._colorbar_dict[(loc, align)]
+            kwargs = kwargs.copy()
+            kwargs.pop('align', None)
+            cb = self.colorbar(mappable, values, loc=loc, span=span, **kwargs)
+            for ax in axs:
+                ax._colorbar_dict[(loc, align)] = cb
+
     def _add_subplot(self, *args, **kwargs):
         """
         The driver function for adding single subplots.
@@ -1061,6 +1172,7 @@ class Figure(mfigure.Figure):
         ax = super().add_subplot(ss, _subplot_spec=ss, **kwargs)
         if ax.number:
             self._subplot_dict[ax.number] = ax
+        self._range_cache.clear()  # see _get_subplot_ranges()
         return ax
 
     def _add_subplots(
@@ -1451,6 +1563,8 @@ class Figure(mfigure.Figure):
         # draw methods) because we have to take them into account for alignment.
         # Also requires another figure resize (which triggers a gridspec update).
         def _draw_content():
+            if self._sharecolorbars:
+                self._add_shared_colorbars()
             for ax in self._iter_axes(hidden=False, children=True):
                 ax._add_queued_guides()  # may trigger resizes if panels are added
         def _align_content():  # noqa: E306
@@ -1473,6 +1587,106 @@ class Figure(mfigure.Figure):
             gs._auto_layout_tight(renderer)
         _align_content()
 
+    def _get_blit_key(self, artists):
+        """
+        Return the comparison key used to determine whether the cached static
+        background used by `~Figure.draw_data` must be redrawn.
+        """
+        # NOTE: Axes bounding boxes change with the figure size, dpi, and layout,
+        # view limits change the ticks and gridlines, and the number of children
+        # changes when e.g. legends, colorbars, or text are added. Other changes to
+        # static content are detected with the figure 'stale' flag in draw_data().
+        # NOTE: The axes and artists are stored rather than their ids because ids
+        # can be reused after garbage collection.
+        axes = tuple(
+            (
+                ax,
+                tuple(ax.bbox.bounds),
+                tuple(ax.viewLim.bounds),
+                len(ax.get_children()),
+            )
+            for ax in self.axes
+        )
+        return (
+            tuple(self.get_size_inches()),
+            self.dpi,
+            axes,
+            tuple(artists),
+        )
+
+    def draw_data(self, *artists, refresh=False):
+        """
+        Redraw only the data artists by "blitting" them onto a cached copy of the
+        figure background. The static content (axes, ticks, labels, legends, and
+        colorbars) is drawn and the layout is adjusted only on the first call or
+        when a layout-relevant property has changed. Useful for animations.
+
+        Parameters
+        ----------
+        *artists : `~matplotlib.artist.Artist`, optional
+            The artists to redraw. These are marked as "animated" so that they
+            are excluded from the background. Default is all animated artists.
+        refresh : bool, optional
+            Whether to force redrawing the background. This is done automatically
+            if the figure size, axes positions, axes limits, or number of artists
+            in each axes have changed, or if any non-animated artist was changed
+            (e.g. with `~proplot.axes.Axes.format`).
+
+        Note
+        ----
+        Blitting requires a canvas that supports
+        `~matplotlib.backend_bases.FigureCanvasBase.copy_from_bbox`
+        (e.g. the ``'agg'`` backend and most interactive backends). Otherwise
+        the entire figure is redrawn with
+        `~matplotlib.backend_bases.FigureCanvasBase.draw`.
+
+        See also
+        --------
+        Figure.auto_layout
+        proplot.axes.PlotAxes.update_data
+        matplotlib.artist.Artist.set_animated
+        """
+        # Get the animated artists
+        if artists:
+            artists = [a for arg in artists for a in (arg if np.iterable(arg) else (arg,))]  # noqa: E501
+            for artist in artists:
+                artist.set_animated(True)
+        else:
+            artists = [
+                artist for ax in self.axes for artist in ax.get_children()
+                if artist.get_animated()
+            ]
+        canvas = self.canvas
+        if not hasattr(canvas, 'copy_from_bbox'):
+            canvas.draw()
+            return
+
+        # Redraw the background if needed
+        # NOTE: The draw() call triggers the usual canvas preprocessor that runs
+        # auto_layout() and matplotlib skips animated artists during draw().
+        # NOTE: Changes to non-animated artists (e.g. titles, labels, tick formatters)
+        # mark the figure as stale. Changes to animated artists are not propagated.
+        key = self._get_blit_key(artists)
+        if (
+            refresh
+            or self.stale
+            or self._blit_cache is None
+            or self._blit_cache[0] != key
+        ):
+            canvas.draw()
+            key = self._get_blit_key(artists)  # layout may have changed
+            self._blit_cache = (key, canvas.copy_from_bbox(self.bbox))
+
+        # Restore the background and draw the artists
+        canvas.restore_region(self._blit_cache[1])
+        with rc.context(self._render_context):
+            for artist in artists:
+                if artist.axes is not None:
+                    artist.axes.draw_artist(artist)
+                else:
+                    self.draw_artist(artist)
+        canvas.blit(self.bbox)
+
     @warnings._rename_kwargs(
         '0.10.0', mathtext_fallback='pplt.rc.mathtext_fallback = {}'
     )
@@ -1523,8 +1737,10 @@ class Figure(mfigure.Figure):
         proplot.config.Configurator.context
         """
         # Initiate context block
+        # NOTE: Formatting may change static content so reset the draw_data() cache
         axs = axs or self._subplot_dict.values()
         skip_axes = kwargs.pop('skip_axes', False)  # internal keyword arg
+        self._blit_cache = None
         rc_kw, rc_mode = _pop_rc(kwargs)
         with rc.context(rc_kw, mode=rc_mode):
             # Update background patch
@@ -1573,21 +1789,24 @@ class Figure(mfigure.Figure):
                 **toplabels_kw,
             )
 
-        # Update the main axes
-        if skip_axes:  # avoid recursion
-            return
-        kws = {
-            cls: _pop_params(kwargs, sig)
-            for cls, sig in paxes.Axes._format_signatures.items()
-        }
-        classes = set()  # track used dictionaries
-        for ax in axs:
-            kw = {
-                key: value for cls, kw in kws.items()
-                for key, value in kw.items()
-                if isinstance(ax, cls) and not classes.add(cls)
+            # Update the main axes
+            # NOTE: Axes are formatted inside the figure context block so that the
+            # settings are validated and applied only once rather than for each axes.
+            # Identical settings in the axes context blocks are skipped by rc.context.
+            if skip_axes:  # avoid recursion
+                return
+            kws = {
+                cls: _pop_params(kwargs, sig)
+                for cls, sig in paxes.Axes._format_signatures.items()
             }
-            ax.format(rc_kw=rc_kw, rc_mode=rc_mode, skip_figure=True, **kw, **kwargs)
+            classes = set()  # track used dictionaries
+            for ax in axs:
+                kw = {
+                    key: value for cls, kw in kws.items()
+                    for key, value in kw.items()
+                    if isinstance(ax, cls) and not classes.add(cls)
+                }
+                ax.format(rc_kw=rc_kw, rc_mode=rc_mode, skip_figure=True, **kw, **kwargs)  # noqa: E501
 
         # Warn unused keyword argument(s)
         kw = {
@@ -1713,23 +1932,80 @@ class Figure(mfigure.Figure):
         return leg
 
     @docstring._snippet_manager
-    def save(self, filename, **kwargs):
+    def save(self, filename, formats=None, **kwargs):
         """
         %(figure.save)s
         """
-        return self.savefig(filename, **kwargs)
+        return self.savefig(filename, formats=formats, **kwargs)
 
     @docstring._concatenate_inherited
     @docstring._snippet_manager
-    def savefig(self, filename, **kwargs):
+    def savefig(self, filename, formats=None, **kwargs):
         """
         %(figure.save)s
         """
-        # Automatically expand the user name. Undocumented because we
-        # do not want to overwrite the matplotlib docstring.
-        if isinstance(filename, str):
-            filename = os.path.expanduser(filename)
-        super().savefig(filename, **kwargs)
+        # Parse the file names and automatically expand the user name
+        # NOTE: Only lists and tuples are treated as multiple files because
+        # file-like objects passed to savefig() are also iterable.
+        if isinstance(filename, (list, tuple)):
+            filenames = list(filename)
+        else:
+            filenames = [filename]
+        if formats is not None:
+            if isinstance(formats, str):
+                formats = (formats,)
+            for name in filenames:
+                if not isinstance(name, (str, os.PathLike)):
+                    raise ValueError(
+                        f'Invalid filename {name!r} for formats={formats!r}. '
+                        'Formats can only be used with file paths.'
+                    )
+            filenames = [
+                os.path.splitext(os.fspath(name))[0] + '.' + fmt.lstrip('.')
+                for name in filenames for fmt in formats
+            ]
+        filenames = [
+            os.path.expanduser(name) if isinstance(name, str) else name
+            for name in filenames
+        ]
+        if len(filenames) == 1:
+            return super().savefig(filenames[0], **kwargs)
+
+        # Adjust the layout once then save each file with the layout frozen
+        # NOTE: This mimics the canvas preprocessor called by print_figure.
+        ctx1 = self._context_adjusting(cache=False)
+        ctx2 = self._context_authorized()
+        ctx3 = rc.context(self._render_context)
+        with ctx1, ctx2, ctx3:
+            self.auto_layout()
+        with context._state_context(self, _is_frozen=True):
+            for name in filenames:
+                super().savefig(name, **kwargs)
+
+    def delaxes(self, ax):
+        # Silent override. Remove the subplot or panel from the proplot records
+        # so that it is excluded from axis sharing and spanning label groups.
+        super().delaxes(ax)
+        number = getattr(ax, 'number', None)
+        if number and self._subplot_dict.get(number, None) is ax:
+            del self._subplot_dict[number]
+        side = getattr(ax, '_panel_side', None)
+        if side is not None:
+            plist = (ax._panel_parent or self)._panel_dict[side]
+            if ax in plist:
+                plist.remove(ax)
+        self._range_cache.clear()  # see _get_subplot_ranges()
+
+    def get_tightbbox(self, renderer, *args, **kwargs):
+        # Silent override. Draw the cartopy gridliners before matplotlib collects
+        # the extra artists from each axes. Otherwise label artists regenerated by
+        # the axes get_tightbbox() replace artists that were already collected.
+        # NOTE: Cartopy < 0.18 clears the gridliners after drawing them once.
+        if _version_cartopy >= '0.18':
+            for ax in self._iter_axes(hidden=False, children=True):
+                if ax._name == 'cartopy':
+                    ax._draw_gridliners(renderer)
+        return super().get_tightbbox(renderer, *args, **kwargs)
 
     @docstring._concatenate_inherited
     def set_canvas(self, canvas):
@@ -1828,6 +2104,98 @@ class Figure(mfigure.Figure):
         if not samesize:  # gridspec positions will resolve differently
             self.gridspec.update()
 
+    def stats(self, func=None, *args, **kwargs):
+        """
+        Return a summary of the objects and memory held by the figure.
+
+        Parameters
+        ----------
+        func : callable, optional
+            A function (e.g. a plotting command) to run while tracing memory
+            allocations with `tracemalloc`. Its result is discarded.
+        *args, **kwargs
+            Passed to `func`.
+
+        Returns
+        -------
+        dict
+            The summary. Includes the following keys:
+
+            * ``'axes'``: The number of proplot axes (including panels and children).
+            * ``'artists'``: The number of artists in the figure by type name.
+            * ``'data_bytes'``: The bytes held by the arrays of lines,
+              collections, images, and patches (shared arrays are counted once).
+            * ``'colormap_bytes'``: The bytes held by colormap lookup tables.
+            * ``'queued_legends'``, ``'queued_colorbars'``: The number of legends
+              and colorbars that are queued and will be drawn by `~Figure.auto_layout`.
+            * ``'cached_bboxes'``: The number of cached tight bounding boxes.
+            * ``'traced_bytes'``, ``'traced_blocks'``: The net bytes and memory blocks
+              allocated by `func`. Only included if `func` was passed.
+        """
+        # Trace allocations
+        # NOTE: Stop tracing only if it was not already on, e.g. with the
+        # PYTHONTRACEMALLOC environment variable or by the user.
+        traced = {}
+        if func is not None:
+            import tracemalloc
+            tracing = tracemalloc.is_tracing()
+            if not tracing:
+                tracemalloc.start()
+            try:
+                snapshot = tracemalloc.take_snapshot()
+                func(*args, **kwargs)
+                diffs = tracemalloc.take_snapshot().compare_to(snapshot, 'filename')
+            finally:
+                if not tracing:
+                    tracemalloc.stop()
+            traced['traced_bytes'] = sum(diff.size_diff for diff in diffs)
+            traced['traced_blocks'] = sum(diff.count_diff for diff in diffs)
+
+        # Count artists and array memory
+        # NOTE: Use base arrays to avoid counting views of the same data twice.
+        arrays, cmaps, artists = {}, {}, {}
+        attrs = (
+            '_xy', '_x', '_y', '_path', '_paths', '_offsets', '_coordinates',
+            '_A', '_facecolors', '_edgecolors', '_sizes', '_linewidths',
+        )
+        for obj in self.findobj():
+            name = type(obj).__name__
+            artists[name] = artists.get(name, 0) + 1
+            cmap = getattr(obj, 'cmap', None)
+            if getattr(cmap, '_lut', None) is not None:
+                cmaps[id(cmap)] = cmap._lut.nbytes
+            for attr in attrs:
+                values = getattr(obj, attr, None)
+                if not isinstance(values, (list, tuple)):
+                    values = (values,)
+                for value in values:
+                    value = getattr(value, 'vertices', value)  # paths
+                    if isinstance(value, np.ndarray):
+                        while isinstance(value.base, np.ndarray):
+                            value = value.base
+                        arrays[id(value)] = value.nbytes
+        axs = list(self._iter_axes(hidden=True, children=True))
+        report = {}
+        report['axes'] = len(axs)
+        report['artists'] = dict(sorted(artists.items()))
+        report['data_bytes'] = sum(arrays.values())
+        report['colormap_bytes'] = sum(cmaps.values())
+
+        # Count queued guides and cached layout objects
+        report['queued_legends'] = sum(
+            isinstance(obj, tuple) and len(obj) == 3 and isinstance(obj[2], dict)
+            for ax in axs for obj in ax._legend_dict.values()
+        )
+        report['queued_colorbars'] = sum(
+            isinstance(obj, tuple)
+            for ax in axs for obj in ax._colorbar_dict.values()
+        )
+        report['cached_bboxes'] = sum(
+            getattr(ax, '_tight_bbox', None) is not None for ax in axs
+        )
+        report.update(traced)
+        return report
+
     def _iter_axes(self, hidden=False, children=False, panels=True):
         """
         Iterate over all axes and panels in the figure belonging to the
@@ -3,7 +3,9 @@
 Internal utilities.
 """
 # Import statements
+import functools
 import inspect
+import weakref
 from numbers import Integral, Real
 
 import numpy as np
@@ -227,6 +229,23 @@ docstring._snippet_manager['artist.collection_pcolor'] = _pcolor_collection_docs
 docstring._snippet_manager['artist.collection_contour'] = _contour_collection_docstring
 
 
+# Internal plotting parameters optionally ignored by _pop_params
+_internal_params = frozenset((
+    'default_cmap',
+    'default_discrete',
+    'inbounds',
+    'plot_contours',
+    'plot_lines',
+    'skip_autolev',
+    'to_centers',
+))
+
+# Cached parameter names for functions and methods
+# NOTE: Bound methods are created on every attribute access so we cache the
+# underlying function. Weak references prevent caching functions forever.
+_params_cache = weakref.WeakKeyDictionary()
+
+
 def _get_aliases(category, *keys):
     """
     Get all available aliases.
@@ -243,14 +262,15 @@ def _kwargs_to_args(options, *args, allow_extra=False, **kwargs):
     Translate keyword arguments to positional arguments. Permit omitted
     arguments so that plotting functions can infer values.
     """
+    options = _get_arg_table(tuple(options))
     nargs, nopts = len(args), len(options)
     if nargs > nopts and not allow_extra:
         raise ValueError(f'Expected up to {nopts} positional arguments. Got {nargs}.')
     args = list(args)  # WARNING: Axes.text() expects return type of list
     args.extend(None for _ in range(nopts - nargs))  # fill missing args
     for idx, keys in enumerate(options):
-        if isinstance(keys, str):
-            keys = (keys,)
+        if not any(key in kwargs for key in keys):
+            continue  # skip building the options dictionary
         opts = {}
         if args[idx] is not None:  # positional args have first priority
             opts[keys[0] + '_positional'] = args[idx]
@@ -260,6 +280,49 @@ def _kwargs_to_args(options, *args, allow_extra=False, **kwargs):
     return args, kwargs
 
 
+@functools.lru_cache(maxsize=256)
+def _get_arg_table(options):
+    """
+    Return the positional argument options as tuples of keyword names.
+    """
+    return tuple((keys,) if isinstance(keys, str) else tuple(keys) for keys in options)
+
+
+def _get_params(func):
+    """
+    Return the parameter names of the input function, method, or signature.
+    """
+    if isinstance(func, inspect.Signature):
+        return tuple(func.parameters)
+    if not callable(func):
+        raise RuntimeError(f'Internal error. Invalid function {func!r}.')
+    base = getattr(func, '__func__', func)
+    bound = base is not func  # the bound method signature omits 'self'
+    try:
+        cache = _params_cache.setdefault(base, {})
+    except TypeError:  # cannot create weak reference
+        return tuple(inspect.signature(func).parameters)
+    if bound not in cache:
+        cache[bound] = tuple(inspect.signature(func).parameters)
+    return cache[bound]
+
+
+@functools.lru_cache(maxsize=256)
+def _get_prop_table(category, prefix, skip):
+    """
+    Return a table mapping the prefixed property aliases to the category index,
+    the alias index, and the standardized property name.
+    """
+    table = {}
+    for i, (key, aliases) in enumerate(_alias_maps[category].items()):
+        if isinstance(aliases, str):
+            aliases = (aliases,)
+        for j, alias in enumerate((key, *aliases)):
+            if alias not in skip:
+                table.setdefault(prefix + alias, (i, j, key))
+    return table
+
+
 def _pop_kwargs(kwargs, *keys, **aliases):
     """
     Pop the input properties and return them in a new dictionary.
@@ -279,38 +342,44 @@ def _pop_params(kwargs, *funcs, ignore_internal=False):
     """
     Pop parameters of the input functions or methods.
     """
-    internal_params = {
-        'default_cmap',
-        'default_discrete',
-        'inbounds',
-        'plot_contours',
-        'plot_lines',
-        'skip_autolev',
-        'to_centers',
-    }
     output = {}
-    for func in funcs:
-        if isinstance(func, inspect.Signature):
-            sig = func
-        elif callable(func):
-            sig = inspect.signature(func)
-        elif func is None:
-            continue
-        else:
-            raise RuntimeError(f'Internal error. Invalid function {func!r}.')
-        for key in sig.parameters:
-            value = kwargs.pop(key, None)
-            if ignore_internal and key in internal_params:
-                continue
-            if value is not None:
-                output[key] = value
+    for params in _split_params(kwargs, *funcs, ignore_internal=ignore_internal):
+        output.update(params)
     return output
 
 
+def _split_params(kwargs, *funcs, ignore_internal=False):
+    """
+    Pop parameters of the input functions or methods and return them in separate
+    dictionaries. Parameters shared by multiple functions go to the first function.
+    """
+    # NOTE: This iterates over the input keyword arguments once rather than
+    # popping every parameter name of every function.
+    routes = {}
+    for idx, func in enumerate(funcs):
+        if func is None:
+            continue
+        for key in _get_params(func):
+            routes.setdefault(key, idx)
+    outputs = tuple({} for _ in funcs)
+    for key in tuple(kwargs):
+        idx = routes.get(key, None)
+        if idx is None:
+            continue
+        value = kwargs.pop(key)
+        if ignore_internal and key in _internal_params:
+            continue
+        if value is not None:
+            outputs[idx][key] = value
+    return outputs
+
+
 def _pop_props(input, *categories, prefix=None, ignore=None, skip=None):
     """
     Pop the registered properties and return them in a new dictionary.
     """
+    # NOTE: The alias tables are compiled once for each category, prefix, and
+    # skipped aliases, then the input is scanned once for each category.
     output = {}
     skip = skip or ()
     ignore = ignore or ()
@@ -320,14 +389,14 @@ def _pop_props(input, *categories, prefix=None, ignore=None, skip=None):
         ignore = (ignore,)
     prefix = prefix or ''  # e.g. 'box' for boxlw, boxlinewidth, etc.
     for category in categories:
-        for key, aliases in _alias_maps[category].items():
-            if isinstance(aliases, str):
-                aliases = (aliases,)
-            opts = {
-                prefix + alias: input.pop(prefix + alias, None)
-                for alias in (key, *aliases)
-                if alias not in skip
-            }
+        found = {}
+        table = _get_prop_table(category, prefix, tuple(skip))
+        for name in tuple(input):
+            if name in table:
+                i, j, key = table[name]
+                found.setdefault((i, key), []).append((j, name, input.pop(name)))
+        for (_, key), items in sorted(found.items()):
+            opts = {name: value for _, name, value in sorted(items)}
             prop = _not_none(**opts)
             if prop is None:
                 continue
@@ -428,11 +497,6 @@ def _translate_loc(loc, mode, *, default=None, **kwargs):
     else:
         raise KeyError(f'Invalid {mode} location {loc!r}.')
 
-    # Kludge / white lie
-    # TODO: Implement 'best' colorbar location
-    if mode == 'colorbar' and loc == 'best':
-        loc = 'lower right'
-
     return loc
 
 
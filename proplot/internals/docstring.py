@@ -21,6 +21,7 @@ Utilities for modifying proplot docstrings.
 # ...             yield from _iter_doc(obj)
 # ... print(*_iter_doc(pplt))
 import inspect
+import os
 import re
 
 import matplotlib.axes as maxes
@@ -29,6 +30,14 @@ from matplotlib import rcParams as rc_matplotlib
 
 from . import ic  # noqa: F401
 
+# Whether to skip docstring processing
+# NOTE: Setting PROPLOT_SKIP_DOCSTRINGS skips snippet substitution, docstring
+# concatenation, and signature obfuscation for functions and classes. This
+# reduces import time for batch jobs that never display documentation.
+_skip_docstrings = os.environ.get('PROPLOT_SKIP_DOCSTRINGS', '').lower() not in (
+    '', '0', 'false', 'no', 'off'
+)
+
 
 def _obfuscate_kwargs(func):
     """
@@ -53,6 +62,8 @@ def _obfuscate_signature(func, dummy):
     # not change behavior of function! Copy parameters from a dummy function
     # because I'm too lazy to figure out inspect.Parameters API
     # See: https://stackoverflow.com/a/33112180/4970632
+    if _skip_docstrings:
+        return func
     sig = inspect.signature(func)
     sig_repl = inspect.signature(dummy)
     func.__signature__ = sig.replace(parameters=tuple(sig_repl.parameters.values()))
@@ -67,6 +78,8 @@ def _concatenate_inherited(func, prepend_summary=False):
     # Get matplotlib axes func
     # NOTE: Do not bother inheriting from cartopy GeoAxes. Cartopy completely
     # truncates the matplotlib docstrings (which is kind of not great).
+    if _skip_docstrings:
+        return func
     qual = func.__qualname__
     if 'Axes' in qual:
         cls = maxes.Axes
@@ -101,8 +114,11 @@ Matplotlib documentation
 """
 
     # Return docstring
+    # NOTE: Both docstrings were dedented by getdoc() so only the surrounding
+    # newlines need to be stripped. Calling cleandoc() on the concatenated
+    # docstring would re-scan every line of the long matplotlib docstrings.
     # NOTE: Also obfuscate parameters to avoid partial coverage of call signatures
-    func.__doc__ = inspect.cleandoc(doc)
+    func.__doc__ = doc.strip('\n')
     func = _obfuscate_params(func)
     return func
 
@@ -118,7 +134,7 @@ class _SnippetManager(dict):
         """
         if isinstance(obj, str):
             obj %= self  # add snippets to a string
-        else:
+        elif not _skip_docstrings:
             obj.__doc__ = inspect.getdoc(obj)  # also dedents the docstring
             if obj.__doc__:
                 obj.__doc__ %= self  # insert snippets after dedent
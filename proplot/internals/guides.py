@@ -3,6 +3,7 @@
 Utilties related to legends and colorbars.
 """
 import matplotlib.artist as martist
+import matplotlib.cm as mcm
 import matplotlib.colorbar as mcolorbar
 import matplotlib.legend as mlegend  # noqa: F401
 import matplotlib.ticker as mticker
@@ -84,6 +85,57 @@ def _update_kw(kwargs, overwrite=False, **opts):
             kwargs[keys_found[0]] = value
 
 
+def _get_colorbar_key(mappable, values, kwargs):
+    """
+    Return a hashable key describing the colormap, normalizer, levels, and
+    `extend` setting of a queued colorbar. Used to detect identical colorbars.
+    """
+    # NOTE: Colormaps generated by proplot plotting commands are copies so we
+    # compare lookup tables (including 'under' and 'over' colors) rather than ids.
+    # NOTE: Only single mappables are supported. Queued 'artist lists' (e.g. lines)
+    # are always drawn on their own.
+    # NOTE: Other keyword arguments (e.g. 'ticks', 'locator', and 'formatter') are
+    # included so that colorbars with different settings are never merged.
+    if len(mappable) != 1 or not isinstance(mappable[0], mcm.ScalarMappable):
+        return None
+    if any(value is not None for value in values):
+        return None
+    mappable = mappable[0]
+    cmap, norm = mappable.get_cmap(), mappable.norm
+    lut = cmap(np.arange(-1, cmap.N + 1)).tobytes()
+    levels = getattr(norm, 'boundaries', None)
+    levels = None if levels is None else tuple(np.atleast_1d(levels).tolist())
+    extend = kwargs.get('extend', getattr(mappable, 'extend', None))
+    return (lut, type(norm), norm.vmin, norm.vmax, levels, extend, _get_key(kwargs))
+
+
+def _get_key(value):
+    """
+    Return a hashable comparison key for arbitrary keyword argument values. Arrays,
+    sequences, and tick locators and formatters are compared by value and other
+    unhashable objects are compared by identity.
+    """
+    # NOTE: Plotting commands pass new locator instances with each call, so here
+    # compare their settings (ignoring the axis they were assigned to).
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, mticker.TickHelper):
+        attrs = {key: val for key, val in vars(value).items() if key != 'axis'}
+        return (type(value), _get_key(attrs))
+    if isinstance(value, dict):
+        return tuple(sorted((key, _get_key(val)) for key, val in value.items()))
+    if np.iterable(value):
+        array = np.asarray(value, dtype=object)
+        if array.ndim > 1:
+            return (array.shape, tuple(_get_key(val) for val in array.flat))
+        return tuple(_get_key(val) for val in value)
+    try:
+        hash(value)
+    except TypeError:
+        return ('id', id(value))  # the queue keeps the object alive
+    return value
+
+
 def _iter_children(*args):
     """
     Iterate through `_children` of `HPacker`, `VPacker`, and `DrawingArea`.
@@ -11,11 +11,6 @@ import numpy.ma as ma
 from . import ic  # noqa: F401
 from . import _not_none, warnings
 
-try:
-    from cartopy.crs import PlateCarree
-except ModuleNotFoundError:
-    PlateCarree = object
-
 
 # Constants
 BASEMAP_FUNCS = (  # default latlon=True
@@ -271,7 +266,8 @@ def _redirect_or_preprocess(*keys, keywords=None, allow_extra=True):
                         kwargs['latlon'] = True
                 if self._name == 'cartopy' and name in CARTOPY_FUNCS:
                     if kwargs.get('transform', None) is None:
-                        kwargs['transform'] = PlateCarree()
+                        import cartopy.crs as ccrs
+                        kwargs['transform'] = ccrs.PlateCarree()
                     else:
                         kwargs['transform'] = Proj(kwargs['transform'])
 
@@ -736,19 +732,21 @@ def _geo_inbounds(x, y, xmin=-180, xmax=180):
     """
     # Roll in same direction if some points on right-edge extend
     # more than 360 above min longitude; *they* should be on left side
+    # NOTE: Here the roll and the masked array fill are applied while copying into a
+    # single output array rather than chaining np.roll() and ma.filled() copies. This
+    # matters for high-resolution global grids where each copy can be gigabytes.
     if x.ndim != 1:
         return x, y
+    roll = 0
     lonroll = np.where(x > xmin + 360)[0]  # tuple of ids
     if lonroll.size:  # non-empty
         roll = x.size - lonroll.min()
-        x = np.roll(x, roll)
-        y = np.roll(y, roll, axis=-1)
-        x[:roll] -= 360  # make monotonic
+        x = np.concatenate((x[-roll:] - 360, x[:-roll]))  # make monotonic
     # Set NaN where data not in range xmin, xmax. Must be done for regional smaller
     # projections or get weird side-effects from valid data outside boundaries
     y, units = _to_masked_array(y)
     nan = y.fill_value
-    y = y.filled()
+    y = _geo_filled(y, roll)
     if not y.shape:
         pass
     elif x.size - 1 == y.shape[-1]:  # test western/eastern grid cell edges
@@ -760,6 +758,32 @@ def _geo_inbounds(x, y, xmin=-180, xmax=180):
     return x, y
 
 
+def _geo_filled(data, roll=0):
+    """
+    Return a filled copy of the masked array rolled along the last axis. Blocks are
+    copied from views of the input so that only the output array is allocated.
+    """
+    # NOTE: Data may have one fewer column than the coordinates (i.e. the coordinates
+    # are grid cell edges). Reduce the roll modulo the column count like np.roll().
+    mask = ma.getmask(data)
+    fill = data.fill_value
+    data, output = data.data, np.empty_like(data.data)
+    if data.shape and data.shape[-1]:
+        roll %= data.shape[-1]
+    if not roll or not data.shape:
+        blocks = ((Ellipsis, Ellipsis),)
+    else:
+        blocks = (
+            ((Ellipsis, slice(-roll, None)), (Ellipsis, slice(None, roll))),
+            ((Ellipsis, slice(None, -roll)), (Ellipsis, slice(roll, None))),
+        )
+    for src, dst in blocks:
+        np.copyto(output[dst], data[src])
+        if mask is not ma.nomask:
+            np.copyto(output[dst], fill, where=mask[src])
+    return output
+
+
 def _geo_globe(x, y, z, xmin=-180, modulo=False):
     """
     Ensure global coverage by fixing gaps over poles and across
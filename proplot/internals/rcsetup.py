@@ -1144,6 +1144,15 @@ _rc_proplot_table = {
         'in saved vector graphics and with vector graphic backends. Applies '
         'to colorbar levels and bar, area, pcolor, and contour plots.'
     ),
+    'rasterthreshold': (
+        None,
+        _validate_or_none(_validate_int),
+        'The number of elements (e.g. line vertices, scatter markers, pcolor grid '
+        'boxes, or contour vertices) above which artists created by plotting '
+        'commands are rasterized in saved vector graphics. Text, ticks, and guides '
+        'are unaffected. Explicitly passing ``rasterized`` to a plotting command '
+        'overrides this. If ``None``, artists are never automatically rasterized.'
+    ),
 
     # Font settings
     'font.name': (
@@ -51,9 +51,10 @@ import matplotlib  # isort:skip
 _version_mpl = _version(matplotlib.__version__)
 
 # Cartopy version
+# NOTE: Cartopy is slow to import so it is imported when cartopy projections are
+# first requested (see constructor._load_cartopy). Here read the package metadata.
+import pkg_resources as pkg  # isort:skip
 try:
-    import cartopy
-except ImportError:
+    _version_cartopy = _version(pkg.get_distribution('cartopy').version)
+except pkg.DistributionNotFound:
     _version_cartopy = _version('0.0.0')
-else:
-    _version_cartopy = _version(cartopy.__version__)
@@ -0,0 +1,126 @@
+import inspect
+import json
+import os
+import subprocess
+import sys
+
+import proplot as pplt
+
+
+def test_context_nested():
+    """Tests that nested blocks re-apply settings changed in the enclosing block."""
+    with pplt.rc.context({'axes.linewidth': 1.5}):
+        pplt.rc['axes.linewidth'] = 3.0
+        with pplt.rc.context({'axes.linewidth': 1.5}):
+            assert pplt.rc['axes.linewidth'] == 1.5
+        assert pplt.rc['axes.linewidth'] == 3.0
+    with pplt.rc.context(metacolor='red'):
+        pplt.rc['axes.edgecolor'] = 'blue'
+        with pplt.rc.context(metacolor='red'):
+            assert pplt.rc['axes.edgecolor'] == 'red'
+        assert pplt.rc['axes.edgecolor'] == 'blue'
+
+
+def test_context_format():
+    """Tests that settings passed to format() are applied to every axes."""
+    fig, axs = pplt.subplots(ncols=2)
+    axs.format(linewidth=2, color='red', title='title')
+    for ax in axs:
+        assert ax.spines['left'].get_linewidth() == 2
+        assert ax.spines['left'].get_edgecolor()[:3] == (1, 0, 0)
+
+
+def test_font_fingerprint(tmp_path):
+    """Tests that the font fingerprint uses folder rather than file mtimes."""
+    from proplot.config import _get_font_fingerprint
+    folders = [tmp_path / 'fonts1', tmp_path / 'fonts2']
+    for folder in folders:
+        folder.mkdir()
+        (folder / 'font1.ttf').write_bytes(b'')
+    paths = list(map(str, folders))
+    fingerprint = _get_font_fingerprint(paths)
+    assert [file for file, _ in fingerprint['files']] == paths
+    (folders[1] / 'font2.ttf').write_bytes(b'')
+    os.utime(folders[1], (0, 0))  # ensure the mtime changes
+    fingerprint, prev = _get_font_fingerprint(paths), fingerprint
+    assert fingerprint != prev
+    (folders[1] / 'subfolder').mkdir()
+    fingerprint = _get_font_fingerprint(paths)
+    assert fingerprint['files'][-1][0] == str(folders[1] / 'subfolder')
+    (folders[1] / 'subfolder' / 'font3.ttf').write_bytes(b'')
+    os.utime(folders[1] / 'subfolder', (0, 0))
+    assert _get_font_fingerprint(paths) != fingerprint
+
+
+def test_xkcd_cache(tmp_path, monkeypatch):
+    """Tests that the standardized XKCD colors are cached for each setting."""
+    from proplot.config import _load_xkcd_colors
+    monkeypatch.setattr(pplt.config.mpl, 'get_cachedir', lambda: str(tmp_path))
+    path = os.path.join(os.path.dirname(pplt.__file__), 'colors', 'xkcd.txt')
+    calls = []
+    standardize = pplt.colors._standardize_colors
+    def _standardize_colors(*args):  # noqa: E306
+        calls.append(args[1:])
+        return standardize(*args)
+    monkeypatch.setattr(pplt.colors, '_standardize_colors', _standardize_colors)
+    colors = _load_xkcd_colors(path, 'hcl', 0.1)
+    assert os.listdir(tmp_path) == ['proplot-colors.json']  # temporary file was moved
+    with open(tmp_path / 'proplot-colors.json') as f:
+        assert json.load(f)['data'] == colors
+    assert all(color[0] == '#' and len(color) == 7 for color in colors.values())
+    assert _load_xkcd_colors(path, 'hcl', 0.1) == colors
+    assert calls == [('hcl', 0.1)]
+    _load_xkcd_colors(path, 'hsl', 0.1)
+    _load_xkcd_colors(path, 'hsl', 0.2)
+    assert calls == [('hcl', 0.1), ('hsl', 0.1), ('hsl', 0.2)]
+
+
+def test_snapshot(tmp_path, monkeypatch):
+    """Tests that the settings snapshot restores settings and their side effects."""
+    path = tmp_path / 'proplot-rc.json'
+    monkeypatch.setattr(pplt.rc, '_get_snapshot_path', lambda: str(path))
+    pplt.rc.reset()  # ensure the settings are the initial settings
+    settings = [dict(dict.items(d)) for d in (pplt.rc_matplotlib, pplt.rc_proplot)]
+    pplt.rc._save_snapshot()
+    assert os.listdir(tmp_path) == [path.name]  # temporary file was moved
+    formats = []
+    monkeypatch.setattr(pplt.config, 'config_inline_backend', formats.append)
+    linewidth = pplt.rc['axes.linewidth']
+    pplt.rc['axes.linewidth'] = 5
+    pplt.rc.reset()
+    assert pplt.rc._snapshot
+    assert pplt.rc['axes.linewidth'] == linewidth
+    assert formats == [pplt.rc['inlinefmt']]
+    for d, settings in zip((pplt.rc_matplotlib, pplt.rc_proplot), settings):
+        for key, value in settings.items():
+            if key != 'backend':
+                assert type(d[key]) is type(value) and d[key] == value, key
+    style = tmp_path / 'test.mplstyle'
+    style.write_text('axes.linewidth: 2')
+    key = pplt.rc._get_snapshot_key(str(style))
+    style.write_text('axes.linewidth: 3')
+    assert pplt.rc._get_snapshot_key(str(style)) != key
+    path.write_bytes(b'invalid')
+    pplt.rc['axes.linewidth'] = 5
+    pplt.rc.reset()
+    assert not pplt.rc._snapshot
+    assert pplt.rc['axes.linewidth'] == linewidth
+
+
+def test_skip_docstrings():
+    """Tests that docstrings are left unprocessed when requested."""
+    code = (
+        "import inspect, proplot as pplt; func = pplt.axes.PlotAxes.plot; "
+        "print(repr(func.__doc__)); print(inspect.signature(func))"
+    )
+    env = {**os.environ, 'PROPLOT_SKIP_DOCSTRINGS': '1'}
+    result = subprocess.run(
+        [sys.executable, '-c', code], env=env, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+    doc, sig = result.stdout.strip().split('\n')
+    assert '%(' in doc and 'Matplotlib documentation' not in doc
+    assert sig != '(*args, **kwargs)'
+    func = pplt.axes.PlotAxes.plot
+    assert '%(' not in func.__doc__ and 'Matplotlib documentation' in func.__doc__
+    assert str(inspect.signature(func)) == '(*args, **kwargs)'
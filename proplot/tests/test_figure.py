@@ -0,0 +1,169 @@
+import io
+import os
+
+import numpy as np
+import pytest
+
+import proplot as pplt
+
+state = np.random.RandomState(51423)
+
+
+def test_draw_data_cache():
+    """Tests that the draw_data background is invalidated when the figure changes."""
+    fig, ax = pplt.subplots()
+    line, = ax.plot(state.rand(10))
+    fig.draw_data(line)
+    cache = fig._blit_cache
+    assert cache is not None and line.get_animated()
+    line.set_ydata(line.get_ydata()[::-1])
+    fig.draw_data(line)
+    assert fig._blit_cache is cache  # background reused
+    updates = (
+        lambda: ax.set_xlim(0, 100),
+        lambda: ax.text(0.5, 0.5, 'text'),
+        lambda: fig.set_size_inches(5, 5),
+        lambda: fig.format(title='title'),
+    )
+    for update in updates:
+        update()
+        fig.draw_data(line)
+        assert fig._blit_cache is not cache
+        cache = fig._blit_cache
+    fig.draw_data(line, refresh=True)
+    assert fig._blit_cache is not cache
+    cache = fig._blit_cache
+    ax[0].update_data(line, line.get_ydata()[::-1])  # limits are unchanged
+    fig.draw_data(line)
+    assert fig._blit_cache is cache
+    updates = (
+        lambda: ax.format(title='new title'),
+        lambda: ax.set_xlabel('label'),
+        lambda: ax.xaxis.set_major_formatter(pplt.Formatter('sci')),
+    )
+    for update in updates:
+        update()
+        fig.draw_data(line)
+        assert fig._blit_cache is not cache
+        cache = fig._blit_cache
+        fig.draw_data(line)
+        assert fig._blit_cache is cache
+
+
+def test_sharecolorbars():
+    """Tests that identical colorbars from plotting commands are merged."""
+    fig, axs = pplt.subplots(nrows=2, ncols=2, sharecolorbars=True)
+    data = state.rand(5, 5)
+    for ax in axs:
+        ax.pcolor(data, vmin=0, vmax=1, colorbar='r')
+    fig.canvas.draw()
+    cbs = [ax._colorbar_dict[('right', 'center')] for ax in axs]
+    assert all(cb is cbs[0] for cb in cbs)
+    assert not isinstance(cbs[0], tuple)
+
+
+def test_sharecolorbars_settings():
+    """Tests that colorbars with different settings are not merged."""
+    fig, axs = pplt.subplots(ncols=2, sharecolorbars=True)
+    data = state.rand(5, 5)
+    for ax, ticks in zip(axs, ([0, 0.5, 1], [0, 1])):
+        m = ax.pcolor(data, vmin=0, vmax=1)
+        ax.colorbar(m, loc='b', ticks=ticks)
+    fig.canvas.draw()
+    cb1, cb2 = (ax._colorbar_dict[('bottom', 'center')] for ax in axs)
+    assert cb1 is not cb2
+    assert np.allclose(cb1.get_ticks(), [0, 0.5, 1])
+    assert np.allclose(cb2.get_ticks(), [0, 1])
+    fig, axs = pplt.subplots(ncols=2, sharecolorbars=True)
+    for ax in axs:
+        m = ax.pcolor(data, vmin=0, vmax=1)
+        ax.colorbar(m, loc='b', ticks=[0, 0.5, 1])
+    fig.canvas.draw()
+    cb1, cb2 = (ax._colorbar_dict[('bottom', 'center')] for ax in axs)
+    assert cb1 is cb2
+
+
+def test_sharecolorbars_gaps():
+    """Tests that shared colorbars are not merged across other subplots."""
+    fig, axs = pplt.subplots(nrows=3, sharecolorbars=True)
+    data = state.rand(5, 5)
+    for ax, cmap in zip(axs, ('viridis', 'magma', 'viridis')):
+        ax.pcolor(data, cmap=cmap, vmin=0, vmax=1, colorbar='r')
+    fig.canvas.draw()
+    cbs = [ax._colorbar_dict[('right', 'center')] for ax in axs]
+    assert not any(isinstance(cb, tuple) for cb in cbs)
+    assert len(set(map(id, cbs))) == 3
+    fig, axs = pplt.subplots(nrows=3, sharecolorbars=True)
+    for ax, cmap in zip(axs, ('viridis', 'viridis', 'magma')):
+        ax.pcolor(data, cmap=cmap, vmin=0, vmax=1, colorbar='r')
+    fig.canvas.draw()
+    cbs = [ax._colorbar_dict[('right', 'center')] for ax in axs]
+    assert cbs[0] is cbs[1] and cbs[2] is not cbs[0]
+
+
+def test_save_multiple(tmp_path, monkeypatch):
+    """Tests saving several files with a single layout pass."""
+    fig, ax = pplt.subplots()
+    ax.plot(state.rand(10))
+    count = []
+    auto_layout = fig.auto_layout
+
+    def _auto_layout(*args, **kwargs):
+        count.append(1)
+        return auto_layout(*args, **kwargs)
+
+    monkeypatch.setattr(fig, 'auto_layout', _auto_layout)
+    fig.savefig(str(tmp_path / 'figure'), formats=('png', 'pdf'))
+    assert (tmp_path / 'figure.png').stat().st_size > 0
+    assert (tmp_path / 'figure.pdf').stat().st_size > 0
+    assert len(count) == 1
+    size = tuple(fig.get_size_inches())
+    paths = [str(tmp_path / 'copy.png'), str(tmp_path / 'copy.svg')]
+    fig.save(paths)
+    assert all(os.path.getsize(path) > 0 for path in paths)
+    assert tuple(fig.get_size_inches()) == size
+    with pytest.raises(ValueError):
+        fig.savefig(io.BytesIO(), formats='png')
+
+
+def test_stats():
+    """Tests the figure artist and memory summary."""
+    fig, axs = pplt.subplots(ncols=2)
+    data = state.rand(100, 3)
+    axs[0].plot(data)
+    m = axs[1].pcolormesh(state.rand(20, 20))
+    axs[0].legend(loc='b', queue=True)
+    axs[1].colorbar(m, loc='r', queue=True)
+    report = fig.stats()
+    assert report['axes'] == 2
+    assert report['artists']['Line2D'] >= 3
+    assert report['data_bytes'] >= data.nbytes
+    assert report['colormap_bytes'] > 0
+    assert report['queued_legends'] == 1
+    assert report['queued_colorbars'] == 1
+    assert 'traced_bytes' not in report
+    fig.canvas.draw()
+    report = fig.stats(axs[0].plot, state.rand(10000))
+    assert report['queued_legends'] == report['queued_colorbars'] == 0
+    assert report['axes'] == 5  # includes the guide panels and colorbar axes
+    assert report['cached_bboxes'] > 0
+    assert report['traced_bytes'] > 10000 * 8
+
+
+def test_subplot_ranges_cache():
+    """Tests that cached subplot ranges are reset when axes change."""
+    fig, axs = pplt.subplots(nrows=2, ncols=2)
+    axs_cache, ranges = fig._get_subplot_ranges()
+    assert fig._get_subplot_ranges()[0] is axs_cache
+    assert len(axs_cache) == 4 and ranges.shape == (4, 4)
+    pax = axs[0].panel('r')
+    axs_cache, ranges = fig._get_subplot_ranges(panels=True)
+    assert pax in axs_cache
+    assert ranges[axs_cache.index(axs[1])].tolist() == [0, 0, 2, 2]  # renumbered
+    axs[3].set_visible(False)
+    assert axs[3] not in fig._get_subplot_ranges()[0]
+    axs[2].remove()
+    assert axs[2] not in fig._get_subplot_ranges()[0]
+    pax.remove()
+    assert pax not in fig._get_subplot_ranges(panels=True)[0]
+    assert axs[0]._get_span_axes('left') == [axs[0]]
@@ -0,0 +1,50 @@
+import io
+import subprocess
+import sys
+
+import matplotlib.ticker as mticker
+import pytest
+
+import proplot as pplt
+
+pytest.importorskip('cartopy')
+
+
+def test_gridliner_cache():
+    """Tests that gridliner artists are only regenerated when settings change."""
+    fig, ax = pplt.subplot(proj='cyl')
+    ax.format(lonlines=60, latlines=30, labels=True)
+    fig.canvas.draw()
+    gl = ax._gridlines_major
+    key = gl._proplot_key
+    assert key is not None
+    assert any(obj is gl.xformatter for obj in key)
+    fig.canvas.draw()
+    assert gl._proplot_key is key  # not regenerated
+    ax.format(lonlines=30)
+    fig.canvas.draw()
+    assert gl._proplot_key != key
+    ax.format(lonlines=60)  # regenerated inside Figure.get_tightbbox()
+    fig.savefig(io.BytesIO(), bbox_inches='tight')
+
+
+def test_deferred_import():
+    """Tests that cartopy is imported when geographic projections are requested."""
+    code = (
+        "import sys, proplot as pplt; assert not hasattr(pplt, 'Qwerty'); "
+        "assert 'cartopy' not in sys.modules; "
+        "pplt.subplots(proj='robin'); assert pplt.Proj('aitoff').__class__ "
+        "is pplt.Aitoff and pplt.crs.Aitoff is pplt.Aitoff"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+    fig, ax = pplt.subplot(proj='npstere')
+    assert isinstance(ax.projection, pplt.NorthPolarStereo)
+    import cartopy.mpl.geoaxes as cgeoaxes
+    import cartopy.mpl.ticker as cticker
+    assert isinstance(ax, (pplt.axes.geo._CartopyAxes, cgeoaxes.GeoAxes))
+    assert pplt.axes.geo._CartopyAxes.__bases__ == (pplt.GeoAxes,)  # not rebased
+    for formatter in (pplt.ticker.LongitudeFormatter(), pplt.Formatter('dmslon')):
+        assert isinstance(formatter, pplt.ticker.LongitudeFormatter)
+        assert isinstance(formatter, cticker.LongitudeFormatter)
+    assert pplt.ticker.LongitudeFormatter.__bases__[1] is mticker.Formatter
+    assert not hasattr(pplt, 'sys')
@@ -0,0 +1,92 @@
+import gc
+
+import numpy as np
+
+import proplot as pplt
+
+state = np.random.RandomState(51423)
+
+
+def _fill_except_upper_left(ax):
+    """Fill the axes with points everywhere except the upper left quadrant."""
+    x, y = state.rand(2, 2000)
+    mask = (x > 0.5) | (y < 0.5)
+    obj = ax.scatter(x[mask], y[mask], c=x[mask], s=5)
+    ax.format(xlim=(0, 1), ylim=(0, 1))
+    return obj
+
+
+def _get_quadrant(ax, bbox):
+    """Return whether the bounding box center lies in the left and upper halves."""
+    x0, y0, x1, y1 = ax.bbox.extents
+    xc, yc = (bbox.x0 + bbox.x1) / 2, (bbox.y0 + bbox.y1) / 2
+    return xc < (x0 + x1) / 2, yc > (y0 + y1) / 2
+
+
+def test_legend_best():
+    """Tests that legends with loc='best' avoid occupied regions."""
+    fig, ax = pplt.subplots()
+    _fill_except_upper_left(ax)
+    ax.plot([0.9, 0.95], [0.1, 0.15], label='line')
+    leg = ax.legend(loc='best', ncols=1)
+    assert '_find_best_position' in vars(leg)  # uses the fast algorithm
+    fig.canvas.draw()
+    assert _get_quadrant(ax, leg.get_window_extent()) == (True, True)
+
+
+def test_colorbar_best():
+    """Tests that inset colorbars with loc='best' use the empty corner."""
+    fig, ax = pplt.subplots()
+    obj = _fill_except_upper_left(ax)
+    cb = ax.colorbar(obj, loc='best')
+    fig.canvas.draw()
+    assert _get_quadrant(ax, cb.ax.get_window_extent()) == (True, True)
+    fig, ax = pplt.subplots()
+    obj = _fill_except_upper_left(ax)
+    cb = ax.colorbar(obj, loc='ll')
+    fig.canvas.draw()
+    assert _get_quadrant(ax, cb.ax.get_window_extent()) == (True, False)
+
+
+def test_legend_index():
+    """Tests that the legend handle index is reused until artists change."""
+    fig, axs = pplt.subplots()
+    ax = axs[0]
+    line1, = ax.plot(state.rand(5), label='a')
+    ax.plot(state.rand(5))  # unlabeled
+    assert ax._get_legend_handles() == [line1]
+    entry = fig._legend_index[ax]
+    assert ax._get_legend_handles() == [line1]
+    assert fig._legend_index[ax] is entry  # reused
+    line2, = ax.plot(state.rand(5), label='b')
+    assert ax._get_legend_handles() == [line1, line2]
+    assert fig._legend_index[ax] is not entry
+    entry = fig._legend_index[ax]
+    line1.remove()
+    assert ax not in fig._legend_index  # invalidated by remove()
+    line2.set_label('_hidden')  # labels are checked after the index lookup
+    assert ax._get_legend_handles() == []
+    ax.cla()
+    assert ax._get_legend_handles() == []
+    ax.bar([1, 2], [1, 2], label='c')
+    assert [h.get_label() for h in ax._get_legend_handles()] == ['c']
+    fig, axs = pplt.subplots(ncols=2)
+    axs[1].plot(state.rand(5), label='a')
+    fig.legend(loc='b')  # index every axes
+    assert len(fig._legend_index) == 2
+    axs[1].remove()
+    del axs
+    gc.collect()
+    assert len(fig._legend_index) == 1  # removed axes are not kept alive
+
+
+def test_legend_unique():
+    """Tests that unique=True drops entries with duplicate labels."""
+    fig, axs = pplt.subplots(ncols=2)
+    for ax in axs:
+        ax.plot(state.rand(5), label='a')
+        ax.plot(state.rand(5), label='b')
+    leg = fig.legend(loc='b', ncols=4)
+    assert [text.get_text() for text in leg.get_texts()] == ['a', 'b', 'a', 'b']
+    leg = fig.legend(loc='b', ncols=4, unique=True)
+    assert [text.get_text() for text in leg.get_texts()] == ['a', 'b']
@@ -0,0 +1,25 @@
+import numpy as np
+import numpy.ma as ma
+import pytest
+
+from proplot.internals import inputs
+
+
+@pytest.mark.parametrize('ncols', [6, 5])
+@pytest.mark.parametrize('roll', [0, 2, 5, 6])
+def test_geo_filled(ncols, roll):
+    """Tests that filling and rolling matches np.roll() for centers and edges."""
+    data = ma.masked_array(np.arange(3.0 * ncols).reshape(3, ncols))
+    data[1, 2] = ma.masked
+    result = inputs._geo_filled(data, roll)
+    expected = np.roll(data.filled(), roll, axis=-1)
+    assert np.array_equal(result, expected)
+
+
+def test_geo_inbounds_edges():
+    """Tests that longitude edges entirely past the seam are rolled like before."""
+    x = np.linspace(190, 540, 6)  # every edge exceeds xmin + 360
+    y = np.arange(15.0).reshape(3, 5)
+    xr, yr = inputs._geo_inbounds(x, y, xmin=-180, xmax=180)
+    assert np.array_equal(xr, x - 360)
+    assert np.array_equal(yr, np.roll(y, x.size, axis=-1))
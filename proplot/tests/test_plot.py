@@ -0,0 +1,218 @@
+import matplotlib.collections as mcollections
+import matplotlib.colors as mcolors
+import matplotlib.lines as mlines
+import numpy as np
+import pytest
+
+import proplot as pplt
+
+state = np.random.RandomState(51423)
+
+
+def test_update_data_lines():
+    """Tests in-place updates of lines including horizontal lines."""
+    fig, ax = pplt.subplots()
+    objs = ax.plot(state.rand(10, 3))
+    ys = state.rand(10, 3) + 10
+    assert ax.update_data(objs, ys) is objs
+    for i, obj in enumerate(objs):
+        assert np.allclose(obj.get_ydata(), ys[:, i])
+        assert np.allclose(obj.get_xdata(), np.arange(10))
+    assert ax.get_ylim()[0] > 9
+    obj, = ax.plotx(np.arange(5), np.zeros(5))
+    ax.update_data(obj, np.arange(5) + 100.0)
+    assert np.allclose(obj.get_xdata(), np.arange(5) + 100)
+    assert np.allclose(obj.get_ydata(), np.arange(5))
+    with pytest.raises(ValueError):
+        ax.update_data(objs, state.rand(10, 4))
+
+
+def test_update_data_scatter():
+    """Tests in-place updates of scatter plots including data limits."""
+    fig, ax = pplt.subplots()
+    obj = ax.scatter(np.arange(5), np.arange(5), c=np.arange(5))
+    ax.update_data(obj, np.arange(5), np.arange(5) * 100.0, np.arange(5)[::-1])
+    assert np.allclose(obj.get_offsets()[:, 1], np.arange(5) * 100)
+    assert np.allclose(obj.get_array(), np.arange(5)[::-1])
+    assert ax.get_ylim()[1] > 400  # data limits include the collection
+    obj = ax.scatterx(np.arange(5), np.zeros(5))
+    ax.update_data(obj, np.arange(5) - 50.0)
+    assert np.allclose(obj.get_offsets()[:, 0], np.arange(5) - 50)
+    assert np.allclose(obj.get_offsets()[:, 1], np.arange(5))
+    assert ax.get_xlim()[0] < -50
+
+
+def test_update_data_pcolor():
+    """Tests in-place updates of pseudocolor plots and images."""
+    fig, axs = pplt.subplots(ncols=2)
+    data = state.rand(5, 6)
+    m = axs[0].pcolormesh(data)
+    assert axs[0].update_data(m, data * 2) is m
+    assert np.allclose(np.ravel(m.get_array()), np.ravel(data * 2))
+    with pytest.raises(ValueError):
+        axs[0].update_data(m, state.rand(4, 4))
+    m = axs[1].imshow(data)
+    axs[1].update_data(m, data[::-1])
+    assert np.allclose(m.get_array(), data[::-1])
+
+
+def test_update_data_contour():
+    """Tests that contour updates reuse the original coordinates and levels."""
+    fig, ax = pplt.subplots()
+    x, y = np.linspace(100, 200, 6), np.linspace(-50, 50, 5)
+    data = state.rand(5, 6)
+    m = ax.contourf(x, y, data, levels=5)
+    n = ax.update_data(m, data[::-1])
+    assert n is not m
+    assert np.allclose(n.levels, m.levels)
+    assert n.norm is m.norm
+    vertices = np.concatenate([
+        path.vertices for coll in getattr(n, 'collections', [n])
+        for path in coll.get_paths() if len(path.vertices)
+    ])
+    assert vertices[:, 0].min() >= 100 - 1e-6
+    assert vertices[:, 0].max() <= 200 + 1e-6
+
+
+def test_update_data_contour_twice():
+    """Tests repeated contour updates with labels and contour edges."""
+    fig, ax = pplt.subplots()
+    x, y = np.linspace(100, 200, 6), np.linspace(-50, 50, 5)
+    data = state.rand(5, 6)
+    m = ax.contourf(x, y, data, levels=5, labels=True, linewidths=1)
+    ntexts, ncollections = len(ax.texts), len(ax.collections)
+    assert ntexts > 0
+    n = ax.update_data(m, data[::-1])
+    n = ax.update_data(n, data)
+    assert len(ax.texts) == ntexts
+    assert len(ax.collections) == ncollections
+    assert n._plot_edges is not m._plot_edges
+    vertices = np.concatenate([
+        path.vertices for coll in getattr(n, 'collections', [n])
+        for path in coll.get_paths() if len(path.vertices)
+    ])
+    assert vertices[:, 0].min() >= 100 - 1e-6
+    assert vertices[:, 0].max() <= 200 + 1e-6
+
+
+def test_update_data_contour_props():
+    """Tests that contour updates keep the line properties and colorbars."""
+    fig, axs = pplt.subplots()
+    ax = axs[0]
+    data = state.rand(5, 6)
+    m = ax.contour(data, lw=3, ls='--', c='k', zorder=5)
+    cb = ax.colorbar(m, loc='r')
+    n = ax.update_data(m, data[::-1])
+    n = ax.update_data(n, data)
+    for coll in getattr(n, 'collections', [n]):
+        assert np.allclose(coll.get_linewidths(), 3)
+        assert coll.get_zorder() == 5
+        assert all(dashes is not None for _, dashes in coll.get_linestyles())
+        assert np.allclose(coll.get_colors(), mcolors.to_rgba('k'))
+    assert cb.mappable is n and n.colorbar is cb
+    n.set_clim(0, 2)  # colorbar follows the new contour set
+    fig.canvas.draw()
+
+
+def test_rasterthreshold():
+    """Tests that large artists are rasterized unless rasterized is passed."""
+    fig, ax = pplt.subplots()
+    with pplt.rc.context(rasterthreshold=100):
+        small, = ax.plot(state.rand(50))
+        large, = ax.plot(state.rand(500))
+        explicit, = ax.plot(state.rand(500), rasterized=False)
+        mesh = ax.pcolormesh(state.rand(20, 20))
+        scatter = ax.scatter(*state.rand(2, 500))
+    assert not small.get_rasterized()
+    assert large.get_rasterized()
+    assert not explicit.get_rasterized()
+    assert mesh.get_rasterized()
+    assert scatter.get_rasterized()
+    line, = ax.plot(state.rand(500))
+    assert not line.get_rasterized()  # the default threshold is None
+
+
+def test_rasterthreshold_text():
+    """Tests that text returned with heavy artists is never rasterized."""
+    fig, ax = pplt.subplots()
+    labels = list('abcdefghij')
+    with pplt.rc.context(rasterthreshold=5):
+        wedges, texts = ax.pie(state.rand(10), labels=labels)
+    assert all(wedge.get_rasterized() for wedge in wedges)
+    assert not any(text.get_rasterized() for text in texts)
+
+
+def test_cycle_cache():
+    """Tests that cached property cycles follow re-registered colormaps."""
+    fig, ax = pplt.subplots()
+    pplt.Colormap(['red', 'blue'], listmode='discrete', name='_test_cycle')
+    objs = ax.plot(state.rand(5, 2), cycle='_test_cycle')
+    assert [obj.get_color() for obj in objs] == ['red', 'blue']
+    objs = ax.plot(state.rand(5, 2), cycle='_test_cycle')
+    assert [obj.get_color() for obj in objs] == ['red', 'blue']
+    pplt.Colormap(['green', 'black'], listmode='discrete', name='_test_cycle')
+    objs = ax.plot(state.rand(5, 2), cycle='_test_cycle')
+    assert [obj.get_color() for obj in objs] == ['green', 'black']
+
+
+def test_cycle_columns():
+    """Tests that column-by-column cycle sampling advances the cycle per column."""
+    fig, axs = pplt.subplots()
+    ax = axs[0]
+    colors = pplt.utils.to_hex(pplt.rc['axes.prop_cycle'].by_key()['color'])
+    objs = ax.scatter(state.rand(5, 3), state.rand(5, 3))
+    assert [pplt.utils.to_hex(obj.get_facecolor()[0]) for obj in objs] == list(colors[:3])  # noqa: E501
+    line, = ax.plot(state.rand(5))
+    assert pplt.utils.to_hex(line.get_color()) == colors[3]
+    obj, = ax.plot(state.rand(5, 2), collection=True)
+    assert list(pplt.utils.to_hex(obj.get_colors())) == list(colors[4:6])
+
+
+def test_plot_collection():
+    """Tests that collection=True draws one collection with the cycle properties."""
+    fig, axs = pplt.subplots(ncols=2)
+    data = state.rand(10, 4)
+    lines = axs[0].plot(data, lw=2)
+    obj, = axs[1].plot(data, collection=True, lw=2)
+    assert isinstance(obj, mcollections.LineCollection)
+    assert len(obj.get_segments()) == 4
+    for line, segment in zip(lines, obj.get_segments()):
+        assert np.allclose(segment, line.get_xydata())
+    colors = [mcolors.to_rgba(line.get_color()) for line in lines]
+    assert np.allclose(obj.get_colors(), colors)
+    assert np.allclose(obj.get_linewidths(), 2)
+    assert axs[1].get_ylim() == axs[0].get_ylim()
+    with pytest.warns(pplt.warnings.ProplotWarning):
+        objs = axs[1].plot(data, collection=True, marker='o')
+    assert all(isinstance(obj, mlines.Line2D) for obj in objs)
+    obj, = axs[1].plot(data, collection=True, solid_capstyle='round', dash_joinstyle='bevel')  # noqa: E501
+    assert isinstance(obj, mcollections.LineCollection)
+    assert obj.get_capstyle() == 'round' and obj.get_joinstyle() == 'bevel'
+    with pytest.warns(pplt.warnings.ProplotWarning):
+        objs = axs[1].plot(data, collection=True, markevery=2)
+    assert all(isinstance(obj, mlines.Line2D) for obj in objs)
+
+
+def test_plot_collection_guides():
+    """Tests that legends and colorbars use one proxy handle per column."""
+    fig, ax = pplt.subplots()
+    labels = ['a', 'b', 'c']
+    objs = ax.plot(state.rand(10, 3), collection=True, labels=labels)
+    leg = ax.legend(loc='r', ncols=1)  # auto-discovered handles
+    assert [text.get_text() for text in leg.get_texts()] == labels
+    leg = ax.legend(objs, loc='b', ncols=1)  # explicit handles
+    assert [text.get_text() for text in leg.get_texts()] == labels
+    for mappable in (objs, objs[0]):
+        cb = ax.colorbar(mappable, loc='l')
+        assert cb.mappable.cmap.N == 3
+        fig.canvas.draw()
+        assert [text.get_text() for text in cb.ax.get_yticklabels()] == labels
+    fig, axs = pplt.subplots()
+    ax = axs[0]
+    ax.plot(state.rand(10, 3), collection=True, labels=labels, colorbar='r', legend='b')  # noqa: E501
+    fig.canvas.draw()
+    cb = ax._colorbar_dict[('right', 'center')]
+    assert cb.mappable.cmap.N == 3
+    assert [text.get_text() for text in cb.ax.get_yticklabels()] == labels
+    leg = ax._legend_dict[('bottom', 'center')]
+    assert [text.get_text() for text in leg.get_texts()] == labels
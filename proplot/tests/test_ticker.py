@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+import proplot as pplt
+from proplot import ticker as pticker
+
+VALUES = [-0.5, -0.0, 0, 1e-12, 0.1, 0.30000000000000004, 1.5, 100, -1e6, 123.456]
+
+
+@pytest.mark.parametrize('unicode_minus', [True, False])
+@pytest.mark.parametrize(
+    'formatter', [
+        pticker.AutoFormatter(),
+        pticker.AutoFormatter(zerotrim=False),
+        pticker.AutoFormatter(negpos='WE', wraprange=(-180, 180)),
+        pticker.AutoFormatter(prefix='$', suffix='%', tickrange=(0, 10)),
+        pticker.SciFormatter(),
+        pticker.SigFigFormatter(2),
+        pticker.SigFigFormatter(3, zerotrim=False, base=5),
+    ]
+)
+def test_format_ticks(formatter, unicode_minus):
+    """Tests that batch formatting matches formatting values one-by-one."""
+    with pplt.rc.context({'axes.unicode_minus': unicode_minus}):
+        formatter.create_dummy_axis()
+        formatter.axis.set_view_interval(-1, 1)
+        if isinstance(formatter, pticker.AutoFormatter):  # __call__ requires locs
+            formatter.set_locs(VALUES)
+        labels = [formatter(value) for value in VALUES]
+        assert formatter.format_ticks(VALUES) == labels
+        assert formatter.format_ticks(VALUES) == labels  # cached labels
+
+
+def test_format_ticks_strings():
+    """Tests the minus sign and trailing zero handling of the batch formatter."""
+    strings = ['-0.000', '-1.500', '100.0', '2.', '', '1,50']
+    result = pticker.AutoFormatter._format_strings(
+        strings, unicode_minus=True, zerotrim=True,
+    )
+    assert result == ['0', '\N{MINUS SIGN}1.5', '100', '2', '', '1,50']
+    result = pticker.AutoFormatter._format_strings(
+        strings, unicode_minus=False, zerotrim=True, decimal_point=',',
+    )
+    assert result == ['0.000', '-1.500', '100.0', '2.', '', '1,5']
+
+
+def test_format_ticks_cache():
+    """Tests that cached labels are reused only when the view interval is unchanged."""
+    fig, ax = pplt.subplots()
+    ax.format(xlim=(0, 10))
+    fig.canvas.draw()
+    formatter = ax.xaxis.get_major_formatter()
+    locs = np.arange(0, 11, 2.0)
+    labels = formatter.format_ticks(locs)
+    key = formatter._cached_ticks[0]
+    assert formatter.format_ticks(locs) == labels
+    ax.set_xlim(0, 1000)
+    assert formatter._get_cache_key(locs) != key
@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+import proplot as pplt
+
+
+def _make_figure():
+    fig, ax = pplt.subplots()
+    ax.plot([0, 1, 2])
+    return fig
+
+
+def _make_subplots():
+    assert pplt.rc['axes.linewidth'] == 2  # copied from the parent process
+    return pplt.subplots(ncols=2)
+
+
+def _make_error():
+    raise RuntimeError('figure failed')
+
+
+@pytest.mark.parametrize('processes', [0, 2])
+def test_render_batch(tmp_path, processes):
+    """Tests that render_batch saves figures and records errors per figure."""
+    funcs = [_make_figure, _make_error, _make_subplots]
+    paths = [str(tmp_path / f'fig{i}.png') for i in range(3)]
+    with pplt.rc.context({'axes.linewidth': 2}):
+        results = pplt.render_batch(funcs, paths, processes=processes)
+    assert [result['path'] for result in results] == paths
+    assert results[0]['error'] is None and os.path.exists(paths[0])
+    assert results[2]['error'] is None and os.path.exists(paths[2])
+    assert 'RuntimeError: figure failed' in results[1]['error']
+    assert not os.path.exists(paths[1])
+    assert all(result['time'] >= 0 for result in results)
+
+
+def test_render_batch_mismatch():
+    """Tests that render_batch requires one path per figure."""
+    with pytest.raises(ValueError):
+        pplt.render_batch([_make_figure], [])
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+import proplot as pplt
+
+state = np.random.RandomState(51423)
+
+
+def test_units_types():
+    """Tests that unit conversion returns floats and lists of floats."""
+    assert pplt.units(72, 'pt', 'in') == pytest.approx(1)
+    assert pplt.units('1in', 'pt') == pytest.approx(72)
+    for value in (np.array([72, 144]), np.array([72.0, 144.0]), [72, '2in']):
+        result = pplt.units(value, 'pt', 'in')
+        assert isinstance(result, list) and result == pytest.approx([1, 2])
+        assert all(type(val) is float for val in result)
+    result = pplt.units(np.array(72.0), 'pt', 'in')
+    assert type(result) is float and result == pytest.approx(1)
+    with pytest.raises(ValueError):
+        pplt.units('1foo')
+    with pytest.raises(ValueError):
+        pplt.units(1, 'foo')
+
+
+def test_units_cache():
+    """Tests that font-relative units follow the current font size."""
+    with pplt.rc.context({'font.size': 10}):
+        assert pplt.units('1em', 'pt') == pytest.approx(10)
+    with pplt.rc.context({'font.size': 12}):
+        assert pplt.units('1em', 'pt') == pytest.approx(12)
+        assert pplt.units('1em', 'pt', fontsize=8) == pytest.approx(8)
+    with pplt.rc.context({'figure.dpi': 100}):
+        assert pplt.units('100px') == pytest.approx(1)
+
+
+RGB = np.concatenate((
+    [[0, 0, 0], [1, 1, 1], [0.5, 0.5, 0.5]],  # black, white, and gray
+    state.rand(50, 3),
+))
+RGBA = np.column_stack((RGB, state.rand(len(RGB))))
+NAMES = ['red', 'C1', 'blue9', '#123456', ('Reds', 0.3), (0.1, 0.2, 0.3)]
+SPACES = ('rgb', 'hsv', 'hcl', 'hsl', 'hpl')
+
+
+def _assert_colors(array, scalars):
+    """Assert that array results match a list of scalar results."""
+    array = list(array)
+    assert len(array) == len(scalars)
+    for value, scalar in zip(array, scalars):
+        if isinstance(scalar, str):
+            assert value == scalar
+        else:
+            assert np.allclose(value, scalar, atol=1e-6)
+
+
+@pytest.mark.parametrize('name', ['hsluv', 'hpluv', 'hcl', 'hsl', 'lchuv'])
+def test_hsluv_arrays(name):
+    """Tests that vectorized colorspace conversions match scalar conversions."""
+    from proplot.externals import hsluv
+    forward = getattr(hsluv, f'rgb_to_{name}')
+    backward = getattr(hsluv, f'{name}_to_rgb')
+    channels = [forward(*rgb) for rgb in RGB]
+    _assert_colors(getattr(hsluv, f'rgb_to_{name}_array')(RGB), channels)
+    _assert_colors(
+        getattr(hsluv, f'{name}_to_rgb_array')(np.array(channels)),
+        [backward(*values) for values in channels],
+    )
+
+
+@pytest.mark.parametrize('space', SPACES)
+def test_color_arrays(space):
+    """Tests that color functions return the scalar results for each color."""
+    utils = pplt.utils
+    _assert_colors(
+        utils.to_xyza(RGBA, space=space),
+        [utils.to_xyza(tuple(rgba), space=space) for rgba in RGBA],
+    )
+    channels = np.array([utils.to_xyz(tuple(rgb), space=space) for rgb in RGB])
+    _assert_colors(
+        utils.to_rgba(channels, space=space),
+        [utils.to_rgba(tuple(values), space=space) for values in channels],
+    )
+    funcs = (
+        (utils.shift_hue, 30), (utils.scale_saturation, 0.5),
+        (utils.scale_luminance, 1.3), (utils.set_hue, 100),
+        (utils.set_saturation, 40), (utils.set_luminance, 30),
+    )
+    for func, value in funcs:
+        _assert_colors(
+            func(RGBA, value, space=space),
+            [func(tuple(rgba), value, space=space) for rgba in RGBA],
+        )
+        _assert_colors(
+            func(NAMES, value, space=space),
+            [func(color, value, space=space) for color in NAMES],
+        )
+
+
+def test_color_arrays_rgb():
+    """Tests that arrays of names, 0-255 values, and hex strings are translated."""
+    utils = pplt.utils
+    _assert_colors(utils.to_hex(RGBA), [utils.to_hex(tuple(rgba)) for rgba in RGBA])
+    _assert_colors(utils.to_hex(NAMES), [utils.to_hex(color) for color in NAMES])
+    _assert_colors(
+        utils.set_alpha(NAMES, 0.3), [utils.set_alpha(color, 0.3) for color in NAMES]
+    )
+    rgb255 = np.round(RGB * 255)
+    for array in (rgb255, np.column_stack((rgb255, np.ones(len(RGB))))):
+        _assert_colors(
+            utils.to_rgba(array), [utils.to_rgba(tuple(values)) for values in array]
+        )
+
+
+def test_color_scalars():
+    """Tests that scalar color tuples are still translated as single colors."""
+    utils = pplt.utils
+    for color in ((0.1, 0.2, 0.3), (0.1, 0.2, 0.3, 0.4), ('Reds', 0.3)):
+        rgba = utils.to_rgba(color)
+        assert isinstance(rgba, tuple) and len(rgba) == 4
+        assert isinstance(utils.to_hex(color), str)
+        assert isinstance(utils.shift_hue(color, 30), str)
+    assert utils.to_rgba((0.1, 0.2, 0.3)) == pytest.approx((0.1, 0.2, 0.3, 1))
+    assert not utils._is_color_array(('red', 0.5))  # (color, alpha) tuple
@@ -14,14 +14,8 @@ from .config import rc
 from .internals import ic  # noqa: F401
 from .internals import _not_none, context, docstring
 
-try:
-    import cartopy.crs as ccrs
-    from cartopy.mpl.ticker import (
-        _PlateCarreeFormatter, LatitudeFormatter, LongitudeFormatter
-    )
-except ModuleNotFoundError:
-    ccrs = None
-    _PlateCarreeFormatter = LatitudeFormatter = LongitudeFormatter = object
+ccrs = None  # see _load_cartopy()
+_CARTOPY_FORMATTERS = {}  # see _load_cartopy()
 
 __all__ = [
     'IndexLocator',
@@ -43,6 +37,7 @@ __all__ = [
 REGEX_ZERO = re.compile('\\A[-\N{MINUS SIGN}]?0(.0*)?\\Z')
 REGEX_MINUS = re.compile('\\A[-\N{MINUS SIGN}]\\Z')
 REGEX_MINUS_ZERO = re.compile('\\A[-\N{MINUS SIGN}]0(.0*)?\\Z')
+REGEX_MINUS_ZERO_LINES = re.compile('^[-\N{MINUS SIGN}](?=0(.0*)?$)', re.MULTILINE)
 
 _precision_docstring = """
 precision : int, default: {6, 2}
@@ -325,7 +320,82 @@ class LatitudeLocator(DegreeLocator):
         return [t for t in ticks if -90 <= t <= 90]
 
 
-class AutoFormatter(mticker.ScalarFormatter):
+class _CachedFormatter(object):
+    """
+    Mixin class for formatting every tick location at once and caching the labels.
+    """
+    # NOTE: Axis._update_ticks() calls format_ticks() on every draw (matplotlib
+    # >= 3.1). Here we reuse the previous labels when the tick locations, view
+    # interval, and settings are unchanged, and restore the state normally assigned
+    # by set_locs() so that e.g. ScalarFormatter.get_offset() remains consistent.
+    _cached_attrs = ('locs', 'offset', 'orderOfMagnitude', 'format')
+
+    def format_ticks(self, values):
+        """
+        Return the tick labels for all tick locations at once.
+
+        Parameters
+        ----------
+        values : list of float
+            The tick locations.
+
+        Returns
+        -------
+        list of str
+            The tick labels.
+        """
+        key = self._get_cache_key(values)
+        cache = getattr(self, '_cached_ticks', None)
+        if cache is not None and cache[0] == key:
+            self.__dict__.update(cache[1])
+            return list(cache[2])
+        self.set_locs(values)
+        labels = self._format_ticks(values)
+        state = {
+            attr: getattr(self, attr)
+            for attr in self._cached_attrs
+            if attr in self.__dict__
+        }
+        self._cached_ticks = (key, state, labels)
+        return list(labels)
+
+    def _get_cache_key(self, values):
+        """
+        Return the comparison key used to determine whether labels must be updated.
+        """
+        # NOTE: Here the rc settings are included because they affect formatting
+        # and can change inside rc.context() blocks used while drawing figures.
+        axis = getattr(self, 'axis', None)
+        interval = None
+        if axis is not None and hasattr(axis, 'get_view_interval'):
+            interval = tuple(axis.get_view_interval())
+        settings = tuple(
+            tuple(value) if np.iterable(value) and not isinstance(value, str) else value
+            for value in self._get_cache_settings()
+        )
+        return (
+            tuple(values),
+            interval,
+            settings,
+            rc['axes.unicode_minus'],
+            rc['text.usetex'],
+            rc['formatter.use_locale'],
+        )
+
+    def _get_cache_settings(self):
+        """
+        Return the formatter settings that affect the labels.
+        """
+        return ()
+
+    def _format_ticks(self, values):
+        """
+        Return the tick labels for the tick locations.
+        """
+        return [self(value) for value in values]
+
+
+class AutoFormatter(_CachedFormatter, mticker.ScalarFormatter):
     """
     The default formatter used for proplot tick labels.
     Replaces `~matplotlib.ticker.ScalarFormatter`.
@@ -368,33 +438,56 @@ class AutoFormatter(mticker.ScalarFormatter):
         self._negpos = negpos or ''
 
     @docstring._snippet_manager
-    def __call__(self, x, pos=None):
+    def __call__(self, x, pos=None):  # noqa: U100
         """
         %(ticker.call)s
         """
+        return self._format_ticks((x,))[0]
+
+    def _get_cache_settings(self):
+        return (
+            self._zerotrim, self._tickrange, self._wraprange,
+            self._prefix, self._suffix, self._negpos,
+            self.get_useOffset(), self.get_useLocale(), self.get_useMathText(),
+            getattr(self, '_scientific', None),  # guard against API change
+            getattr(self, '_powerlimits', None),
+            getattr(self, '_usetex', None),
+        )
+
+    def _format_ticks(self, values):
         # Tick range limitation
-        x = self._wrap_tick_range(x, self._wraprange)
-        if self._outside_tick_range(x, self._tickrange):
-            return ''
+        # NOTE: Settings that apply to every tick are retrieved once up front and
+        # the tick range, wrapping, and sign operations are applied to the array.
+        xs = np.asarray(values, dtype=float)
+        xs = self._wrap_tick_range(xs, self._wraprange)
+        outside = self._outside_tick_range(xs, self._tickrange)
 
         # Negative positive handling
-        x, tail = self._neg_pos_format(x, self._negpos, wraprange=self._wraprange)
+        xs, tails = self._neg_pos_format(xs, self._negpos, wraprange=self._wraprange)
 
         # Default string formatting
-        string = super().__call__(x, pos)
-
-        # Fix issue where non-zero string is formatted as zero
-        string = self._fix_small_number(x, string)
-
-        # Custom string formatting
-        string = self._minus_format(string)
-        if self._zerotrim:
-            string = self._trim_trailing_zeros(string, self._get_decimal_point())
+        # NOTE: Also fix issue where non-zero string is formatted as zero
+        strings = []
+        decimal_point = self._get_decimal_point()
+        for x, skip in zip(xs.tolist(), outside.tolist()):
+            if skip:
+                strings.append('')
+                continue
+            string = super().__call__(x)
+            string = self._fix_small_number(x, string, decimal_point=decimal_point)
+            strings.append(string)
+
+        # Custom string formatting applied to all strings at once
+        strings = self._format_strings(
+            strings, zerotrim=self._zerotrim, decimal_point=decimal_point
+        )
 
-        # Prefix and suffix
-        string = self._add_prefix_suffix(string, self._prefix, self._suffix)
-        string = string + tail  # add negative-positive indicator
-        return string
+        # Prefix and suffix and negative-positive indicator
+        return [
+            string if skip else
+            self._add_prefix_suffix(string, self._prefix, self._suffix) + tail
+            for string, tail, skip in zip(strings, tails.tolist(), outside.tolist())
+        ]
 
     def get_offset(self):
         """
@@ -415,7 +508,7 @@ class AutoFormatter(mticker.ScalarFormatter):
             sign, string = string[0], string[1:]
         return sign + prefix + string + suffix
 
-    def _fix_small_number(self, x, string, precision_offset=2):
+    def _fix_small_number(self, x, string, precision_offset=2, decimal_point=None):
         """
         Fix formatting for non-zero number that gets formatted as zero. The `offset`
         controls the offset from the true floating point precision at which we want
@@ -428,10 +521,9 @@ class AutoFormatter(mticker.ScalarFormatter):
         # precision. Common issue is e.g. levels=pplt.arange(-1, 1, 0.1).
         # This choice satisfies even 1000 additions of 0.1 to -100.
         m = REGEX_ZERO.match(string)
-        decimal_point = self._get_decimal_point()
-
         if m and x != 0:
             # Get initial precision spit out by algorithm
+            decimal_point = _not_none(decimal_point, self._get_decimal_point())
             decimals, = m.groups()
             if decimals:
                 precision_init = len(decimals.lstrip(decimal_point))
@@ -483,11 +575,34 @@ class AutoFormatter(mticker.ScalarFormatter):
         return digits
 
     @staticmethod
-    def _minus_format(string):
+    def _format_strings(strings, unicode_minus=None, zerotrim=False, decimal_point='.'):
+        """
+        Apply `_minus_format` and optionally `_trim_trailing_zeros` to every string.
+        """
+        # NOTE: Strings are joined by newlines so that the minus sign replacement,
+        # negative zero removal, and zero trimming each make one pass over the labels.
+        if unicode_minus is None:
+            unicode_minus = rc['axes.unicode_minus'] and not rc['text.usetex']
+        if not strings:
+            return []
+        text = '\n'.join(strings)
+        if unicode_minus:
+            text = text.replace('-', '\N{MINUS SIGN}')
+        text = REGEX_MINUS_ZERO_LINES.sub('', text)
+        if zerotrim:
+            point = re.escape(decimal_point)
+            text = re.sub(f'(?m)^(.*?{point}.*?)0*$', r'\1', text)
+            text = re.sub(f'(?m)(?:{point})+$', '', text)
+        return text.split('\n')
+
+    @staticmethod
+    def _minus_format(string, unicode_minus=None):
         """
         Format the minus sign and avoid "negative zero," e.g. ``-0.000``.
         """
-        if rc['axes.unicode_minus'] and not rc['text.usetex']:
+        if unicode_minus is None:
+            unicode_minus = rc['axes.unicode_minus'] and not rc['text.usetex']
+        if unicode_minus:
             string = string.replace('-', '\N{MINUS SIGN}')
         if REGEX_MINUS_ZERO.match(string):
             string = string[1:]
@@ -500,29 +615,26 @@ class AutoFormatter(mticker.ScalarFormatter):
         """
         # NOTE: If input is a symmetric wraprange, the value conceptually has
         # no "sign", so trim tail and format as absolute value.
-        if not negpos or x == 0:
-            tail = ''
-        elif (
-            wraprange is not None
-            and np.isclose(-wraprange[0], wraprange[1])
-            and np.any(np.isclose(x, wraprange))
-        ):
-            x = abs(x)
-            tail = ''
-        elif x > 0:
-            tail = negpos[1]
+        # NOTE: This also accepts arrays, in which case the tail is an array.
+        if not negpos:
+            return x, np.full(np.shape(x), '', dtype=object)[()]
+        x = np.asarray(x)
+        if wraprange is not None and np.isclose(-wraprange[0], wraprange[1]):
+            edge = np.isclose(x[..., None], wraprange).any(axis=-1)
         else:
-            x *= -1
-            tail = negpos[0]
-        return x, tail
+            edge = np.zeros(x.shape, dtype=bool)
+        neg = ~edge & (x < 0)
+        tail = np.where(edge | (x == 0), '', np.where(neg, negpos[0], negpos[1]))
+        x = np.where(edge | neg, np.abs(x), x)
+        return x[()], tail.astype(object)[()]
 
     @staticmethod
     def _outside_tick_range(x, tickrange):
         """
         Return whether point is outside tick range up to some precision.
         """
-        eps = abs(x) / 1000
-        return (x + eps) < tickrange[0] or (x - eps) > tickrange[1]
+        eps = np.abs(x) / 1000
+        return (x + eps < tickrange[0]) | (x - eps > tickrange[1])
 
     @staticmethod
     def _trim_trailing_zeros(string, decimal_point='.'):
@@ -622,7 +734,7 @@ class IndexFormatter(mticker.Formatter):
             return self.labels[i]
 
 
-class SciFormatter(mticker.Formatter):
+class SciFormatter(_CachedFormatter, mticker.Formatter):
     """
     Format numbers with scientific notation.
     """
@@ -643,34 +755,45 @@ class SciFormatter(mticker.Formatter):
         """
         %(ticker.call)s
         """
-        # Get string
-        decimal_point = AutoFormatter._get_default_decimal_point()
-        string = ('{:.%de}' % self._precision).format(x)
-        parts = string.split('e')
+        return self._format_ticks((x,))[0]
 
-        # Trim trailing zeros
-        significand = parts[0].rstrip(decimal_point)
-        if self._zerotrim:
-            significand = AutoFormatter._trim_trailing_zeros(significand, decimal_point)
-
-        # Get sign and exponent
-        sign = parts[1][0].replace('+', '')
-        exponent = parts[1][1:].lstrip('0')
-        if exponent:
-            exponent = f'10^{{{sign}{exponent}}}'
-        if significand and exponent:
-            string = rf'{significand}{{\times}}{exponent}'
-        else:
-            string = rf'{significand}{exponent}'
+    def _get_cache_settings(self):
+        return (self._precision, self._zerotrim)
 
-        # Ensure unicode minus sign
-        string = AutoFormatter._minus_format(string)
+    def _format_ticks(self, values):
+        strings = []
+        decimal_point = AutoFormatter._get_default_decimal_point()
+        unicode_minus = rc['axes.unicode_minus'] and not rc['text.usetex']
+        for x in values:
+            # Get string
+            string = ('{:.%de}' % self._precision).format(x)
+            parts = string.split('e')
+
+            # Trim trailing zeros
+            significand = parts[0].rstrip(decimal_point)
+            if self._zerotrim:
+                significand = AutoFormatter._trim_trailing_zeros(
+                    significand, decimal_point
+                )
+
+            # Get sign and exponent
+            sign = parts[1][0].replace('+', '')
+            exponent = parts[1][1:].lstrip('0')
+            if exponent:
+                exponent = f'10^{{{sign}{exponent}}}'
+            if significand and exponent:
+                string = rf'{significand}{{\times}}{exponent}'
+            else:
+                string = rf'{significand}{exponent}'
 
-        # Return TeX string
-        return f'${string}$'
+            strings.append(string)
 
+        # Ensure unicode minus sign and return TeX strings
+        strings = AutoFormatter._format_strings(strings, unicode_minus=unicode_minus)
+        return [f'${string}$' for string in strings]
 
-class SigFigFormatter(mticker.Formatter):
+
+class SigFigFormatter(_CachedFormatter, mticker.Formatter):
     """
     Format numbers by retaining the specified number of significant digits.
     """
@@ -695,22 +818,37 @@ class SigFigFormatter(mticker.Formatter):
         """
         %(ticker.call)s
         """
-        # Limit to significant figures
-        digits = AutoFormatter._decimal_place(x) + self._sigfig - 1
-        scale = self._base * 10 ** -digits
-        x = scale * round(x / scale)
+        return self._format_ticks((x,))[0]
 
-        # Create the string
+    def _get_cache_settings(self):
+        return (self._sigfig, self._zerotrim, self._base)
+
+    def _format_ticks(self, values):
+        # Limit to significant figures
+        # NOTE: Here the digits and rounding are computed for all values at once
+        xs = np.asarray(values, dtype=float)
+        with np.errstate(divide='ignore'):
+            digits = -np.floor(np.log10(np.abs(xs)))
+        digits = np.where(xs == 0, 0, digits).astype(int) + self._sigfig - 1
+        scales = self._base * 10.0 ** -digits
+        xs = scales * np.round(xs / scales)
+
+        # Create the strings
+        strings = []
         decimal_point = AutoFormatter._get_default_decimal_point()
-        precision = max(0, digits) + max(0, AutoFormatter._decimal_place(self._base))
-        string = ('{:.%df}' % precision).format(x)
-        string = string.replace('.', decimal_point)
+        unicode_minus = rc['axes.unicode_minus'] and not rc['text.usetex']
+        offset = max(0, AutoFormatter._decimal_place(self._base))
+        for x, digit in zip(xs.tolist(), digits.tolist()):
+            precision = max(0, digit) + offset
+            string = ('{:.%df}' % precision).format(x)
+            string = string.replace('.', decimal_point)
+            strings.append(string)
 
-        # Custom string formatting
-        string = AutoFormatter._minus_format(string)
-        if self._zerotrim:
-            string = AutoFormatter._trim_trailing_zeros(string, decimal_point)
-        return string
+        # Custom string formatting applied to all strings at once
+        return AutoFormatter._format_strings(
+            strings, unicode_minus=unicode_minus,
+            zerotrim=self._zerotrim, decimal_point=decimal_point,
+        )
 
 
 class FracFormatter(mticker.Formatter):
@@ -759,6 +897,29 @@ class FracFormatter(mticker.Formatter):
         return string
 
 
+def _load_cartopy():
+    """
+    Import cartopy and create the cartopy formatter subclasses.
+    """
+    # NOTE: Cartopy is slow to import so it is imported when cartopy formatters or
+    # projections are first requested (see constructor._load_cartopy). Until then
+    # the formatters below are defined with matplotlib base classes, and creating
+    # them returns instances of the subclasses with cartopy base classes.
+    global ccrs
+    if ccrs is not None:
+        return
+    import cartopy.mpl.ticker as cticker
+    for cls, base in (
+        (DegreeFormatter, cticker._PlateCarreeFormatter),
+        (LongitudeFormatter, cticker.LongitudeFormatter),
+        (LatitudeFormatter, cticker.LatitudeFormatter),
+    ):
+        _CARTOPY_FORMATTERS[cls] = type(
+            cls.__name__, (cls, base), {'__module__': __name__, '__doc__': cls.__doc__}
+        )
+    import cartopy.crs as ccrs
+
+
 class _CartopyFormatter(object):
     """
     Mixin class for cartopy formatters.
@@ -767,9 +928,9 @@ class _CartopyFormatter(object):
     # input values from map projection coordinates to Plate Carrée coordinates.
     # After 0.18 you can avoid this behavior by not setting axis but really
     # dislike that inconsistency. Solution is temporarily assign PlateCarre().
-    def __init__(self, *args, **kwargs):
-        import cartopy  # noqa: F401 (ensure available)
-        super().__init__(*args, **kwargs)
+    def __new__(cls, *args, **kwargs):  # noqa: U100
+        _load_cartopy()  # ensure available
+        return super().__new__(_CARTOPY_FORMATTERS.get(cls, cls))
 
     def __call__(self, value, pos=None):
         ctx = context._empty_context()
@@ -779,7 +940,7 @@ class _CartopyFormatter(object):
             return super().__call__(value, pos)
 
 
-class DegreeFormatter(_CartopyFormatter, _PlateCarreeFormatter):
+class DegreeFormatter(_CartopyFormatter, mticker.Formatter):
     """
     Formatter for longitude and latitude gridline labels. Adapted from cartopy.
     """
@@ -797,7 +958,7 @@ class DegreeFormatter(_CartopyFormatter, _PlateCarreeFormatter):
         return ''
 
 
-class LongitudeFormatter(_CartopyFormatter, LongitudeFormatter):
+class LongitudeFormatter(_CartopyFormatter, mticker.Formatter):
     """
     Format longitude gridline labels. Adapted from
     `cartopy.mpl.ticker.LongitudeFormatter`.
@@ -810,7 +971,7 @@ class LongitudeFormatter(_CartopyFormatter, LongitudeFormatter):
         super().__init__(*args, **kwargs)
 
 
-class LatitudeFormatter(_CartopyFormatter, LatitudeFormatter):
+class LatitudeFormatter(_CartopyFormatter, mticker.Formatter):
     """
     Format latitude gridline labels. Adapted from
     `cartopy.mpl.ticker.LatitudeFormatter`.
@@ -2,11 +2,17 @@
 """
 The starting point for creating proplot figures.
 """
-import matplotlib.pyplot as plt
+import os
+import sys
+import time
+import traceback
+import warnings
+from concurrent import futures
 
 from . import axes as paxes
 from . import figure as pfigure
 from . import gridspec as pgridspec
+from .config import rc_matplotlib, rc_proplot
 from .internals import ic  # noqa: F401
 from .internals import _not_none, _pop_params, _pop_props, _pop_rc, docstring
 
@@ -20,8 +26,12 @@ __all__ = [
     'ion',
     'ioff',
     'isinteractive',
+    'render_batch',
 ]
 
+# Settings that are not copied to render_batch() worker processes
+RENDER_SKIP = ('backend', 'backend_fallback', 'interactive')
+
 
 # Docstrings
 _pyplot_docstring = """
@@ -30,6 +40,16 @@ This is included so you don't have to import `~matplotlib.pyplot`.
 docstring._snippet_manager['ui.pyplot'] = _pyplot_docstring
 
 
+def _get_pyplot():
+    """
+    Return the `matplotlib.pyplot` module.
+    """
+    # NOTE: Pyplot is imported on first use rather than when proplot is imported
+    # since it selects and imports the default backend, which can be slow.
+    import matplotlib.pyplot as plt
+    return plt
+
+
 def _parse_figsize(kwargs):
     """
     Translate `figsize` into proplot-specific `figwidth` and `figheight` keys.
@@ -58,7 +78,7 @@ def show(*args, **kwargs):
     *args, **kwargs
         Passed to `matplotlib.pyplot.show`.
     """
-    return plt.show(*args, **kwargs)
+    return _get_pyplot().show(*args, **kwargs)
 
 
 @docstring._snippet_manager
@@ -72,7 +92,7 @@ def close(*args, **kwargs):
     *args, **kwargs
         Passed to `matplotlib.pyplot.close`.
     """
-    return plt.close(*args, **kwargs)
+    return _get_pyplot().close(*args, **kwargs)
 
 
 @docstring._snippet_manager
@@ -86,7 +106,7 @@ def switch_backend(*args, **kwargs):
     *args, **kwargs
         Passed to `matplotlib.pyplot.switch_backend`.
     """
-    return plt.switch_backend(*args, **kwargs)
+    return _get_pyplot().switch_backend(*args, **kwargs)
 
 
 @docstring._snippet_manager
@@ -95,7 +115,7 @@ def ion():
     Call `matplotlib.pyplot.ion`.
     %(ui.pyplot)s
     """
-    return plt.ion()
+    return _get_pyplot().ion()
 
 
 @docstring._snippet_manager
@@ -104,7 +124,7 @@ def ioff():
     Call `matplotlib.pyplot.ioff`.
     %(ui.pyplot)s
     """
-    return plt.ioff()
+    return _get_pyplot().ioff()
 
 
 @docstring._snippet_manager
@@ -113,7 +133,7 @@ def isinteractive():
     Call `matplotlib.pyplot.isinteractive`.
     %(ui.pyplot)s
     """
-    return plt.isinteractive()
+    return _get_pyplot().isinteractive()
 
 
 @docstring._snippet_manager
@@ -141,7 +161,7 @@ def figure(**kwargs):
     matplotlib.figure.Figure
     """
     _parse_figsize(kwargs)
-    return plt.figure(FigureClass=pfigure.Figure, **kwargs)
+    return _get_pyplot().figure(FigureClass=pfigure.Figure, **kwargs)
 
 
 @docstring._snippet_manager
@@ -231,3 +251,130 @@ def subplots(*args, **kwargs):
     fig = figure(rc_kw=rc_kw, **kwargs)
     axs = fig.add_subplots(*args, rc_kw=rc_kw, **kwsubs)
     return fig, axs
+
+
+def _apply_render_rc(kw_proplot, kw_matplotlib):
+    """
+    Apply the `render_batch` settings from the parent process.
+    """
+    # NOTE: Settings are applied once per worker with a process pool initializer
+    # on python >= 3.7 and otherwise passed with each task. In the latter case
+    # settings unchanged since the last task are skipped so that each figure does
+    # not revalidate every setting. Importing this module already imported proplot
+    # and registered the colormaps, color cycles, colors, and fonts.
+    plt = _get_pyplot()
+    if plt.get_backend().lower() != 'agg':
+        plt.switch_backend('agg')
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # e.g. deprecated matplotlib settings
+        for rc, kw in ((rc_matplotlib, kw_matplotlib), (rc_proplot, kw_proplot)):
+            rc.update({
+                key: value for key, value in kw.items()
+                if key not in rc or dict.__getitem__(rc, key) != value
+            })
+
+
+def _run_render_worker(func, path, save_kw, rc_kw=None):
+    """
+    Create and save a single `render_batch` figure.
+    """
+    # NOTE: Errors are returned rather than raised so that the remaining
+    # figures in the batch are still rendered.
+    t = time.perf_counter()
+    fig = None
+    try:
+        if rc_kw is not None:
+            _apply_render_rc(*rc_kw)
+        fig = func()
+        if isinstance(fig, tuple):  # e.g. the result of subplots()
+            fig = fig[0]
+        fig.save(path, **save_kw)
+    except Exception:
+        error = traceback.format_exc()
+    else:
+        error = None
+    finally:
+        if fig is not None:
+            _get_pyplot().close(fig)
+    return {'path': path, 'time': time.perf_counter() - t, 'error': error}
+
+
+def render_batch(funcs, paths, *, processes=None, **kwargs):
+    """
+    Create and save many independent figures in parallel worker processes.
+
+    Parameters
+    ----------
+    funcs : sequence of callable
+        The figure-building functions. Each function is called without arguments
+        and should return a `~proplot.figure.Figure` or a tuple whose first element
+        is a figure (e.g. the result of `~proplot.ui.subplots`). Since the functions
+        are sent to worker processes, they must be picklable, e.g. module-level
+        functions or `functools.partial` objects wrapping module-level functions.
+    paths : sequence of path-like or sequence of sequences of path-like
+        The output file path(s) for each figure. Lists of paths can be used
+        to save each figure in several formats (see `~proplot.figure.Figure.save`).
+    processes : int, optional
+        The number of worker processes. Default is `os.cpu_count`. If ``0``
+        or ``1``, the figures are rendered serially in the current process.
+
+    Other parameters
+    ----------------
+    **kwargs
+        Passed to `~proplot.figure.Figure.save` (e.g. `dpi` or `formats`).
+
+    Returns
+    -------
+    list of dict
+        The results for each figure, with the output ``'path'``, the rendering
+        ``'time'`` in seconds, and the formatted traceback ``'error'`` or ``None``
+        if the figure was rendered successfully.
+
+    Note
+    ----
+    Workers are created once and are reused for successive figures. Each
+    worker uses the non-interactive ``'agg'`` backend and copies the current
+    `~proplot.config.rc` settings from the parent process. Colormaps, color
+    cycles, and fonts registered in the parent process after importing proplot
+    are not copied to workers that use the ``'spawn'`` start method.
+
+    See also
+    --------
+    proplot.figure.Figure.save
+    proplot.ui.subplots
+    """
+    funcs, paths = list(funcs), list(paths)
+    if len(funcs) != len(paths):
+        raise ValueError(
+            f'Number of figure functions ({len(funcs)}) must match '
+            f'number of paths ({len(paths)}).'
+        )
+    processes = os.cpu_count() if processes is None else processes
+    if processes <= 1:
+        return [_run_render_worker(*args, kwargs) for args in zip(funcs, paths)]
+
+    # Render figures with worker processes
+    # NOTE: If a worker process dies unexpectedly then the executor raises an
+    # error for all pending futures. This is recorded like other errors.
+    kw_proplot = {key: rc_proplot[key] for key in rc_proplot}
+    kw_matplotlib = {
+        key: value for key, value in rc_matplotlib.items() if key not in RENDER_SKIP
+    }
+    rc_kw = (kw_proplot, kw_matplotlib)
+    pool_kw = {}
+    if sys.version_info >= (3, 7):
+        pool_kw.update(initializer=_apply_render_rc, initargs=rc_kw)
+        rc_kw = None
+    results = []
+    with futures.ProcessPoolExecutor(max_workers=processes, **pool_kw) as executor:
+        jobs = [
+            executor.submit(_run_render_worker, func, path, kwargs, rc_kw)
+            for func, path in zip(funcs, paths)
+        ]
+        for job, path in zip(jobs, paths):
+            try:
+                result = job.result()
+            except Exception:
+                result = {'path': path, 'time': None, 'error': traceback.format_exc()}
+            results.append(result)
+    return results
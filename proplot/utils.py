@@ -58,8 +58,10 @@ UNIT_DICT = {
 
 # Color docstrings
 _docstring_rgba = """
-color : color-spec
-    The color. Sanitized with `to_rgba`.
+color : color-spec or list of color-spec
+    The color. Sanitized with `to_rgba`. Can also be a list of colors or
+    an ``(N, 3)`` or ``(N, 4)`` array of channel values, in which case the
+    colors are converted all at once and an array of results is returned.
 """
 _docstring_to_rgb = """
 color : color-spec
@@ -71,6 +73,10 @@ color : color-spec
     If `space` is ``'rgb'``, this is a tuple of RGB values, and any
     channels are larger than ``2``, the channels are assumed to be
     on the ``0`` to ``255`` scale and are divided by ``255``.
+
+    Can also be a list of colors or an ``(N, 3)`` or ``(N, 4)`` array
+    of channel values, in which case the colors are converted all at
+    once and an array of results is returned.
 space : {'rgb', 'hsv', 'hcl', 'hpl', 'hsl'}, optional
     The colorspace for the input channel values. Ignored unless `color`
     is a tuple of numbers.
@@ -276,14 +282,85 @@ def get_colors(*args, **kwargs):
     """
     from .constructor import Cycle  # delayed to avoid cyclic imports
     cycle = Cycle(*args, **kwargs)
-    colors = [to_hex(dict_['color']) for dict_ in cycle]
-    return colors
+    colors = cycle.by_key().get('color', [])  # convert all at once
+    return to_hex(colors).tolist() if colors else []
+
+
+def _is_color_array(color):
+    """
+    Return whether the input is a list or array of colors.
+    """
+    # NOTE: Tuples of channel values, (colormap, coordinate) tuples, and
+    # (color, alpha) tuples are single colors because they contain scalars.
+    if isinstance(color, str) or not np.iterable(color):
+        return False
+    if isinstance(color, np.ndarray):
+        return color.ndim == 2
+    return len(color) > 0 and all(
+        isinstance(item, str) or np.iterable(item) for item in color
+    )
+
+
+def _to_rgba_array(color, space='rgb', cycle=None, clip=True):
+    """
+    Translate a list or array of colors to an array of RGBA values.
+    """
+    # NOTE: Lists containing color strings and (colormap, coordinate) tuples are
+    # translated one-by-one. Arrays of channel values are translated all at once.
+    try:
+        array = np.asarray(color, dtype=float)
+    except (TypeError, ValueError):
+        array = None
+    if array is None or array.ndim != 2:
+        rgba = [to_rgba(item, space=space, cycle=cycle, clip=clip) for item in color]
+        return np.array(rgba, dtype=float)
+    if array.shape[1] not in (3, 4):
+        raise ValueError(f'Invalid color array with shape {array.shape}.')
+    if array.shape[1] == 4:
+        array, opacity = array[:, :3], array[:, 3]
+    else:
+        opacity = np.ones(array.shape[0])
+    if space == 'rgb':
+        scale = np.any(array > 2, axis=1)  # scale to within 0-1
+        array = np.where(scale[:, None], array / 255, array)
+    elif space == 'hsv':
+        array = hsluv.hsl_to_rgb_array(array)
+    elif space == 'hcl':
+        array = hsluv.hcl_to_rgb_array(array)
+    elif space == 'hsl':
+        array = hsluv.hsluv_to_rgb_array(array)
+    elif space == 'hpl':
+        array = hsluv.hpluv_to_rgb_array(array)
+    else:
+        raise ValueError(f'Invalid colorspace {space!r}.')
+    if clip:
+        array = np.clip(array, 0, 1)
+    return np.column_stack((array, opacity))
+
+
+def _to_hex_array(rgba, keep_alpha=True):
+    """
+    Translate an array of RGBA values to an array of HEX strings.
+    """
+    # NOTE: This matches matplotlib.colors.to_hex, which rounds each channel.
+    rgba = np.round(np.asarray(rgba) * 255).astype(int)
+    if not keep_alpha:
+        rgba = rgba[:, :3]
+    fmt = '#' + '%02x' * rgba.shape[1]
+    return np.array([fmt % tuple(values) for values in rgba.tolist()])
 
 
 def _transform_color(func, color, space):
     """
     Standardize input for color transformation functions.
     """
+    # NOTE: For arrays of colors the function is passed an array with
+    # channels along the first dimension so the same functions work.
+    if _is_color_array(color):
+        rgba = to_rgba(color)
+        channels = to_xyz(rgba, space=space).T.copy()
+        channels = func(channels)  # apply transform
+        return to_hex(np.column_stack((*channels, rgba[:, 3])), space=space)
     *color, opacity = to_rgba(color)
     color = to_xyz(color, space=space)
     color = func(list(color))  # apply transform
@@ -510,8 +587,12 @@ def set_alpha(color, alpha):
     scale_saturation
     scale_luminance
     """
-    color = list(to_rgba(color))
-    color[3] = alpha
+    if _is_color_array(color):
+        color = to_rgba(color)
+        color[:, 3] = alpha
+    else:
+        color = list(to_rgba(color))
+        color[3] = alpha
     return to_hex(color)
 
 
@@ -571,6 +652,8 @@ def to_hex(color, space='rgb', cycle=None, keep_alpha=True):
     to_xyza
     """
     rgba = to_rgba(color, space=space, cycle=cycle)
+    if _is_color_array(color):
+        return _to_hex_array(rgba, keep_alpha=keep_alpha)
     return mcolors.to_hex(rgba, keep_alpha=keep_alpha)
 
 
@@ -596,6 +679,8 @@ def to_rgb(color, space='rgb', cycle=None):
     to_xyz
     to_xyza
     """
+    if _is_color_array(color):
+        return to_rgba(color, space=space, cycle=cycle)[:, :3]
     return to_rgba(color, space=space, cycle=cycle)[:3]
 
 
@@ -621,6 +706,10 @@ def to_rgba(color, space='rgb', cycle=None, clip=True):
     to_xyz
     to_xyza
     """
+    # Translate lists and arrays of colors
+    if _is_color_array(color):
+        return _to_rgba_array(color, space=space, cycle=cycle, clip=clip)
+
     # Translate color cycle strings
     if isinstance(color, str) and re.match(r'\AC[0-9]\Z', color):
         color = _translate_cycle_color(color, cycle=cycle)
@@ -692,6 +781,8 @@ def to_xyz(color, space='hcl'):
     to_rgba
     to_xyza
     """
+    if _is_color_array(color):
+        return to_xyza(color, space)[:, :3]
     return to_xyza(color, space)[:3]
 
 
@@ -719,6 +810,24 @@ def to_xyza(color, space='hcl'):
     to_rgba
     to_xyz
     """
+    # Run array conversions
+    if _is_color_array(color):
+        rgba = to_rgba(color)
+        array = rgba[:, :3]
+        if space == 'rgb':
+            pass
+        elif space == 'hsv':
+            array = hsluv.rgb_to_hsl_array(array)
+        elif space == 'hcl':
+            array = hsluv.rgb_to_hcl_array(array)
+        elif space == 'hsl':
+            array = hsluv.rgb_to_hsluv_array(array)
+        elif space == 'hpl':
+            array = hsluv.rgb_to_hpluv_array(array)
+        else:
+            raise ValueError(f'Invalid colorspace {space}.')
+        return np.column_stack((array, rgba[:, 3]))
+
     # Run tuple conversions
     # NOTE: Don't pass color tuple, because we may want to permit
     # out-of-bounds RGB values to invert conversion
@@ -757,6 +866,45 @@ def _fontsize_to_pt(size):
         )
 
 
+@functools.lru_cache(maxsize=64)
+def _get_unit_dict(fontsize_small, fontsize_large, fontsize_base, dpi_fig, dpi_save):
+    """
+    Return the scales for converting physical and display units to inches.
+    """
+    # NOTE: The base font size is passed so that relative font sizes like
+    # 'large' and 'em' units reset the cache when rc['font.size'] changes.
+    # WARNING: In ipython shell the dpi settings take the value 'figure'
+    del fontsize_base
+    fontsize_small = _fontsize_to_pt(fontsize_small)
+    fontsize_large = _fontsize_to_pt(fontsize_large)
+    unit_dict = UNIT_DICT.copy()
+    unit_dict.update(
+        {
+            'em': fontsize_small / 72.0,
+            'en': 0.5 * fontsize_small / 72.0,
+            'Em': fontsize_large / 72.0,
+            'En': 0.5 * fontsize_large / 72.0,
+        }
+    )
+    if not isinstance(dpi_fig, str):
+        unit_dict['px'] = 1 / dpi_fig  # once generated by backend
+    if not isinstance(dpi_save, str):
+        unit_dict['pp'] = 1 / dpi_save  # once 'printed' i.e. saved
+    return unit_dict
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_unit_string(value):
+    """
+    Return the magnitude and units of a size specifier string.
+    """
+    regex = UNIT_REGEX.match(value)
+    if not regex:
+        raise ValueError(f'Invalid unit size spec {value!r}.')
+    number, units = regex.groups()  # second group is exponential
+    return float(number), units
+
+
 @warnings._rename_kwargs('0.6.0', units='dest')
 def units(
     value, numeric=None, dest=None, *, fontsize=None, figure=None, axes=None, width=None
@@ -821,52 +969,51 @@ def units(
         Whether to use the width or height for the axes and figure
         relative coordinates.
     """
-    # Scales for converting physical units to inches
-    fontsize_small = _not_none(fontsize, rc_matplotlib['font.size'])  # always absolute
-    fontsize_small = _fontsize_to_pt(fontsize_small)
-    fontsize_large = _not_none(fontsize, rc_matplotlib['axes.titlesize'])
-    fontsize_large = _fontsize_to_pt(fontsize_large)
-    unit_dict = UNIT_DICT.copy()
-    unit_dict.update(
-        {
-            'em': fontsize_small / 72.0,
-            'en': 0.5 * fontsize_small / 72.0,
-            'Em': fontsize_large / 72.0,
-            'En': 0.5 * fontsize_large / 72.0,
-        }
+    # Scales for converting physical and display units to inches
+    # NOTE: These are cached for the current font size and dpi settings. The
+    # dictionary is only copied if axes or figure relative units are needed.
+    fontsize_base = rc_matplotlib['font.size']
+    unit_dict = _get_unit_dict(
+        _not_none(fontsize, fontsize_base),  # always absolute
+        _not_none(fontsize, rc_matplotlib['axes.titlesize']),
+        fontsize_base,
+        rc_matplotlib['figure.dpi'],
+        rc_matplotlib['savefig.dpi'],
     )
 
-    # Scales for converting display units to inches
-    # WARNING: In ipython shell these take the value 'figure'
-    if not isinstance(rc_matplotlib['figure.dpi'], str):
-        unit_dict['px'] = 1 / rc_matplotlib['figure.dpi']  # once generated by backend
-    if not isinstance(rc_matplotlib['savefig.dpi'], str):
-        unit_dict['pp'] = 1 / rc_matplotlib['savefig.dpi']  # once 'printed' i.e. saved
-
     # Scales relative to axes and figure objects
-    if axes is not None and hasattr(axes, '_get_size_inches'):  # proplot axes
-        unit_dict['ax'] = axes._get_size_inches()[1 - int(width)]
     if figure is None:
         figure = getattr(axes, 'figure', None)
+    if axes is not None or figure is not None:
+        unit_dict = unit_dict.copy()
+    if axes is not None and hasattr(axes, '_get_size_inches'):  # proplot axes
+        unit_dict['ax'] = axes._get_size_inches()[1 - int(width)]
     if figure is not None and hasattr(figure, 'get_size_inches'):
         unit_dict['fig'] = figure.get_size_inches()[1 - int(width)]
 
     # Scale for converting inches to arbitrary other unit
+    # NOTE: The list of valid units is only built when the error is raised.
     if numeric is None and dest is None:
         numeric = dest = 'in'
     elif numeric is None:
         numeric = dest
     elif dest is None:
         dest = numeric
-    options = 'Valid units are ' + ', '.join(map(repr, unit_dict)) + '.'
+    def options():  # noqa: E301, E306
+        return 'Valid units are ' + ', '.join(map(repr, unit_dict)) + '.'
     try:
         nscale = unit_dict[numeric]
     except KeyError:
-        raise ValueError(f'Invalid numeric units {numeric!r}. ' + options)
+        raise ValueError(f'Invalid numeric units {numeric!r}. ' + options())
     try:
         dscale = unit_dict[dest]
     except KeyError:
-        raise ValueError(f'Invalid destination units {dest!r}. ' + options)
+        raise ValueError(f'Invalid destination units {dest!r}. ' + options())
+
+    # Convert numeric arrays all at once
+    # NOTE: Return a list of floats or a float to match the output for other input.
+    if isinstance(value, np.ndarray) and value.ndim <= 1 and value.dtype.kind in 'iuf':
+        return (value.astype(float) * nscale / dscale).tolist()
 
     # Convert units for each value in list
     result = []
@@ -880,11 +1027,7 @@ def units(
         if isinstance(val, Real):
             number, units = val, None
         elif isinstance(val, str):
-            regex = UNIT_REGEX.match(val)
-            if regex:
-                number, units = regex.groups()  # second group is exponential
-            else:
-                raise ValueError(f'Invalid unit size spec {val!r}.')
+            number, units = _parse_unit_string(val)
         else:
             raise ValueError(f'Invalid unit size spec {val!r}.')
         # Convert with units
@@ -893,7 +1036,7 @@ def units(
         elif units in unit_dict:
             result.append(float(number) * unit_dict[units] / dscale)
         else:
-            raise ValueError(f'Invalid input units {units!r}. ' + options)
+            raise ValueError(f'Invalid input units {units!r}. ' + options())
     return result[0] if singleton else result
 
 